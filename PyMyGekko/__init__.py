@@ -2,9 +2,18 @@
 #
 # SPDX-License-Identifier: MIT
 import logging
+from collections.abc import Callable
+from concurrent.futures import Executor
 from typing import Union
 
 from aiohttp import ClientSession
+from PyMyGekko.change_stream import ChangeStream
+from PyMyGekko.change_stream import OverflowPolicy
+from PyMyGekko.json_backend import JsonLoads
+from PyMyGekko.poller import Poller
+from PyMyGekko.rate_limiter import TokenBucketRateLimiter
+from PyMyGekko.resources import ChangeListener
+from PyMyGekko.resources import Entity
 from PyMyGekko.resources.AccessDoors import AccessDoor
 from PyMyGekko.resources.AccessDoors import AccessDoorValueAccessor
 from PyMyGekko.resources.Actions import Action
@@ -31,13 +40,34 @@ from PyMyGekko.resources.RoomTemps import RoomTemp
 from PyMyGekko.resources.RoomTemps import RoomTempsValueAccessor
 from PyMyGekko.resources.Vents import Vent
 from PyMyGekko.resources.Vents import VentValueAccessor
+from PyMyGekko.retry import RetryPolicy
 from yarl import URL
 
 from .data_provider import DataProvider
 from .data_provider import DummyDataProvider
+from .data_provider import StateSnapshot
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# The categories of the MyGekko API, "globals" contains the meteo data
+CATEGORIES = frozenset(
+    {
+        "accessdoors",
+        "actions",
+        "alarms_logics",
+        "blinds",
+        "cams",
+        "door_intercom",
+        "energycosts",
+        "globals",
+        "hotwater_systems",
+        "lights",
+        "loads",
+        "roomtemps",
+        "vents",
+    }
+)
+
 
 class MyGekkoApiClientBase:
     """The base class for the MyGekko api client"""
@@ -50,42 +80,104 @@ class MyGekkoApiClientBase:
         scheme: str = "https",
         host: str = "live.my-gekko.com",
         port: Union[int, None] = None,
+        concurrent_read: bool = False,
+        resources_refresh_interval: float | None = None,
+        categories: set[str] | None = None,
+        optimistic_updates: bool = False,
+        write_debounce: float | None = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        json_loads: JsonLoads | None = None,
+        executor: Executor | None = None,
     ) -> None:
+        if categories is not None:
+            unknown_categories = set(categories) - CATEGORIES
+            if unknown_categories:
+                raise ValueError(f"Unknown categories {unknown_categories}")
+            categories = frozenset(categories)
+
         self._url = URL.build(scheme=scheme, host=host, port=port)
         self._authentication_params = authentication_params
         self._session = session
         self._demo_mode = demo_mode
+        self._concurrent_read = concurrent_read
+        self._resources_refresh_interval = resources_refresh_interval
+        self._categories = categories
+        self._optimistic_updates = optimistic_updates
+        self._write_debounce = write_debounce
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._json_loads = json_loads
+        self._executor = executor
+        self._change_streams: list[ChangeStream] = []
 
         _LOGGER.debug(
             "Initializing MyGekkoApiClientBase demo_mode: %s", self._demo_mode
         )
 
         if self._demo_mode:
-            self._data_provider = DummyDataProvider()
+            self._data_provider = DummyDataProvider(
+                optimistic_updates=self._optimistic_updates
+            )
         else:
             self._data_provider = DataProvider(
-                self._url, self._authentication_params, self._session
+                self._url,
+                self._authentication_params,
+                self._session,
+                concurrent_read=self._concurrent_read,
+                resources_refresh_interval=self._resources_refresh_interval,
+                categories=self._categories,
+                optimistic_updates=self._optimistic_updates,
+                write_debounce=self._write_debounce,
+                rate_limiter=self._rate_limiter,
+                retry_policy=self._retry_policy,
+                json_loads=self._json_loads,
+                executor=self._executor,
             )
 
-        self._access_doors_value_accessor = AccessDoorValueAccessor(self._data_provider)
-        self._actions_value_accessor = ActionValueAccessor(self._data_provider)
-        self._alarm_logics_value_accessor = AlarmsLogicValueAccessor(
-            self._data_provider
+        self._access_doors_value_accessor = self._create_value_accessor(
+            "accessdoors", AccessDoorValueAccessor
+        )
+        self._actions_value_accessor = self._create_value_accessor(
+            "actions", ActionValueAccessor
+        )
+        self._alarm_logics_value_accessor = self._create_value_accessor(
+            "alarms_logics", AlarmsLogicValueAccessor
+        )
+        self._blind_value_accessor = self._create_value_accessor(
+            "blinds", BlindValueAccessor
+        )
+        self._cam_value_accessor = self._create_value_accessor("cams", CamValueAccessor)
+        self._door_inter_com_value_accessor = self._create_value_accessor(
+            "door_intercom", DoorInterComValueAccessor
+        )
+        self._energy_costs_value_accessor = self._create_value_accessor(
+            "energycosts", EnergyCostValueAccessor
+        )
+        self._hot_water_systems_value_accessor = self._create_value_accessor(
+            "hotwater_systems", HotWaterSystemValueAccessor
+        )
+        self._meteo_value_accessor = self._create_value_accessor(
+            "globals", MeteoValueAccessor
         )
-        self._blind_value_accessor = BlindValueAccessor(self._data_provider)
-        self._cam_value_accessor = CamValueAccessor(self._data_provider)
-        self._door_inter_com_value_accessor = DoorInterComValueAccessor(
-            self._data_provider
+        self._light_value_accessor = self._create_value_accessor(
+            "lights", LightValueAccessor
         )
-        self._energy_costs_value_accessor = EnergyCostValueAccessor(self._data_provider)
-        self._hot_water_systems_value_accessor = HotWaterSystemValueAccessor(
-            self._data_provider
+        self._loads_value_accessor = self._create_value_accessor(
+            "loads", LoadValueAccessor
+        )
+        self._room_temps_value_accessor = self._create_value_accessor(
+            "roomtemps", RoomTempsValueAccessor
+        )
+        self._vents_value_accessor = self._create_value_accessor(
+            "vents", VentValueAccessor
         )
-        self._meteo_value_accessor = MeteoValueAccessor(self._data_provider)
-        self._light_value_accessor = LightValueAccessor(self._data_provider)
-        self._loads_value_accessor = LoadValueAccessor(self._data_provider)
-        self._room_temps_value_accessor = RoomTempsValueAccessor(self._data_provider)
-        self._vents_value_accessor = VentValueAccessor(self._data_provider)
+
+    def _create_value_accessor(self, category: str, value_accessor_class):
+        """Creates the value accessor of the given category if the category is enabled"""
+        if self._categories is not None and category not in self._categories:
+            return None
+        return value_accessor_class(self._data_provider)
 
     async def try_connect(self) -> None:
         """Tries to connect to the MyGekko API using the given credentials"""
@@ -93,19 +185,144 @@ class MyGekkoApiClientBase:
 
     async def read_data(self) -> None:
         """Reads the status and resources data via the MyGekko API"""
+        await self._wait_for_change_streams()
         await self._data_provider.read_data()
 
+    async def read_status(self) -> None:
+        """Reads only the status data via the MyGekko API.
+
+        The resources are read as well if they were not read yet or are older
+        than the configured resources_refresh_interval.
+        """
+        await self._wait_for_change_streams()
+        await self._data_provider.read_status()
+
+    async def refresh(self, resources: bool = True) -> None:
+        """Refreshes the data, with resources=False only the status is polled"""
+        if resources:
+            await self.read_data()
+        else:
+            await self.read_status()
+
+    async def refresh_entity(self, entity: Entity) -> None:
+        """Reads only the status of the given entity via the MyGekko API"""
+        await self._wait_for_change_streams()
+        await entity.refresh()
+
+    async def wait_for_version(self, version: int) -> StateSnapshot:
+        """Waits until the data with at least the given version is read.
+
+        Returns the snapshot of the data, e.g. wait_for_version(get_version() + 1)
+        waits for the next read changing the data.
+        """
+        return await self._data_provider.wait_for_version(version)
+
+    def on_change(self, category: str, callback: ChangeListener) -> Callable[[], None]:
+        """Adds a listener called when values of entities of the given category change.
+
+        Returns a function removing the listener again.
+        """
+        if category not in CATEGORIES:
+            raise ValueError(f"Unknown category {category}")
+        return self._data_provider.add_change_listener(category, callback)
+
+    def changes(
+        self,
+        categories: list[str] | None = None,
+        max_size: int = 1000,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> ChangeStream:
+        """Returns a stream of the value changes of the following reads.
+
+        async with api.changes() as changes:
+            async for change in changes:
+                ...
+        """
+        if categories is not None:
+            unknown_categories = set(categories) - CATEGORIES
+            if unknown_categories:
+                raise ValueError(f"Unknown categories {unknown_categories}")
+
+        stream = ChangeStream(max_size, overflow)
+        for category in categories if categories is not None else [None]:
+            stream.on_close(
+                self._data_provider.add_change_listener(category, stream.put_change)
+            )
+        self._change_streams.append(stream)
+        stream.on_close(lambda: self._change_streams.remove(stream))
+        return stream
+
+    def start_polling(
+        self,
+        interval: float = 10.0,
+        fast_interval: float = 2.0,
+        fast_window: float = 30.0,
+        idle_interval: float = 60.0,
+        idle_after: float = 600.0,
+        max_backoff: float = 300.0,
+    ) -> Poller:
+        """Returns a poller reading the status in the background.
+
+        async with api.start_polling(interval=10) as poller:
+            ...
+
+        Writes and read changes switch to the fast interval for fast_window seconds,
+        see Poller for details.
+        """
+        poller = Poller(
+            self.read_status,
+            self.get_changed_items,
+            interval=interval,
+            fast_interval=fast_interval,
+            fast_window=fast_window,
+            idle_interval=idle_interval,
+            idle_after=idle_after,
+            max_backoff=max_backoff,
+        )
+        poller.on_stop(self._data_provider.add_write_listener(poller.notify_activity))
+        return poller
+
+    async def _wait_for_change_streams(self) -> None:
+        """Waits until the blocking change streams have space for another read"""
+        for stream in list(self._change_streams):
+            if stream.overflow == OverflowPolicy.BLOCK:
+                await stream.wait_for_space()
+
+    def get_read_timings(self) -> dict[str, float]:
+        """Returns the wall times in seconds of the requests of the last read"""
+        return self._data_provider.read_timings
+
+    def get_skipped_updates(self) -> int:
+        """Returns the number of reads skipped since none of the read data changed"""
+        return self._data_provider.skipped_updates
+
+    def get_changed_items(self) -> int:
+        """Returns the number of items whose status changed with the last read"""
+        return self._data_provider.changed_items
+
+    def get_version(self) -> int:
+        """Returns the version of the read data, it increases with every change"""
+        return self._data_provider.version
+
+    def get_snapshot(self) -> StateSnapshot:
+        """Returns the resources and status of the last read as one snapshot"""
+        return self._data_provider.snapshot
+
+    def get_request_queue_depth(self) -> int:
+        """Returns the number of requests waiting for the rate limiter"""
+        return self._data_provider.request_queue_depth
+
     def get_globals_network(self):
         """Returns the globals network information"""
-        if self._data_provider.status is None:
+        status = self._data_provider.status
+        if status is None:
             return None
 
+        # only the globals of the status are read, the other categories stay as is
         result = {}
-        if (
-            self._data_provider.status["globals"]
-            and self._data_provider.status["globals"]["network"]
-        ):
-            network_data = self._data_provider.status["globals"]["network"]
+        globals_data = status["globals"]
+        if globals_data and globals_data["network"]:
+            network_data = globals_data["network"]
             for key in network_data:
                 result[key] = network_data[key]["value"]
 
@@ -113,54 +330,80 @@ class MyGekkoApiClientBase:
 
     def get_access_doors(self) -> list[AccessDoor]:
         """Returns the MyGekko access doors"""
+        if self._access_doors_value_accessor is None:
+            return []
         return self._access_doors_value_accessor.access_doors
 
     def get_actions(self) -> list[Action]:
         """Returns the MyGekko actions"""
+        if self._actions_value_accessor is None:
+            return []
         return self._actions_value_accessor.actions
 
     def get_alarms_logics(self) -> list[AlarmsLogic]:
         """Returns the MyGekko alarms_logics"""
+        if self._alarm_logics_value_accessor is None:
+            return []
         return self._alarm_logics_value_accessor.alarms_logics
 
     def get_blinds(self) -> list[Blind]:
         """Returns the MyGekko blinds"""
+        if self._blind_value_accessor is None:
+            return []
         return self._blind_value_accessor.blinds
 
     def get_cams(self) -> list[Cam]:
         """Returns the MyGekko cams"""
+        if self._cam_value_accessor is None:
+            return []
         return self._cam_value_accessor.cams
 
     def get_door_inter_coms(self) -> list[DoorInterCom]:
         """Returns the MyGekko door inter coms"""
+        if self._door_inter_com_value_accessor is None:
+            return []
         return self._door_inter_com_value_accessor.door_inter_coms
 
     def get_energy_costs(self) -> list[EnergyCost]:
         """Returns the MyGekko energy_costs"""
+        if self._energy_costs_value_accessor is None:
+            return []
         return self._energy_costs_value_accessor.energy_costs
 
     def get_hot_water_systems(self) -> list[HotWaterSystem]:
         """Returns the MyGekko hot_water_systems"""
+        if self._hot_water_systems_value_accessor is None:
+            return []
         return self._hot_water_systems_value_accessor.hotwater_systems
 
     def get_lights(self) -> list[Light]:
         """Returns the MyGekko lights"""
+        if self._light_value_accessor is None:
+            return []
         return self._light_value_accessor.lights
 
     def get_loads(self) -> list[Load]:
         """Returns the MyGekko load"""
+        if self._loads_value_accessor is None:
+            return []
         return self._loads_value_accessor.loads
 
-    def get_meteo(self) -> Meteo:
+    def get_meteo(self) -> Meteo | None:
         """Returns the MyGekko meteo"""
+        if self._meteo_value_accessor is None:
+            return None
         return self._meteo_value_accessor.meteo
 
     def get_room_temps(self) -> list[RoomTemp]:
         """Returns the MyGekko room_temps"""
+        if self._room_temps_value_accessor is None:
+            return []
         return self._room_temps_value_accessor.room_temps
 
     def get_vents(self) -> list[Vent]:
         """Returns the MyGekko vents"""
+        if self._vents_value_accessor is None:
+            return []
         return self._vents_value_accessor.vents
 
 
@@ -173,6 +416,15 @@ class MyGekkoQueryApiClient(MyGekkoApiClientBase):
         api_key: str,
         gekko_id: str,
         session: ClientSession,
+        concurrent_read: bool = False,
+        resources_refresh_interval: float | None = None,
+        categories: set[str] | None = None,
+        optimistic_updates: bool = False,
+        write_debounce: float | None = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        json_loads: JsonLoads | None = None,
+        executor: Executor | None = None,
     ) -> None:
         super().__init__(
             authentication_params={
@@ -181,6 +433,15 @@ class MyGekkoQueryApiClient(MyGekkoApiClientBase):
                 "gekkoid": gekko_id,
             },
             session=session,
+            concurrent_read=concurrent_read,
+            resources_refresh_interval=resources_refresh_interval,
+            categories=categories,
+            optimistic_updates=optimistic_updates,
+            write_debounce=write_debounce,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            json_loads=json_loads,
+            executor=executor,
         )
 
 
@@ -193,6 +454,15 @@ class MyGekkoLocalApiClient(MyGekkoApiClientBase):
         password: str,
         session: ClientSession,
         host: str,
+        concurrent_read: bool = False,
+        resources_refresh_interval: float | None = None,
+        categories: set[str] | None = None,
+        optimistic_updates: bool = False,
+        write_debounce: float | None = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        json_loads: JsonLoads | None = None,
+        executor: Executor | None = None,
     ) -> None:
         super().__init__(
             authentication_params={
@@ -201,6 +471,15 @@ class MyGekkoLocalApiClient(MyGekkoApiClientBase):
             },
             session=session,
             host=host,
+            concurrent_read=concurrent_read,
+            resources_refresh_interval=resources_refresh_interval,
+            categories=categories,
+            optimistic_updates=optimistic_updates,
+            write_debounce=write_debounce,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            json_loads=json_loads,
+            executor=executor,
         )
 
 
@@ -209,7 +488,9 @@ class MyGekkoDemoModeClient(MyGekkoApiClientBase):
 
     def __init__(
         self,
+        optimistic_updates: bool = False,
     ) -> None:
         super().__init__(
             demo_mode=True,
+            optimistic_updates=optimistic_updates,
         )
@@ -0,0 +1,155 @@
+"""Stream of the value changes read from the MyGekko API"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+from typing import NamedTuple
+
+from .resources import EntityChange
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(Enum):
+    """What happens to the events of a stream whose queue is full"""
+
+    # the oldest queued event is dropped
+    DROP_OLDEST = "drop_oldest"
+    # queued events of the same entity value are merged, then the oldest is dropped
+    COALESCE = "coalesce"
+    # the next read waits until the consumer caught up
+    BLOCK = "block"
+
+
+class ChangeEvent(NamedTuple):
+    """Change of a single value of an entity"""
+
+    category: str
+    entity_id: str
+    field: str
+    old_value: Any
+    new_value: Any
+    timestamp: float
+
+
+class ChangeStream:
+    """Bounded queue of change events, consumed with async for.
+
+    With OverflowPolicy.BLOCK no events are dropped, instead the reads of the client
+    wait until the queue has space again. So the queue holds at most max_size events
+    plus the events of a single read.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size has to be at least 1")
+
+        self._max_size = max_size
+        self._overflow = overflow
+        self._events: OrderedDict[object, ChangeEvent] = OrderedDict()
+        self._counter = 0
+        self._dropped = 0
+        self._closed = False
+        self._available = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._on_close: list[Callable[[], None]] = []
+
+    @property
+    def overflow(self) -> OverflowPolicy:
+        """Returns the overflow policy"""
+        return self._overflow
+
+    @property
+    def dropped(self) -> int:
+        """Returns the number of events dropped since the queue was full"""
+        return self._dropped
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def on_close(self, callback: Callable[[], None]) -> None:
+        """Adds a callback called once the stream is closed"""
+        self._on_close.append(callback)
+
+    def put_change(self, change: EntityChange) -> None:
+        """Queues an event for each changed value of the given entity change"""
+        if self._closed:
+            return
+
+        timestamp = time.time()
+        for field, (old_value, new_value) in change.changes.items():
+            self._put(
+                ChangeEvent(
+                    change.category,
+                    change.entity_id,
+                    field,
+                    old_value,
+                    new_value,
+                    timestamp,
+                )
+            )
+        if self._events:
+            self._available.set()
+        if self._overflow == OverflowPolicy.BLOCK and len(self) >= self._max_size:
+            self._space.clear()
+
+    def _put(self, event: ChangeEvent) -> None:
+        if self._overflow == OverflowPolicy.COALESCE:
+            key = (event.category, event.entity_id, event.field)
+            queued = self._events.pop(key, None)
+            if queued is not None:
+                event = event._replace(old_value=queued.old_value)
+        else:
+            key = self._counter
+            self._counter += 1
+
+        self._events[key] = event
+        if self._overflow != OverflowPolicy.BLOCK and len(self) > self._max_size:
+            self._events.popitem(last=False)
+            self._dropped += 1
+            _LOGGER.debug("Change stream full, dropped the oldest event")
+
+    async def wait_for_space(self) -> None:
+        """Waits until the queue has space for the events of another read"""
+        await self._space.wait()
+
+    def close(self) -> None:
+        """Closes the stream, queued events can still be consumed"""
+        if self._closed:
+            return
+        self._closed = True
+        self._available.set()
+        self._space.set()
+        for callback in self._on_close:
+            callback()
+
+    async def __aenter__(self) -> ChangeStream:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __aiter__(self) -> ChangeStream:
+        return self
+
+    async def __anext__(self) -> ChangeEvent:
+        while not self._events:
+            if self._closed:
+                raise StopAsyncIteration
+            self._available.clear()
+            await self._available.wait()
+
+        _, event = self._events.popitem(last=False)
+        if len(self) < self._max_size:
+            self._space.set()
+        return event
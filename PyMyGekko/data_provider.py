@@ -1,17 +1,139 @@
 """Base implementation of the data provider"""
+import asyncio
+import hashlib
 import json
 import logging
 import pkgutil
+import re
+import time
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Callable
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from enum import IntEnum
+from typing import TypeVar
 
 from aiohttp import ClientSession
 from yarl import URL
 
+from .json_backend import get_json_loads
+from .json_backend import JsonLoads
+from .rate_limiter import RequestPriority
+from .rate_limiter import TokenBucketRateLimiter
+from .resources import ChangeListener
 from .resources import Entity
+from .resources import EntityChange
+from .resources import ReadOnlyEntity
+from .retry import RetryPolicy
+from .sumstate import decode_sumstates
+from .sumstate import get_decoder
+from .sumstate import get_hardware
+from .sumstate import SumstateDecoder
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# the leading letters of a value identify the command, e.g. "P" in "P50.0"
+_COMMAND_PATTERN = re.compile(r"[A-Z]*")
+
+# marks a missing value, e.g. a category that was not routed yet
+_MISSING = object()
+
+
+class StateSnapshot:
+    """Resources and status of one read, published as a whole.
+
+    The version increases with every published snapshot. The resources and status
+    are read only views, a newer read or a refreshed entity publishes a new snapshot.
+    The views of unchanged data are shared with the previous snapshot.
+    """
+
+    __slots__ = ("version", "hardware", "_resources", "_status")
+
+    def __init__(
+        self,
+        version: int,
+        resources,
+        status,
+        hardware: str,
+        previous: "StateSnapshot | None" = None,
+    ) -> None:
+        self.version = version
+        self.hardware = hardware
+        self._resources = _freeze_reusing(
+            resources, previous._resources if previous else None
+        )
+        self._status = _freeze_reusing(status, previous._status if previous else None)
+
+    @property
+    def resources(self) -> Mapping | None:
+        """Returns the read only view of the resources"""
+        return self._resources
+
+    @property
+    def status(self) -> Mapping | None:
+        """Returns the read only view of the status"""
+        return self._status
+
+    def __repr__(self) -> str:
+        return f"StateSnapshot(version={self.version}, hardware={self.hardware!r})"
+
+
+class _FrozenMapping(Mapping):
+    """Read only view of a json object.
+
+    The nested objects are wrapped one at a time when they are accessed, so reading
+    a single subtree does not copy the whole data.
+    """
+
+    __slots__ = ("_data", "_frozen")
+
+    def __init__(self, data: dict) -> None:
+        self._data = data
+        self._frozen: dict = {}
+
+    def __getitem__(self, key):
+        frozen = self._frozen.get(key, _MISSING)
+        if frozen is _MISSING:
+            # the data is never modified, so threads racing here create equal views
+            frozen = self._frozen[key] = _freeze(self._data[key])
+        return frozen
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"_FrozenMapping({self._data!r})"
+
+
+def _freeze(data):
+    """Returns a read only view of the given json data"""
+    if isinstance(data, dict):
+        return _FrozenMapping(data)
+    if isinstance(data, list):
+        return tuple(_freeze(value) for value in data)
+    return data
+
+
+def _unfrozen(view: _FrozenMapping | None):
+    """Returns the data wrapped by the given view"""
+    return None if view is None else view._data
+
+
+def _freeze_reusing(data, previous: _FrozenMapping | None) -> _FrozenMapping | None:
+    """Returns the previous view if it wraps the same data, so its views are kept"""
+    if previous is not None and previous._data is data:
+        return previous
+    return None if data is None else _FrozenMapping(data)
+
 
 class DataSubscriberInterface:
     """Interface for data subscribers"""
@@ -22,12 +144,31 @@ class DataSubscriberInterface:
     def update_resources(self, resources):
         """Method called on resources updates"""
 
+    def pop_changes(self) -> dict[str, dict[str, tuple]]:
+        """Returns the changed values per entity id since the last call"""
+        return {}
+
+    def pop_removals(self) -> dict[str, dict[str, object]]:
+        """Returns the last values per entity id of the entities removed since the last call"""
+        return {}
+
+    def notify_listeners(self, change: EntityChange) -> None:
+        """Method called with the changes of an entity once all subscribers are updated"""
+
 
 class EntityValueAccessor(DataSubscriberInterface):
     """Base class for entity values accessors"""
 
     def __init__(self):
         self._data = {}
+        self._raw_values: dict[str, tuple[str, str]] = {}
+        self._previous_values: dict[str, dict[str, str]] = {}
+        self._listeners: dict[str, list[ChangeListener]] = {}
+        self._entities: dict[str, ReadOnlyEntity] = {}
+        self._entities_outdated = True
+        self._features: dict[str, list] = {}
+        self._typed_values: dict[str, dict[tuple[str, Callable], object]] = {}
+        self._removed: dict[str, dict[str, object]] = {}
 
     def get_value(self, entity: Entity, value_name: str) -> str | None:
         """Returns a data value of this entity"""
@@ -40,60 +181,534 @@ class EntityValueAccessor(DataSubscriberInterface):
                 return self._data[entity.entity_id][value_name]
         return None
 
+    def get_typed_value(
+        self, entity: Entity, value_name: str, converter: Callable[[str], _T]
+    ) -> _T | None:
+        """Returns a data value of this entity converted with the given converter.
+
+        IntEnum converters are called with the number of the value. The converted
+        values are cached until the sumstate of the entity changes.
+        """
+        typed_values = self._typed_values.setdefault(entity.entity_id, {})
+        key = (value_name, converter)
+        if key in typed_values:
+            return typed_values[key]
+
+        value = self.get_value(entity, value_name)
+        typed_value = None
+        if value is not None:
+            if isinstance(converter, type) and issubclass(converter, IntEnum):
+                typed_value = converter(float(value))
+            else:
+                typed_value = converter(value)
+        typed_values[key] = typed_value
+        return typed_value
+
+    def get_supported_features(self, entity: Entity) -> list:
+        """Returns the supported features of the given entity.
+
+        The features are cached until a value of the entity appears or disappears.
+        """
+        features = self._features.get(entity.entity_id)
+        if features is None:
+            features = self._features[entity.entity_id] = self.get_features(entity)
+        return list(features)
+
+    def _get_entities(self, entity_class: type[ReadOnlyEntity]) -> list:
+        """Returns the entities of the read items.
+
+        The entity objects are kept, so the same object is returned for an item until
+        it is removed. The entities are only rebuilt when the resources changed.
+        """
+        if self._entities_outdated:
+            entities = {}
+            for key, data in self._data.items():
+                if "name" not in data:
+                    # the item is only known from the status until the resources
+                    # are read again
+                    continue
+                entity = self._entities.get(key)
+                if entity is None:
+                    entity = entity_class(key, data["name"], self)
+                else:
+                    entity.name = data["name"]
+                entities[key] = entity
+            self._entities = entities
+            self._entities_outdated = False
+        return list(self._entities.values())
+
+    def _invalidate_entities(self) -> None:
+        """Makes sure the entities and their features are rebuilt after a resources update"""
+        self._entities_outdated = True
+        self._features = {}
+        self._typed_values = {}
+
+    def _evict_missing(self, keys) -> None:
+        """Drops the items missing from the latest resources.
+
+        The cached state of the items is released, their listeners are removed
+        once they got the removal event.
+        """
+        for key in [key for key in self._data if key not in keys]:
+            _LOGGER.debug("Evicting %s, it is missing from the resources", key)
+            self._removed[key] = self._data.pop(key)
+            self._raw_values.pop(key, None)
+            self._previous_values.pop(key, None)
+            self._entities.pop(key, None)
+            self._features.pop(key, None)
+            self._typed_values.pop(key, None)
+
+    def add_listener(
+        self, entity: ReadOnlyEntity, callback: ChangeListener
+    ) -> Callable[[], None]:
+        """Adds a listener for the changes of the given entity"""
+        listeners = self._listeners.setdefault(entity.entity_id, [])
+        listeners.append(callback)
+        return lambda: listeners.remove(callback)
+
+    def notify_listeners(self, change: EntityChange) -> None:
+        for listener in list(self._listeners.get(change.entity_id, ())):
+            _call_listener(listener, change)
+        if change.removed:
+            self._listeners.pop(change.entity_id, None)
+
+    def pop_changes(self) -> dict[str, dict[str, tuple]]:
+        changes = {}
+        for key, previous_values in self._previous_values.items():
+            values = self._data.get(key, {})
+            changed_values = {
+                value_name: (previous_values.get(value_name), value)
+                for value_name, value in values.items()
+                if previous_values.get(value_name) != value
+            }
+            if changed_values:
+                changes[key] = changed_values
+                if any(bool(old) != bool(new) for old, new in changed_values.values()):
+                    self._features.pop(key, None)
+        self._previous_values = {}
+        return changes
+
+    def pop_removals(self) -> dict[str, dict[str, object]]:
+        removed = self._removed
+        self._removed = {}
+        return removed
+
+    def _sumstate_changed(self, key: str, value: str, hardware: str) -> bool:
+        """Returns whether the raw sumstate value of an item changed since it was last decoded
+
+        The values of a changed item are remembered to compute its changes.
+        """
+        if self._raw_values.get(key) == (value, hardware):
+            return False
+        if key not in self._entities:
+            self._entities_outdated = True
+            if "name" not in self._data.get(key, {}):
+                _LOGGER.debug("%s is missing from the resources, reading them", key)
+                self._data_provider.invalidate_resources()
+        self._raw_values[key] = (value, hardware)
+        self._typed_values.pop(key, None)
+        self._previous_values.setdefault(key, dict(self._data.get(key, {})))
+        return True
+
+    async def _write_data(
+        self, entity: Entity, value: str, optimistic_values: dict[str, str]
+    ) -> None:
+        """Sends the value of the given entity.
+
+        If optimistic updates are enabled, the given optimistic values are applied
+        right away and reverted if sending the value fails.
+        """
+        if (
+            not self._data_provider.optimistic_updates
+            or entity.entity_id not in self._data
+        ):
+            await self._data_provider.write_data(entity.resource_path, value)
+            return
+
+        data = self._data[entity.entity_id]
+        previous_values = {
+            value_name: data[value_name]
+            for value_name in optimistic_values
+            if value_name in data
+        }
+        # the next status is diffed against the confirmed values, so the change
+        # caused by the write is reported once the gekko applied it
+        self._previous_values.setdefault(entity.entity_id, dict(data))
+        data.update(optimistic_values)
+        # the next status has to be decoded to reconcile the optimistic values
+        self._raw_values.pop(entity.entity_id, None)
+        self._features.pop(entity.entity_id, None)
+        self._typed_values.pop(entity.entity_id, None)
+
+        try:
+            await self._data_provider.write_data(entity.resource_path, value)
+        except Exception:
+            for value_name, optimistic_value in optimistic_values.items():
+                # a newer value must not be overwritten by the rollback
+                if data.get(value_name) != optimistic_value:
+                    continue
+                if value_name in previous_values:
+                    data[value_name] = previous_values[value_name]
+                else:
+                    del data[value_name]
+            self._features.pop(entity.entity_id, None)
+            self._typed_values.pop(entity.entity_id, None)
+            raise
+
+    async def refresh(self, entity: Entity) -> None:
+        """Reads the status of the given entity and updates its values"""
+        status = await self._data_provider.read_entity_status(entity.resource_path)
+        if status is not None:
+            self._data_provider.update_entity_status(self, status)
+
 
 class DataProviderBase(ABC):
     """Base class for data providers"""
 
-    def __init__(self):
-        self._subscriber: list[DataSubscriberInterface] = []
+    def __init__(
+        self,
+        resources_refresh_interval: float | None = None,
+        optimistic_updates: bool = False,
+        write_debounce: float | None = None,
+    ):
+        self.optimistic_updates = optimistic_updates
+        self._write_debounce = write_debounce
+        self._pending_writes: dict[tuple[str, str], _PendingWrite] = {}
+        self._subscriber: list[tuple[DataSubscriberInterface, tuple[str, ...]]] = []
+        self._routed_resources: dict[str, object] = {}
+        self._routed_status: dict[str, object] = {}
+        self._change_listeners: dict[str, list[ChangeListener]] = {}
+        self._write_listeners: list[Callable[[], None]] = []
         self._status = None
+        self._hardware = "legacy"
         self._resources = None
+        self._resources_read_at: float | None = None
+        self._resources_refresh_interval = resources_refresh_interval
+        self._read_timings: dict[str, float] = {}
+        self._skipped_updates = 0
+        self._changed_items = 0
+        self._decoded_sumstates: dict[tuple[str, str, str], dict] = {}
+        self._snapshot = StateSnapshot(0, None, None, self._hardware)
+        self._snapshot_published = asyncio.Event()
+
+    @property
+    def skipped_updates(self) -> int:
+        """returns the number of reads skipped since neither the resources nor the status changed"""
+        return self._skipped_updates
+
+    @property
+    def changed_items(self) -> int:
+        """returns the number of items whose values changed with the last status"""
+        return self._changed_items
+
+    @property
+    def read_timings(self) -> dict[str, float]:
+        """returns the wall times in seconds of the requests of the last read"""
+        return self._read_timings
+
+    @property
+    def request_queue_depth(self) -> int:
+        """returns the number of requests waiting to be sent"""
+        return 0
+
+    @property
+    def snapshot(self) -> StateSnapshot:
+        """returns the last published snapshot of the resources and status"""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        """returns the version of the last published snapshot"""
+        return self._snapshot.version
+
+    async def wait_for_version(self, version: int) -> StateSnapshot:
+        """Waits until a snapshot with at least the given version is published"""
+        while self._snapshot.version < version:
+            await self._snapshot_published.wait()
+        return self._snapshot
+
+    def _publish_snapshot(self) -> None:
+        """Publishes the applied resources and status as new snapshot, if they changed
+
+        Has to be called once the resources and status of a read are both applied,
+        so readers never see the resources of one read next to the status of another.
+        """
+        snapshot = self._snapshot
+        if (
+            _unfrozen(snapshot._resources) is self._resources
+            and _unfrozen(snapshot._status) is self._status
+            and snapshot.hardware == self._hardware
+        ):
+            return
+        self._snapshot = StateSnapshot(
+            snapshot.version + 1,
+            self._resources,
+            self._status,
+            self._hardware,
+            snapshot,
+        )
+        published, self._snapshot_published = self._snapshot_published, asyncio.Event()
+        published.set()
 
     @property
     def resources(self):
-        """returns the read resources"""
-        return self._resources
+        """returns the resources of the last published snapshot"""
+        return self._snapshot.resources
 
     @resources.setter
     def resources(self, resources):
         self._resources = resources
-        for subscriber in self._subscriber:
-            subscriber.update_resources(self._resources)
+        self._resources_read_at = time.monotonic()
+        changes = []
+        for subscriber, categories, routed in self._route(
+            resources, self._routed_resources
+        ):
+            subscriber.update_resources(routed)
+            changes.extend(self._pop_removals(subscriber, categories))
+            # items added to the resources need their status, even if it did not change
+            for category in routed:
+                self._routed_status.pop(category, None)
+        self._publish_changes(changes)
+
+    @property
+    def resources_outdated(self) -> bool:
+        """returns whether the resources have to be read (again) before the next status"""
+        if self._resources is None or self._resources_read_at is None:
+            return True
+        if self._resources_refresh_interval is None:
+            return False
+        return (
+            time.monotonic() - self._resources_read_at
+            >= self._resources_refresh_interval
+        )
 
     @property
     def status(self):
-        """returns the read status"""
-        return self._status
+        """returns the status of the last published snapshot"""
+        return self._snapshot.status
 
     @status.setter
     def status(self, status):
         self._status = status
 
-        # current assumption is, that the hardware property is not set in legacy hardware (Slide)
-        # but only in newer hardware (Slide 2, Nova)
-        hardware = "legacy"
-        network_data = status["globals"]["network"]
-        if (
-            "hardware" in network_data
-            and network_data["hardware"]
-            and "value" in network_data["hardware"]
-        ):
-            hardware = network_data["hardware"]["value"]
+        hardware = get_hardware(status)
+        if hardware != self._hardware:
+            self._routed_status = {}
+        self._hardware = hardware
+
+        changes = []
+        for subscriber, categories, routed in self._route(status, self._routed_status):
+            subscriber.update_status(routed, hardware)
+            changes.extend(self._pop_changes(subscriber, categories))
+        self._changed_items = len(changes)
+        self._publish_changes(changes)
+
+    @property
+    def hardware(self) -> str:
+        """returns the hardware of the last published snapshot"""
+        return self._snapshot.hardware
+
+    def invalidate_status(self) -> None:
+        """Makes sure the next read status is applied, even if it did not change"""
+        self._routed_status = {}
+
+    def get_sumstate_decoder(
+        self, category: str, hardware: str, kind: str = "item"
+    ) -> SumstateDecoder:
+        """Returns the decoder of the sumstates of a category, see sumstate.get_decoder
+
+        The sumstates decoded in advance with the status being applied are looked
+        up, the others are decoded on the spot.
+        """
+        decode = get_decoder(category, hardware, kind)
+        records = self._decoded_sumstates.get((category, hardware, kind))
+        if not records:
+            return decode
+
+        def decode_record(value: str) -> dict[str, str]:
+            record = records.get(value)
+            return decode(value) if record is None else record
+
+        return decode_record
+
+    def invalidate_resources(self) -> None:
+        """Makes sure the resources are read with the next status"""
+        self._resources_read_at = None
+
+    def subscribe(self, subscriber: DataSubscriberInterface, *categories: str):
+        """Method to subscribe to data changes.
+
+        A subscriber registering the category keys it owns only gets the changed
+        subtrees of these categories, e.g. {"lights": {...}}. Without categories the
+        whole data is passed on every update.
+        """
+        self._subscriber.append((subscriber, categories))
+
+    def _route(self, data, routed: dict[str, object]):
+        """Yields the subscribers to update together with the data to pass to them
+
+        Subscribers with categories are skipped if none of their category subtrees
+        changed since they were last routed. A category which disappeared is passed
+        once as empty subtree.
+        """
+        changed = {}
+        for category, subtree in data.items():
+            previous = routed.get(category, _MISSING)
+            if previous is not subtree and previous != subtree:
+                changed[category] = subtree
+        routed.update(changed)
+        for category in [category for category in routed if category not in data]:
+            del routed[category]
+            changed[category] = {}
+
+        for subscriber, categories in self._subscriber:
+            if not categories:
+                yield subscriber, categories, data
+                continue
+            subtrees = {
+                category: changed[category]
+                for category in categories
+                if category in changed
+            }
+            if subtrees:
+                yield subscriber, categories, subtrees
 
-        for subscriber in self._subscriber:
-            subscriber.update_status(self._status, hardware)
+    def update_entity_status(self, subscriber: DataSubscriberInterface, status) -> None:
+        """Updates a subscriber with the status of single entities and publishes the changes"""
+        subscriber.update_status(status, self._hardware)
+        categories = next(
+            (categories for s, categories in self._subscriber if s is subscriber), ()
+        )
+        if self._status is not None:
+            # the published status is never modified, the changed categories are copied
+            merged_status = dict(self._status)
+            for category, items in status.items():
+                merged_status[category] = {**merged_status.get(category, {}), **items}
+            self._status = merged_status
+        self._publish_snapshot()
+        self._publish_changes(self._pop_changes(subscriber, categories))
 
-    def subscribe(self, subscriber: DataSubscriberInterface):
-        """Method to subscribe to data changes."""
-        self._subscriber.append(subscriber)
+    def add_change_listener(
+        self, category: str | None, callback: ChangeListener
+    ) -> Callable[[], None]:
+        """Adds a listener for the changes of all entities of the given category
+
+        A listener without category gets the changes of all categories.
+        """
+        listeners = self._change_listeners.setdefault(category, [])
+        listeners.append(callback)
+        return lambda: listeners.remove(callback)
+
+    def add_write_listener(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Adds a listener called on every write"""
+        self._write_listeners.append(callback)
+        return lambda: self._write_listeners.remove(callback)
+
+    @staticmethod
+    def _pop_changes(
+        subscriber: DataSubscriberInterface, categories: tuple[str, ...]
+    ) -> list[tuple[DataSubscriberInterface, EntityChange]]:
+        """Returns the changes of the given subscriber's entities"""
+        category = categories[0] if categories else None
+        return [
+            (subscriber, EntityChange(category, entity_id, changed_values))
+            for entity_id, changed_values in subscriber.pop_changes().items()
+        ]
+
+    @staticmethod
+    def _pop_removals(
+        subscriber: DataSubscriberInterface, categories: tuple[str, ...]
+    ) -> list[tuple[DataSubscriberInterface, EntityChange]]:
+        """Returns the removal changes of the given subscriber's entities"""
+        category = categories[0] if categories else None
+        return [
+            (
+                subscriber,
+                EntityChange(
+                    category,
+                    entity_id,
+                    {value_name: (value, None) for value_name, value in values.items()},
+                    removed=True,
+                ),
+            )
+            for entity_id, values in subscriber.pop_removals().items()
+        ]
+
+    def _publish_changes(
+        self, changes: list[tuple[DataSubscriberInterface, EntityChange]]
+    ) -> None:
+        """Calls the entity and category listeners with the given changes"""
+        for subscriber, change in changes:
+            subscriber.notify_listeners(change)
+            for category in (change.category, None):
+                for listener in list(self._change_listeners.get(category, ())):
+                    _call_listener(listener, change)
 
     @abstractmethod
     async def read_data(self) -> None:
         """Reads data from the MyGekko API"""
 
     @abstractmethod
-    async def write_data(self, resource_path: str, value: str):
-        """Sends data to the MyGekko API"""
+    async def read_status(self) -> None:
+        """Reads only the status from the MyGekko API, the resources are read if outdated"""
+
+    @abstractmethod
+    async def read_entity_status(self, resource_path: str):
+        """Reads the status of a single entity from the MyGekko API.
+
+        The result is shaped like the status of all entities, but only contains the
+        given entity, e.g. {"lights": {"item0": {...}}}.
+        """
+
+    async def write_data(self, resource_path: str, value: str, idempotent: bool = True):
+        """Sends data to the MyGekko API.
+
+        If a write debounce window is set, the writes of the same command to the same
+        resource are coalesced, only the last value within the window is sent. The
+        call returns when the coalesced write is done.
+
+        Writes which are not idempotent, like opening a door, are neither coalesced
+        nor retried.
+        """
+        # the next poll has to be applied even if it equals the last one, to
+        # reconcile optimistic updates
+        self.invalidate_status()
+        for listener in list(self._write_listeners):
+            listener()
+
+        if not self._write_debounce or not idempotent:
+            await self._send_data(resource_path, value, idempotent)
+            return
+
+        key = (resource_path, _COMMAND_PATTERN.match(value).group(0))
+        pending_write = self._pending_writes.get(key)
+        if pending_write is None:
+            loop = asyncio.get_running_loop()
+            pending_write = _PendingWrite(value, loop.create_future())
+            pending_write.task = loop.create_task(self._send_pending_write(key))
+            self._pending_writes[key] = pending_write
+        else:
+            _LOGGER.debug(
+                "Coalescing %s with %s to %s", pending_write.value, value, resource_path
+            )
+            pending_write.value = value
+
+        await asyncio.shield(pending_write.future)
+
+    async def _send_pending_write(self, key: tuple[str, str]):
+        """Sends the pending write after the debounce window"""
+        await asyncio.sleep(self._write_debounce)
+        pending_write = self._pending_writes.pop(key)
+        try:
+            await self._send_data(key[0], pending_write.value, True)
+        except Exception as exception:
+            pending_write.future.set_exception(exception)
+        else:
+            pending_write.future.set_result(None)
+
+    @abstractmethod
+    async def _send_data(self, resource_path: str, value: str, idempotent: bool):
+        """Sends data to the MyGekko API right away"""
 
     @abstractmethod
     async def try_connect(self) -> None:
@@ -103,8 +718,8 @@ class DataProviderBase(ABC):
 class DummyDataProvider(DataProviderBase):
     """Dummy data provider returning static test data"""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, optimistic_updates: bool = False):
+        super().__init__(optimistic_updates=optimistic_updates)
 
     async def try_connect(self) -> None:
         _LOGGER.debug("try_connect in DummyDataProvider")
@@ -116,8 +731,29 @@ class DummyDataProvider(DataProviderBase):
 
         status_demo_data = pkgutil.get_data(__name__, "api_var_status_demo_data.json")
         self.status = json.loads(status_demo_data)
+        self._publish_snapshot()
+
+    async def read_status(self) -> None:
+        _LOGGER.debug("read_status in DummyDataProvider")
+        if self.resources_outdated:
+            await self.read_data()
+            return
+
+        status_demo_data = pkgutil.get_data(__name__, "api_var_status_demo_data.json")
+        self.status = json.loads(status_demo_data)
+        self._publish_snapshot()
+
+    async def read_entity_status(self, resource_path: str):
+        _LOGGER.debug("read_entity_status in DummyDataProvider %s", resource_path)
+        status_demo_data = pkgutil.get_data(__name__, "api_var_status_demo_data.json")
+        status = json.loads(status_demo_data)
+
+        category, entity_id = resource_path.strip("/").split("/")
+        if category in status and entity_id in status[category]:
+            return {category: {entity_id: status[category][entity_id]}}
+        return None
 
-    async def write_data(self, resource_path: str, value: str):
+    async def _send_data(self, resource_path: str, value: str, idempotent: bool):
         _LOGGER.info("Writing to %s %s", resource_path, value)
 
 
@@ -125,15 +761,55 @@ class DataProvider(DataProviderBase):
     """Data provider accessing the MyGekko API"""
 
     def __init__(
-        self, url: URL, authentication_params: dict[str, str], session: ClientSession
+        self,
+        url: URL,
+        authentication_params: dict[str, str],
+        session: ClientSession,
+        concurrent_read: bool = False,
+        resources_refresh_interval: float | None = None,
+        categories: frozenset[str] | None = None,
+        optimistic_updates: bool = False,
+        write_debounce: float | None = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        json_loads: JsonLoads | None = None,
+        executor: Executor | None = None,
     ):
-        super().__init__()
+        super().__init__(resources_refresh_interval, optimistic_updates, write_debounce)
         self._url = url
         self._authentication_params = authentication_params
         self._session = session
+        self._concurrent_read = concurrent_read
+        self._categories = categories
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._json_loads = json_loads if json_loads is not None else get_json_loads()
+        self._executor = executor
+        self._json_cache: dict[str, tuple[bytes, object]] = {}
+
+    def invalidate_status(self) -> None:
+        super().invalidate_status()
+        self._json_cache = {
+            path: cached
+            for path, cached in self._json_cache.items()
+            if not path.endswith("/status")
+        }
+
+    @property
+    def request_queue_depth(self) -> int:
+        """returns the number of requests waiting for the rate limiter"""
+        if self._rate_limiter is None:
+            return 0
+        return self._rate_limiter.queue_depth
+
+    async def _acquire(self, priority: RequestPriority) -> None:
+        """Waits for the rate limiter to allow the next request"""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(priority)
 
     async def try_connect(self) -> None:
         _LOGGER.debug("try_connect in DataProvider")
+        await self._acquire(RequestPriority.READ)
 
         async with self._session.get(
             self._url.with_path("/api/v1/var"), params=self._authentication_params
@@ -145,54 +821,286 @@ class DataProvider(DataProviderBase):
                 self.handle_api_error(resp.status, response_text)
 
     async def read_data(self) -> None:
-        _LOGGER.debug("read_data in DataProvider: /api/v1/var")
-        async with self._session.get(
-            self._url.with_path("/api/v1/var"),
-            params=self._authentication_params,
-        ) as resp:
-            response_text = await resp.text()
-            if resp.status == 200:
-                try:
-                    self.resources = json.loads(response_text)
-                except json.JSONDecodeError:
-                    _LOGGER.exception("Json Parsing the response failed")
-            else:
-                _LOGGER.error(
-                    "Error reading the resources %s %s", resp.status, await resp.text()
-                )
-                self.handle_api_error(resp.status, response_text)
+        start = time.perf_counter()
+        read_timings = {}
 
-        _LOGGER.debug("read_data in DataProvider: /api/v1/var/status")
-        async with self._session.get(
-            self._url.with_path("/api/v1/var/status"),
-            params=self._authentication_params,
-        ) as resp:
-            response_text = await resp.text()
-            if resp.status == 200:
-                try:
-                    self.status = json.loads(response_text)
-                except json.JSONDecodeError:
-                    _LOGGER.exception("Json Parsing the response failed")
-            else:
-                _LOGGER.error(
-                    "Error reading the resources %s %s", resp.status, await resp.text()
+        digests = {}
+
+        if self._categories is not None:
+            resources_read, status_read = await self._gather(
+                self._read_categories("", read_timings, digests),
+                self._read_categories("/status", read_timings, digests),
+            )
+        elif self._concurrent_read:
+            resources_read, status_read = await self._gather(
+                self._read_json("/api/v1/var", read_timings, digests),
+                self._read_json("/api/v1/var/status", read_timings, digests, ""),
+            )
+        else:
+            resources_read = await self._read_json("/api/v1/var", read_timings, digests)
+            status_read = await self._read_json(
+                "/api/v1/var/status", read_timings, digests, ""
+            )
+
+        # resources have to be applied before the status, the subscribers rely on
+        # the resources being known when the status is updated
+        self._apply(*resources_read, *status_read, read_timings, digests)
+
+        read_timings["total"] = time.perf_counter() - start
+        self._read_timings = read_timings
+
+        _LOGGER.debug("read_data end %s", read_timings)
+
+    async def read_status(self) -> None:
+        if self.resources_outdated:
+            await self.read_data()
+            return
+
+        start = time.perf_counter()
+        read_timings = {}
+
+        digests = {}
+
+        if self._categories is not None:
+            status, status_changed = await self._read_categories(
+                "/status", read_timings, digests
+            )
+        else:
+            status, status_changed = await self._read_json(
+                "/api/v1/var/status", read_timings, digests, ""
+            )
+        self._apply(None, False, status, status_changed, read_timings, digests)
+
+        read_timings["total"] = time.perf_counter() - start
+        self._read_timings = read_timings
+
+        _LOGGER.debug("read_status end %s", read_timings)
+
+    async def read_entity_status(self, resource_path: str):
+        # the next poll has to be applied even if it equals the last one
+        self.invalidate_status()
+
+        read_timings = {}
+        entity_status, _ = await self._read_json(
+            "/api/v1/var" + resource_path + "/status", read_timings
+        )
+        _LOGGER.debug("read_entity_status end %s", read_timings)
+
+        if entity_status is None:
+            return None
+
+        category, entity_id = resource_path.strip("/").split("/")
+        return {category: {entity_id: entity_status}}
+
+    def _apply(
+        self,
+        resources,
+        resources_changed: bool,
+        status,
+        status_changed: bool,
+        read_timings: dict[str, float],
+        digests: dict[str, tuple[bytes, object]],
+    ):
+        """Applies the changed resources and status to the subscribers.
+
+        The digests of the read responses are only cached once they are applied, so a
+        read failing halfway is applied by the next read.
+        """
+        start = time.perf_counter()
+        if resources is not None and resources_changed:
+            self.resources = resources
+        elif resources is not None:
+            self._resources_read_at = time.monotonic()
+
+        if status is not None and status_changed:
+            self.status = status
+            self._decoded_sumstates = {}
+        elif status is not None:
+            self._changed_items = 0
+            if not resources_changed:
+                # nothing of the read is applied
+                self._skipped_updates += 1
+        self._publish_snapshot()
+        self._json_cache.update(digests)
+
+        self._add_loop_blocking_time(read_timings, time.perf_counter() - start)
+
+    def _add_loop_blocking_time(self, read_timings: dict[str, float], seconds: float):
+        """Adds time spent in synchronous decoding and dispatching on the event loop"""
+        read_timings["loop_blocking"] = read_timings.get("loop_blocking", 0.0) + seconds
+
+    async def _read_categories(
+        self,
+        suffix: str,
+        read_timings: dict[str, float],
+        digests: dict[str, tuple[bytes, object]],
+    ):
+        """Reads the enabled categories concurrently and merges them into one dict.
+
+        Returns None if the data of a category could not be parsed.
+        """
+        categories = sorted(self._categories)
+        if suffix == "/status":
+            # the globals are needed to determine the hardware
+            if "globals" not in categories:
+                categories.append("globals")
+        elif "globals" in categories:
+            # the resources of the globals are not used
+            categories.remove("globals")
+
+        results = await self._gather(
+            *[
+                self._read_json(
+                    "/api/v1/var/" + category + suffix,
+                    read_timings,
+                    digests,
+                    category if suffix == "/status" else None,
                 )
-                self.handle_api_error(resp.status, response_text)
+                for category in categories
+            ]
+        )
+
+        if any(result is None for result, _ in results):
+            # a category missing from the merged data would be taken as removed, so
+            # nothing of an incomplete read is applied nor cached
+            for category in categories:
+                digests.pop("/api/v1/var/" + category + suffix, None)
+            return None, False
 
-        _LOGGER.debug("read_data end")
+        merged = {
+            category: result for category, (result, _) in zip(categories, results)
+        }
+        return merged, any(changed for _, changed in results)
+
+    async def _gather(self, *coroutines):
+        """Runs the given coroutines concurrently, raises the first error after all are done"""
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    async def _read_json(
+        self,
+        path: str,
+        read_timings: dict[str, float],
+        digests: dict[str, tuple[bytes, object]] | None = None,
+        status_category: str | None = None,
+    ):
+        """Reads and parses the json data of the given path.
 
-    async def write_data(self, resource_path: str, value: str):
+        Returns the data, or None if the data could not be parsed, and whether the data
+        changed. If the response is the same as the last applied one, the last data is
+        returned without parsing it again. The digest of a changed response is added
+        to the given digests, to be cached once the data is applied. Without digests
+        the cache is not used.
+
+        If the data is the status of the given category, or of all categories if the
+        category is empty, the executor decodes its sumstates in advance as well.
+        """
+        _LOGGER.debug("read_data in DataProvider: %s", path)
+        start = time.perf_counter()
+        try:
+            response_body = await self._get(
+                path, self._authentication_params, RequestPriority.READ, True
+            )
+
+            cached_digest, cached_data = None, None
+            if digests is not None and path in self._json_cache:
+                cached_digest, cached_data = self._json_cache[path]
+
+            try:
+                if self._executor is not None:
+                    loop = asyncio.get_running_loop()
+                    digest, changed, data, sumstates = await loop.run_in_executor(
+                        self._executor,
+                        _decode_response,
+                        self._json_loads,
+                        response_body,
+                        cached_digest,
+                        status_category,
+                        self._hardware,
+                    )
+                    for key, records in sumstates.items():
+                        self._decoded_sumstates.setdefault(key, {}).update(records)
+                else:
+                    decode_start = time.perf_counter()
+                    digest, changed, data, _ = _decode_response(
+                        self._json_loads, response_body, cached_digest
+                    )
+                    self._add_loop_blocking_time(
+                        read_timings, time.perf_counter() - decode_start
+                    )
+            except ValueError:
+                _LOGGER.exception("Json Parsing the response failed")
+                return None, False
+
+            if not changed:
+                _LOGGER.debug("Response of %s did not change", path)
+                return cached_data, False
+
+            if digests is not None:
+                digests[path] = (digest, data)
+            return data, True
+        finally:
+            read_timings[path] = time.perf_counter() - start
+
+    async def _send_data(self, resource_path: str, value: str, idempotent: bool):
         resource_url = "/api/v1/var" + resource_path + "/scmd/set"
 
         _LOGGER.debug("Writing data %s to %s", value, resource_url)
 
-        async with self._session.get(
-            self._url.with_path(resource_url),
-            params=self._authentication_params | {"value": value},
-        ) as resp:
-            if resp.status != 200:
-                response_text = await resp.text()
-                self.handle_api_error(resp.status, response_text)
+        await self._get(
+            resource_url,
+            self._authentication_params | {"value": value},
+            RequestPriority.WRITE,
+            idempotent
+            and self._retry_policy is not None
+            and self._retry_policy.retry_writes,
+        )
+
+    async def _get(
+        self, path: str, params: dict[str, str], priority: RequestPriority, retry: bool
+    ) -> bytes:
+        """Sends a GET request and returns the response body.
+
+        Failed requests are retried according to the retry policy if retry is set,
+        otherwise or if no retry is left the error is raised.
+        """
+        retry_policy = self._retry_policy if retry else None
+        deadline = retry_policy.get_deadline() if retry_policy else None
+        attempt = 1
+
+        while True:
+            await self._acquire(priority)
+            async with self._session.get(
+                self._url.with_path(path), params=params
+            ) as resp:
+                response_body = await resp.read()
+                if resp.status == 200:
+                    return response_body
+                response_text = response_body.decode(errors="replace")
+                retry_after = resp.headers.get("Retry-After")
+
+            if (
+                retry_policy is not None
+                and retry_policy.should_retry(resp.status)
+                and attempt < retry_policy.max_attempts
+            ):
+                delay = retry_policy.get_delay(attempt - 1, retry_after)
+                if deadline is None or time.monotonic() + delay < deadline:
+                    _LOGGER.warning(
+                        "Request to %s failed with %s, retrying in %.2fs",
+                        path,
+                        resp.status,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+
+            _LOGGER.error("Error requesting %s %s %s", path, resp.status, response_text)
+            self.handle_api_error(resp.status, response_text)
 
     def handle_api_error(self, response_status, response_text):
         """Handles the api response in case of errors"""
@@ -221,6 +1129,51 @@ class DataProvider(DataProviderBase):
             raise MyGekkoError()
 
 
+def _call_listener(listener: ChangeListener, change: EntityChange) -> None:
+    """Calls a change listener, a failing listener must not break the polling"""
+    try:
+        listener(change)
+    except Exception:
+        _LOGGER.exception("Change listener failed for %s", change.entity_id)
+
+
+def _decode_response(
+    json_loads: JsonLoads,
+    response_body: bytes,
+    cached_digest: bytes | None,
+    status_category: str | None = None,
+    hardware: str = "legacy",
+):
+    """Returns the digest of the response body, whether it differs from the cached
+    digest, the parsed data if it does and the sumstates decoded in advance.
+
+    The sumstates are decoded if the data is the status of the given category, or of
+    all categories if it is empty. The hardware is taken from the globals, if they
+    are part of the data. This is a module level function, so it can be run in a
+    process pool executor.
+    """
+    digest = hashlib.blake2b(response_body, digest_size=16).digest()
+    if digest == cached_digest:
+        return digest, False, None, {}
+    data = json_loads(response_body)
+    sumstates = {}
+    if status_category is not None and isinstance(data, dict):
+        status = data if not status_category else {status_category: data}
+        if "globals" in status:
+            hardware = get_hardware(status)
+        sumstates = decode_sumstates(status, hardware)
+    return digest, True, data, sumstates
+
+
+class _PendingWrite:
+    """A write waiting for its debounce window to pass"""
+
+    def __init__(self, value: str, future: asyncio.Future) -> None:
+        self.value = value
+        self.future = future
+        self.task: asyncio.Task | None = None
+
+
 class MyGekkoError(Exception):
     """Base MyGekko exception."""
 
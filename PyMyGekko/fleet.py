@@ -0,0 +1,315 @@
+"""Fleet of MyGekko api clients sharing one session"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+from typing import TypeVar
+
+from aiohttp import ClientSession
+from aiohttp import TCPConnector
+
+from . import MyGekkoApiClientBase
+from . import MyGekkoQueryApiClient
+from .poller import Poller
+from .resources.AccessDoors import AccessDoor
+from .resources.Actions import Action
+from .resources.AlarmsLogics import AlarmsLogic
+from .resources.Blinds import Blind
+from .resources.Cams import Cam
+from .resources.DoorInterComs import DoorInterCom
+from .resources.EnergyCosts import EnergyCost
+from .resources.HotWaterSystems import HotWaterSystem
+from .resources.Lights import Light
+from .resources.Loads import Load
+from .resources.Meteo import Meteo
+from .resources.RoomTemps import RoomTemp
+from .resources.Vents import Vent
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class GekkoStats(NamedTuple):
+    """Statistics of the polls and reads of a gekko, the durations are in seconds.
+
+    skipped_updates counts the reads which were not decoded since the data did not
+    change, see get_skipped_updates of the client.
+    """
+
+    polls: int
+    errors: int
+    error_rate: float
+    last_duration: float | None
+    mean_duration: float | None
+    max_duration: float
+    skipped_updates: int = 0
+
+
+class _ReadStats:
+    """Statistics of the reads of a gekko made by the fleet itself"""
+
+    def __init__(self) -> None:
+        self.polls = 0
+        self.errors = 0
+        self.last_duration: float | None = None
+        self.last_polled_at: float | None = None
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+
+    def add(self, duration: float, failed: bool) -> None:
+        """Adds a read which took the given seconds"""
+        self.polls += 1
+        self.errors += failed
+        self.last_duration = duration
+        self.last_polled_at = time.monotonic()
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+
+
+class MyGekkoFleet:
+    """Clients of many gekkos sharing one session, used with async with.
+
+    The connector of the session caps the requests in flight, limit in total and
+    limit_per_host per host, since each request holds a connection, by default 100
+    and 20. A given session is used as is, its connector sets the limits instead. The
+    first polls of the gekkos are spread over a jitter window, so they do not hit the
+    MyGekko API all at once.
+    """
+
+    def __init__(
+        self,
+        limit: int | None = None,
+        limit_per_host: int | None = None,
+        session: ClientSession | None = None,
+    ) -> None:
+        if session is not None and (limit is not None or limit_per_host is not None):
+            raise ValueError(
+                "The limits can not be applied to a given session, "
+                "set them on its connector instead"
+            )
+        self._limit = 100 if limit is None else limit
+        self._limit_per_host = 20 if limit_per_host is None else limit_per_host
+        self._session = session
+        self._owns_session = session is None
+        self._clients: dict[str, MyGekkoApiClientBase] = {}
+        self._pollers: dict[str, Poller] = {}
+        self._read_stats: dict[str, _ReadStats] = {}
+
+    async def __aenter__(self) -> MyGekkoFleet:
+        if self._session is None:
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=self._limit,
+                    limit_per_host=self._limit_per_host,
+                    ttl_dns_cache=300,
+                )
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> ClientSession | None:
+        """Returns the session shared by the clients"""
+        return self._session
+
+    @property
+    def clients(self) -> dict[str, MyGekkoApiClientBase]:
+        """Returns the clients by gekko id"""
+        return dict(self._clients)
+
+    def add(
+        self, gekko_id: str, username: str, api_key: str, **kwargs
+    ) -> MyGekkoQueryApiClient:
+        """Adds a query api client of the given gekko, see MyGekkoQueryApiClient"""
+        return self.add_client(
+            gekko_id,
+            lambda session: MyGekkoQueryApiClient(
+                username, api_key, gekko_id, session, **kwargs
+            ),
+        )
+
+    def add_client(
+        self,
+        gekko_id: str,
+        create_client: Callable[[ClientSession], MyGekkoApiClientBase],
+    ) -> MyGekkoApiClientBase:
+        """Adds the client created with the shared session, e.g. a local api client"""
+        if self._session is None:
+            raise RuntimeError("The fleet has to be entered with async with first")
+        if gekko_id in self._clients:
+            raise ValueError(f"Gekko {gekko_id} was already added")
+
+        client = create_client(self._session)
+        self._clients[gekko_id] = client
+        return client
+
+    async def remove(self, gekko_id: str) -> None:
+        """Stops polling the given gekko and removes its client"""
+        poller = self._pollers.pop(gekko_id, None)
+        if poller is not None:
+            await poller.stop()
+        self._read_stats.pop(gekko_id, None)
+        del self._clients[gekko_id]
+
+    async def read_data(self) -> dict[str, Exception]:
+        """Reads the data of all gekkos and returns the errors by gekko id"""
+        return await self._gather(MyGekkoApiClientBase.read_data)
+
+    async def read_status(self) -> dict[str, Exception]:
+        """Reads the status of all gekkos and returns the errors by gekko id"""
+        return await self._gather(MyGekkoApiClientBase.read_status)
+
+    async def _gather(self, read) -> dict[str, Exception]:
+        gekko_ids = list(self._clients)
+        results = await asyncio.gather(
+            *(self._timed(gekko_id, read) for gekko_id in gekko_ids),
+            return_exceptions=True,
+        )
+        errors = {}
+        for gekko_id, result in zip(gekko_ids, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Reading gekko %s failed: %r", gekko_id, result)
+                errors[gekko_id] = result
+            elif isinstance(result, BaseException):
+                raise result
+        return errors
+
+    async def _timed(self, gekko_id: str, read) -> None:
+        """Reads the gekko and adds the read to its statistics"""
+        client = self._clients[gekko_id]
+        stats = self._read_stats.setdefault(gekko_id, _ReadStats())
+        started_at = time.monotonic()
+        try:
+            await read(client)
+        except Exception:
+            stats.add(time.monotonic() - started_at, True)
+            raise
+        stats.add(time.monotonic() - started_at, False)
+
+    def start_polling(self, jitter: float | None = None, **kwargs) -> None:
+        """Starts polling the gekkos which are not polled yet.
+
+        The first polls are spread randomly over jitter seconds, by default over the
+        interval. The other arguments are passed to start_polling of the clients.
+        """
+        if jitter is None:
+            jitter = kwargs.get("interval", 10.0)
+
+        for gekko_id, client in self._clients.items():
+            if gekko_id not in self._pollers:
+                poller = client.start_polling(**kwargs)
+                poller.start(random.uniform(0, jitter))
+                self._pollers[gekko_id] = poller
+
+    async def stop_polling(self) -> None:
+        """Stops polling all gekkos"""
+        pollers = list(self._pollers.values())
+        self._pollers = {}
+        await asyncio.gather(*(poller.stop() for poller in pollers))
+
+    async def close(self) -> None:
+        """Stops polling and closes the session if it was created by the fleet"""
+        await self.stop_polling()
+        self._read_stats = {}
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def get_stats(self) -> dict[str, GekkoStats]:
+        """Returns the statistics of the polls and reads of the fleet by gekko id"""
+        stats = {}
+        for gekko_id, client in self._clients.items():
+            sources = [
+                source
+                for source in (
+                    self._pollers.get(gekko_id),
+                    self._read_stats.get(gekko_id),
+                )
+                if source is not None
+            ]
+            if not sources:
+                continue
+            polls = sum(source.polls for source in sources)
+            errors = sum(source.errors for source in sources)
+            total_duration = sum(source.total_duration for source in sources)
+            last = max(sources, key=lambda source: source.last_polled_at or 0.0)
+            stats[gekko_id] = GekkoStats(
+                polls,
+                errors,
+                errors / polls if polls else 0.0,
+                last.last_duration,
+                total_duration / polls if polls else None,
+                max(source.max_duration for source in sources),
+                client.get_skipped_updates(),
+            )
+        return stats
+
+    def get_changed_items(self) -> int:
+        """Returns the number of items whose status changed with the last reads"""
+        return sum(client.get_changed_items() for client in self._clients.values())
+
+    def _collect(self, getter: Callable[[MyGekkoApiClientBase], _T]) -> dict[str, _T]:
+        return {gekko_id: getter(client) for gekko_id, client in self._clients.items()}
+
+    def get_globals_network(self) -> dict[str, dict | None]:
+        """Returns the globals network information by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_globals_network)
+
+    def get_access_doors(self) -> dict[str, list[AccessDoor]]:
+        """Returns the access doors by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_access_doors)
+
+    def get_actions(self) -> dict[str, list[Action]]:
+        """Returns the actions by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_actions)
+
+    def get_alarms_logics(self) -> dict[str, list[AlarmsLogic]]:
+        """Returns the alarms_logics by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_alarms_logics)
+
+    def get_blinds(self) -> dict[str, list[Blind]]:
+        """Returns the blinds by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_blinds)
+
+    def get_cams(self) -> dict[str, list[Cam]]:
+        """Returns the cams by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_cams)
+
+    def get_door_inter_coms(self) -> dict[str, list[DoorInterCom]]:
+        """Returns the door intercoms by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_door_inter_coms)
+
+    def get_energy_costs(self) -> dict[str, list[EnergyCost]]:
+        """Returns the energy costs by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_energy_costs)
+
+    def get_hot_water_systems(self) -> dict[str, list[HotWaterSystem]]:
+        """Returns the hot water systems by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_hot_water_systems)
+
+    def get_lights(self) -> dict[str, list[Light]]:
+        """Returns the lights by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_lights)
+
+    def get_loads(self) -> dict[str, list[Load]]:
+        """Returns the loads by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_loads)
+
+    def get_meteo(self) -> dict[str, Meteo | None]:
+        """Returns the meteo by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_meteo)
+
+    def get_room_temps(self) -> dict[str, list[RoomTemp]]:
+        """Returns the room temps by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_room_temps)
+
+    def get_vents(self) -> dict[str, list[Vent]]:
+        """Returns the vents by gekko id"""
+        return self._collect(MyGekkoApiClientBase.get_vents)
@@ -0,0 +1,69 @@
+"""JSON decoding backends used to parse the MyGekko API responses"""
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+from typing import Callable
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+JsonLoads = Callable[[bytes], Any]
+
+
+def _orjson_loads() -> JsonLoads:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec_decode(data: bytes) -> Any:
+    import msgspec
+
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError as error:
+        # callers expect a ValueError like for the other backends
+        raise ValueError(str(error)) from error
+
+
+def _msgspec_loads() -> JsonLoads:
+    import msgspec  # noqa: F401
+
+    # a module level function, so it can be sent to a process pool executor
+    return _msgspec_decode
+
+
+def _json_loads() -> JsonLoads:
+    return json.loads
+
+
+# the backends in the order of preference
+JSON_BACKENDS: dict[str, Callable[[], JsonLoads]] = {
+    "orjson": _orjson_loads,
+    "msgspec": _msgspec_loads,
+    "json": _json_loads,
+}
+
+
+def get_json_loads(backend: str | None = None) -> JsonLoads:
+    """Returns the loads function of the given backend.
+
+    Without a backend the fastest installed one is used, orjson or msgspec if
+    installed and the json module of the standard library otherwise. Invalid data
+    raises a ValueError for all backends.
+    """
+    if backend is not None:
+        if backend not in JSON_BACKENDS:
+            raise ValueError(f"Unknown json backend {backend}")
+        return JSON_BACKENDS[backend]()
+
+    for name, loader in JSON_BACKENDS.items():
+        try:
+            loads = loader()
+        except ImportError:
+            continue
+        _LOGGER.debug("Using json backend %s", name)
+        return loads
+
+    return json.loads
@@ -0,0 +1,160 @@
+"""Background polling of the MyGekko status"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from .data_provider import MyGekkoTooManyRequests
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class Poller:
+    """Polls the status in the background, used with async with.
+
+    A poll is only started once the previous one finished, a poll taking longer than
+    the interval is counted as overrun and the next one starts right away. Within
+    fast_window seconds after a write or a read change the fast_interval is used,
+    after idle_after seconds without writes and changes the idle_interval. A poll
+    answered with 429 (too many requests) doubles the interval, up to max_backoff.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[], Awaitable[None]],
+        get_changed_items: Callable[[], int],
+        interval: float = 10.0,
+        fast_interval: float = 2.0,
+        fast_window: float = 30.0,
+        idle_interval: float = 60.0,
+        idle_after: float = 600.0,
+        max_backoff: float = 300.0,
+    ) -> None:
+        if min(interval, fast_interval, idle_interval) <= 0:
+            raise ValueError("the intervals have to be positive")
+
+        self._read = read
+        self._get_changed_items = get_changed_items
+        self._interval = interval
+        self._fast_interval = fast_interval
+        self._fast_window = fast_window
+        self._idle_interval = idle_interval
+        self._idle_after = idle_after
+        self._max_backoff = max_backoff
+        self._backoff = 0.0
+        self._read_once = False
+        self._started_at = time.monotonic()
+        self._last_activity: float | None = None
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._on_stop: list[Callable[[], None]] = []
+
+        self.polls = 0
+        self.overruns = 0
+        self.errors = 0
+        self.last_duration: float | None = None
+        self.last_polled_at: float | None = None
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+
+    @property
+    def interval(self) -> float:
+        """Returns the interval in seconds currently used between two polls"""
+        if self._backoff:
+            return self._backoff
+
+        now = time.monotonic()
+        if (
+            self._last_activity is not None
+            and now - self._last_activity < self._fast_window
+        ):
+            return self._fast_interval
+        if now - (self._last_activity or self._started_at) >= self._idle_after:
+            return self._idle_interval
+        return self._interval
+
+    @property
+    def running(self) -> bool:
+        """Returns whether the poller is running"""
+        return self._task is not None and not self._task.done()
+
+    def on_stop(self, callback: Callable[[], None]) -> None:
+        """Adds a callback called once the poller is stopped"""
+        self._on_stop.append(callback)
+
+    def notify_activity(self) -> None:
+        """Switches to the fast interval, e.g. after a write"""
+        self._last_activity = time.monotonic()
+        self._wake.set()
+
+    def start(self, delay: float = 0.0) -> None:
+        """Starts polling in the background, the first poll is started after delay seconds"""
+        if not self.running:
+            self._started_at = time.monotonic()
+            self._task = asyncio.create_task(self._run(delay))
+
+    async def stop(self) -> None:
+        """Stops polling and waits for a running poll to be cancelled"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for callback in self._on_stop:
+            callback()
+        self._on_stop = []
+
+    async def __aenter__(self) -> Poller:
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.stop()
+
+    async def _run(self, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+        while True:
+            started_at = time.monotonic()
+            await self._poll()
+            self.last_polled_at = time.monotonic()
+            duration = self.last_polled_at - started_at
+            self.polls += 1
+            self.last_duration = duration
+            self.max_duration = max(self.max_duration, duration)
+            self.total_duration += duration
+            if duration >= self.interval:
+                self.overruns += 1
+                _LOGGER.debug("Poll took %.3fs, longer than the interval", duration)
+
+            # a write while waiting may shorten the interval
+            while (delay := started_at + self.interval - time.monotonic()) > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                except TimeoutError:
+                    pass
+
+    async def _poll(self) -> None:
+        try:
+            await self._read()
+        except MyGekkoTooManyRequests:
+            self.errors += 1
+            self._backoff = min(
+                max(self._backoff, self.interval) * 2, self._max_backoff
+            )
+            _LOGGER.warning("Too many requests, polling every %.1fs", self._backoff)
+        except Exception as exception:
+            self.errors += 1
+            _LOGGER.warning("Polling failed: %r", exception)
+        else:
+            self._backoff = 0.0
+            # the first read returns all values, which is no change of the installation
+            if self._read_once and self._get_changed_items():
+                self._last_activity = time.monotonic()
+            self._read_once = True
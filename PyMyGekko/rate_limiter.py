@@ -0,0 +1,94 @@
+"""Client side rate limiting of the MyGekko API requests"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from enum import IntEnum
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Priority of a request, requests with lower values are served first"""
+
+    WRITE = 0
+    READ = 1
+
+
+class TokenBucketRateLimiter:
+    """Token bucket rate limiter for the requests to the MyGekko API.
+
+    The bucket holds up to burst tokens and is refilled with rate tokens per second,
+    every request takes one token. If no token is available the request is queued,
+    queued writes are served before queued reads.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate has to be positive and burst at least 1")
+
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._serve_task: asyncio.Task | None = None
+
+    @property
+    def rate(self) -> float:
+        """Returns the number of requests per second"""
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        """Returns the maximum number of requests sent at once"""
+        return self._burst
+
+    @property
+    def queue_depth(self) -> int:
+        """Returns the number of requests waiting for a token"""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.READ) -> None:
+        """Waits until the request is allowed to be sent"""
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        _LOGGER.debug("Request queued, queue depth %s", len(self._waiters))
+
+        if self._serve_task is None or self._serve_task.done():
+            self._serve_task = loop.create_task(self._serve_waiters())
+
+        await future
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+
+    async def _serve_waiters(self) -> None:
+        """Hands out the tokens to the queued requests in the order of their priority"""
+        while self._waiters:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                continue
+
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                # the waiting request was cancelled
+                continue
+
+            self._tokens -= 1
+            future.set_result(None)
@@ -16,24 +16,25 @@ class AccessDoor(Entity):
     ) -> None:
         super().__init__(entity_id, name, "/accessdoors/")
         self._value_accessor = value_accessor
-        self._supported_features = self._value_accessor.get_features(self)
 
     @property
     def supported_features(self) -> list[AccessDoorFeature]:
         """Returns the supported features"""
-        return self._supported_features
+        return self._value_accessor.get_supported_features(self)
 
     @property
     def access_state(self) -> AccessDoorAccessState | None:
         """Returns the current access state"""
-        value = self._value_accessor.get_value(self, "accessState")
-        return AccessDoorAccessState(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "accessState", AccessDoorAccessState
+        )
 
     @property
     def access_type(self) -> AccessDoorAccessType | None:
         """Returns the current access type"""
-        value = self._value_accessor.get_value(self, "accessType")
-        return AccessDoorAccessType(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "accessType", AccessDoorAccessType
+        )
 
     async def set_state(self, state: AccessDoorCommand):
         """Sets the state"""
@@ -42,8 +43,9 @@ class AccessDoor(Entity):
     @property
     def element_info(self) -> AccessDoorElementInfo | None:
         """Returns the element info"""
-        value = self._value_accessor.get_value(self, "elementInfo")
-        return AccessDoorElementInfo(float(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "elementInfo", AccessDoorElementInfo
+        )
 
 
 class AccessDoorAccessState(IntEnum):
@@ -105,11 +107,12 @@ class AccessDoorValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        self._data_provider.subscribe(self)
+        self._data_provider.subscribe(self, "accessdoors")
 
     def update_status(self, status, hardware):
         if status is not None and "accessdoors" in status:
             access_doors = status["accessdoors"]
+            decode = self._data_provider.get_sumstate_decoder("accessdoors", hardware)
             for key in access_doors:
                 if key.startswith("item"):
                     if key not in self._data:
@@ -118,35 +121,29 @@ class AccessDoorValueAccessor(EntityValueAccessor):
                     if (
                         "sumstate" in access_doors[key]
                         and "value" in access_doors[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, access_doors[key]["sumstate"]["value"], hardware
+                        )
                     ):
-                        (
-                            self._data[key]["accessControllerActionState"],
-                            self._data[key]["elementInfo"],
-                            self._data[key]["accessState"],
-                            self._data[key]["gateRuntimeLevel"],
-                            self._data[key]["accessType"],
-                            *_other,
-                        ) = access_doors[key]["sumstate"]["value"].split(
-                            ";",
+                        self._data[key].update(
+                            decode(access_doors[key]["sumstate"]["value"])
                         )
 
     def update_resources(self, resources):
         if resources is not None and "accessdoors" in resources:
+            self._invalidate_entities()
             access_doors = resources["accessdoors"]
             for key in access_doors:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
                     self._data[key]["name"] = access_doors[key]["name"]
+            self._evict_missing(access_doors)
 
     @property
     def access_doors(self):
         """Returns the access doors read from MyGekko"""
-        result: list[AccessDoor] = []
-        for key, data in self._data.items():
-            result.append(AccessDoor(key, data["name"], self))
-
-        return result
+        return self._get_entities(AccessDoor)
 
     def get_features(self, door: AccessDoor) -> list[AccessDoorFeature]:
         """Returns the supported features"""
@@ -166,4 +163,6 @@ class AccessDoorValueAccessor(EntityValueAccessor):
     async def set_state(self, door: AccessDoor, state: AccessDoorCommand) -> None:
         """Sets the state"""
         if door and door.entity_id:
-            await self._data_provider.write_data(door.resource_path, str(state))
+            await self._data_provider.write_data(
+                door.resource_path, str(state), idempotent=False
+            )
@@ -16,18 +16,16 @@ class Action(Entity):
     ) -> None:
         super().__init__(entity_id, name, "/actions/")
         self._value_accessor = value_accessor
-        self._supported_features = self._value_accessor.get_features(self)
 
     @property
     def supported_features(self) -> list[ActionFeature]:
         """Returns the supported features"""
-        return self._supported_features
+        return self._value_accessor.get_supported_features(self)
 
     @property
     def state(self) -> ActionState | None:
         """Returns the current action state"""
-        value = self._value_accessor.get_value(self, "currentState")
-        return ActionState(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "currentState", ActionState)
 
     async def set_state(self, state: ActionState):
         """Sets the action state"""
@@ -36,8 +34,9 @@ class Action(Entity):
     @property
     def start_condition_state(self) -> ActionState | None:
         """Returns the start condition state"""
-        value = self._value_accessor.get_value(self, "startConditionState")
-        return ActionState(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "startConditionState", ActionState
+        )
 
 
 class ActionState(IntEnum):
@@ -59,11 +58,12 @@ class ActionValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        data_provider.subscribe(self)
+        data_provider.subscribe(self, "actions")
 
     def update_status(self, status, hardware):
         if status is not None and "actions" in status:
             actions = status["actions"]
+            decode = self._data_provider.get_sumstate_decoder("actions", hardware)
             for key in actions:
                 if key.startswith("item"):
                     if key not in self._data:
@@ -72,43 +72,29 @@ class ActionValueAccessor(EntityValueAccessor):
                     if (
                         "sumstate" in actions[key]
                         and "value" in actions[key]["sumstate"]
-                    ):
-                        self.read_value(
+                        and self._sumstate_changed(
                             key, actions[key]["sumstate"]["value"], hardware
                         )
-
-    def read_value(self, key, value, hardware):
-        """Reads a value based on the given hardware."""
-        if hardware == "legacy":
-            (
-                self._data[key]["currentState"],
-                self._data[key]["elementInfo"],
-            ) = value.split(";")
-        else:
-            (
-                self._data[key]["currentState"],
-                self._data[key]["startConditionState"],
-                self._data[key]["elementInfo"],
-                *_other,
-            ) = value.split(";")
+                    ):
+                        self._data[key].update(
+                            decode(actions[key]["sumstate"]["value"])
+                        )
 
     def update_resources(self, resources):
         if resources is not None and "actions" in resources:
+            self._invalidate_entities()
             actions = resources["actions"]
             for key in actions:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
                     self._data[key]["name"] = actions[key]["name"]
+            self._evict_missing(actions)
 
     @property
     def actions(self):
         """Returns the actions read from MyGekko"""
-        result: list[Action] = []
-        for key, data in self._data.items():
-            result.append(Action(key, data["name"], self))
-
-        return result
+        return self._get_entities(Action)
 
     def get_features(self, action: Action) -> list[ActionFeature]:
         """Returns the supported features"""
@@ -125,4 +111,4 @@ class ActionValueAccessor(EntityValueAccessor):
     async def set_state(self, action: Action, state: ActionState) -> None:
         """Sets the state"""
         if action and action.entity_id:
-            await self._data_provider.write_data(action.resource_path, str(state))
+            await self._write_data(action, str(state), {"currentState": str(state)})
@@ -18,8 +18,7 @@ class AlarmsLogic(Entity):
     @property
     def value(self) -> float | None:
         """Returns the value"""
-        value = self._value_accessor.get_value(self, "currentValue")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "currentValue", float)
 
 
 class AlarmsLogicValueAccessor(EntityValueAccessor):
@@ -28,11 +27,12 @@ class AlarmsLogicValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        data_provider.subscribe(self)
+        data_provider.subscribe(self, "alarms_logics")
 
     def update_status(self, status, hardware):
         if status is not None and "alarms_logics" in status:
             alarms_logics = status["alarms_logics"]
+            decode = self._data_provider.get_sumstate_decoder("alarms_logics", hardware)
             for key in alarms_logics:
                 if key.startswith("item"):
                     if key not in self._data:
@@ -41,28 +41,26 @@ class AlarmsLogicValueAccessor(EntityValueAccessor):
                     if (
                         "sumstate" in alarms_logics[key]
                         and "value" in alarms_logics[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, alarms_logics[key]["sumstate"]["value"], hardware
+                        )
                     ):
-                        (
-                            self._data[key]["currentValue"],
-                            *_other,
-                        ) = alarms_logics[
-                            key
-                        ]["sumstate"]["value"].split(";")
+                        self._data[key].update(
+                            decode(alarms_logics[key]["sumstate"]["value"])
+                        )
 
     def update_resources(self, resources):
         if resources is not None and "alarms_logics" in resources:
+            self._invalidate_entities()
             alarms_logics = resources["alarms_logics"]
             for key in alarms_logics:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
                     self._data[key]["name"] = alarms_logics[key]["name"]
+            self._evict_missing(alarms_logics)
 
     @property
     def alarms_logics(self):
         """Returns the alarmsLogics read from MyGekko"""
-        result: list[AlarmsLogic] = []
-        for key, data in self._data.items():
-            result.append(AlarmsLogic(key, data["name"], self))
-
-        return result
+        return self._get_entities(AlarmsLogic)
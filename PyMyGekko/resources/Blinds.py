@@ -16,18 +16,16 @@ class Blind(Entity):
     ) -> None:
         super().__init__(entity_id, name, "/blinds/")
         self._value_accessor = value_accessor
-        self._supported_features = self._value_accessor.get_features(self)
 
     @property
     def supported_features(self) -> list[BlindFeature]:
         """Returns the supported features"""
-        return self._supported_features
+        return self._value_accessor.get_supported_features(self)
 
     @property
     def position(self) -> float | None:
         """Returns the current position"""
-        value = self._value_accessor.get_value(self, "positionLevel")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "positionLevel", float)
 
     async def set_position(self, position: float):
         """Sets the position"""
@@ -36,8 +34,7 @@ class Blind(Entity):
     @property
     def state(self) -> BlindState | None:
         """Returns the current state"""
-        value = self._value_accessor.get_value(self, "currentState")
-        return BlindState(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "currentState", BlindState)
 
     async def set_state(self, state: BlindState):
         """Sets the state"""
@@ -46,8 +43,7 @@ class Blind(Entity):
     @property
     def tilt_position(self) -> float | None:
         """Returns the current tilt position"""
-        value = self._value_accessor.get_value(self, "rotationLevel")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "rotationLevel", float)
 
     async def set_tilt_position(self, position: float):
         """Sets the tilt position"""
@@ -56,8 +52,9 @@ class Blind(Entity):
     @property
     def element_info(self) -> BlindElementInfo | None:
         """Returns the element info"""
-        value = self._value_accessor.get_value(self, "elementInfo")
-        return BlindElementInfo(float(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "elementInfo", BlindElementInfo
+        )
 
 
 class BlindState(IntEnum):
@@ -95,44 +92,47 @@ class BlindValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        self._data_provider.subscribe(self)
+        self._data_provider.subscribe(self, "blinds")
 
     def update_status(self, status, hardware):
         if status is not None and "blinds" in status:
             blinds = status["blinds"]
+            decode = self._data_provider.get_sumstate_decoder("blinds", hardware)
+            decode_group = self._data_provider.get_sumstate_decoder(
+                "blinds", hardware, "group"
+            )
             for key in blinds:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
 
-                    if "sumstate" in blinds[key] and "value" in blinds[key]["sumstate"]:
-                        (
-                            self._data[key]["currentState"],
-                            self._data[key]["positionLevel"],
-                            self._data[key]["rotationLevel"],
-                            self._data[key]["elementInfo"],
-                            self._data[key]["rotationRange"],
-                            *_other,
-                        ) = blinds[key]["sumstate"]["value"].split(
-                            ";",
+                    if (
+                        "sumstate" in blinds[key]
+                        and "value" in blinds[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, blinds[key]["sumstate"]["value"], hardware
                         )
+                    ):
+                        self._data[key].update(decode(blinds[key]["sumstate"]["value"]))
 
                 if key.startswith("group"):
                     if key not in self._data:
                         self._data[key] = {}
 
-                    if "sumstate" in blinds[key] and "value" in blinds[key]["sumstate"]:
-                        (
-                            self._data[key]["currentState"],
-                            *_other,
-                        ) = blinds[key][
-                            "sumstate"
-                        ]["value"].split(
-                            ";",
+                    if (
+                        "sumstate" in blinds[key]
+                        and "value" in blinds[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, blinds[key]["sumstate"]["value"], hardware
+                        )
+                    ):
+                        self._data[key].update(
+                            decode_group(blinds[key]["sumstate"]["value"])
                         )
 
     def update_resources(self, resources):
         if resources is not None and "blinds" in resources:
+            self._invalidate_entities()
             blinds = resources["blinds"]
             for key in blinds:
                 if key.startswith("item"):
@@ -144,15 +144,12 @@ class BlindValueAccessor(EntityValueAccessor):
                     if key not in self._data:
                         self._data[key] = {}
                     self._data[key]["name"] = blinds[key]["name"]
+            self._evict_missing(blinds)
 
     @property
     def blinds(self):
         """Returns the blinds read from MyGekko"""
-        result: list[Blind] = []
-        for key, data in self._data.items():
-            result.append(Blind(key, data["name"], self))
-
-        return result
+        return self._get_entities(Blind)
 
     def get_features(self, blind: Blind) -> list[BlindFeature]:
         """Returns the supported features"""
@@ -180,18 +177,18 @@ class BlindValueAccessor(EntityValueAccessor):
     async def set_position(self, blind: Blind, position: float) -> None:
         """Sets the position"""
         if blind and blind.entity_id and position >= 0 and position <= 100.0:
-            await self._data_provider.write_data(
-                blind.resource_path, "P" + str(position)
+            await self._write_data(
+                blind, "P" + str(position), {"positionLevel": str(position)}
             )
 
     async def set_tilt_position(self, blind: Blind, position: float) -> None:
         """Sets the tilt position"""
         if blind and blind.entity_id and position >= 0 and position <= 100.0:
-            await self._data_provider.write_data(
-                blind.resource_path, "S" + str(position)
+            await self._write_data(
+                blind, "S" + str(position), {"rotationLevel": str(position)}
             )
 
     async def set_state(self, blind: Blind, state: BlindState) -> None:
         """Sets the state"""
         if blind and blind.entity_id:
-            await self._data_provider.write_data(blind.resource_path, str(state))
+            await self._write_data(blind, str(state), {"currentState": str(state)})
@@ -16,12 +16,11 @@ class Cam(Entity):
     ) -> None:
         super().__init__(entity_id, name, "/cams/")
         self._value_accessor = value_accessor
-        self._supported_features = self._value_accessor.get_features(self)
 
     @property
     def supported_features(self) -> list[CamFeature]:
         """Returns the supported features"""
-        return self._supported_features
+        return self._value_accessor.get_supported_features(self)
 
     @property
     def image_url(self) -> str | None:
@@ -54,28 +53,29 @@ class CamValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        self._data_provider.subscribe(self)
+        self._data_provider.subscribe(self, "cams")
 
     def update_status(self, status, hardware):
         if status is not None and "cams" in status:
             cams = status["cams"]
+            decode = self._data_provider.get_sumstate_decoder("cams", hardware)
             for key in cams:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
 
-                    if "sumstate" in cams[key] and "value" in cams[key]["sumstate"]:
-                        (
-                            self._data[key]["newRecordsAvailableState"],
-                            *_other,
-                        ) = cams[
-                            key
-                        ]["sumstate"]["value"].split(
-                            ";",
+                    if (
+                        "sumstate" in cams[key]
+                        and "value" in cams[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, cams[key]["sumstate"]["value"], hardware
                         )
+                    ):
+                        self._data[key].update(decode(cams[key]["sumstate"]["value"]))
 
     def update_resources(self, resources):
         if resources is not None and "cams" in resources:
+            self._invalidate_entities()
             cams = resources["cams"]
             for key in cams:
                 if key.startswith("item"):
@@ -84,15 +84,12 @@ class CamValueAccessor(EntityValueAccessor):
                     self._data[key]["name"] = cams[key]["name"]
                     self._data[key]["imagepath"] = cams[key].get("imagepath", None)
                     self._data[key]["streampath"] = cams[key].get("streampath", None)
+            self._evict_missing(cams)
 
     @property
     def cams(self):
         """Returns the cams read from MyGekko"""
-        result: list[Cam] = []
-        for key, data in self._data.items():
-            result.append(Cam(key, data["name"], self))
-
-        return result
+        return self._get_entities(Cam)
 
     def get_features(self, cam: Cam) -> list[CamFeature]:
         """Returns the supported features"""
@@ -18,12 +18,11 @@ class DoorInterCom(Entity):
     ) -> None:
         super().__init__(entity_id, name, "/door_intercom/")
         self._value_accessor = value_accessor
-        self._supported_features = self._value_accessor.get_features(self)
 
     @property
     def supported_features(self) -> list[DoorInterComFeature]:
         """Returns the supported features"""
-        return self._supported_features
+        return self._value_accessor.get_supported_features(self)
 
     @property
     def image_url(self) -> str | None:
@@ -38,32 +37,35 @@ class DoorInterCom(Entity):
     @property
     def sound_mode(self) -> DoorInterComSoundMode | None:
         """Returns the sound mode"""
-        value = self._value_accessor.get_value(self, "soundMode")
-        return DoorInterComSoundMode(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "soundMode", DoorInterComSoundMode
+        )
 
     @property
     def action_on_ring_state(self) -> DoorInterComActionOnRingState | None:
         """Returns the action on ring state"""
-        value = self._value_accessor.get_value(self, "actionOnRingState")
-        return DoorInterComActionOnRingState(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "actionOnRingState", DoorInterComActionOnRingState
+        )
 
     @property
     def connection_state(self) -> DoorInterComConnectionState | None:
         """Returns the connection state"""
-        value = self._value_accessor.get_value(self, "connectionState")
-        return DoorInterComConnectionState(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "connectionState", DoorInterComConnectionState
+        )
 
     @property
     def missed_calls(self) -> int | None:
         """Returns the missed calls"""
-        value = self._value_accessor.get_value(self, "missedCallsValue")
-        return int(value) if value else None
+        return self._value_accessor.get_typed_value(self, "missedCallsValue", int)
 
     @property
     def last_missed_call_date(self) -> datetime | None:
         """Returns the missed calls"""
-        value = self._value_accessor.get_value(self, "lastMissedCallDate")
-        return datetime.strptime(value, "%d.%m.%Y %H:%M:%S") if value else None
+        return self._value_accessor.get_typed_value(
+            self, "lastMissedCallDate", _parse_date
+        )
 
 
 class DoorInterComFeature(IntEnum):
@@ -116,11 +118,12 @@ class DoorInterComValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        self._data_provider.subscribe(self)
+        self._data_provider.subscribe(self, "door_intercom")
 
     def update_status(self, status, hardware):
         if status is not None and "door_intercom" in status:
             door_inter_coms = status["door_intercom"]
+            decode = self._data_provider.get_sumstate_decoder("door_intercom", hardware)
             for key in door_inter_coms:
                 if key.startswith("item"):
                     if key not in self._data:
@@ -129,20 +132,17 @@ class DoorInterComValueAccessor(EntityValueAccessor):
                     if (
                         "sumstate" in door_inter_coms[key]
                         and "value" in door_inter_coms[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, door_inter_coms[key]["sumstate"]["value"], hardware
+                        )
                     ):
-                        (
-                            self._data[key]["soundMode"],
-                            self._data[key]["actionOnRingState"],
-                            self._data[key]["connectionState"],
-                            self._data[key]["missedCallsValue"],
-                            self._data[key]["lastMissedCallDate"],
-                            *_other,
-                        ) = door_inter_coms[key]["sumstate"]["value"].split(
-                            ";",
+                        self._data[key].update(
+                            decode(door_inter_coms[key]["sumstate"]["value"])
                         )
 
     def update_resources(self, resources):
         if resources is not None and "door_intercom" in resources:
+            self._invalidate_entities()
             door_inter_coms = resources["door_intercom"]
             for key in door_inter_coms:
                 if key.startswith("item"):
@@ -155,15 +155,12 @@ class DoorInterComValueAccessor(EntityValueAccessor):
                     self._data[key]["streampath"] = door_inter_coms[key].get(
                         "streampath", None
                     )
+            self._evict_missing(door_inter_coms)
 
     @property
     def door_inter_coms(self):
         """Returns the door intercoms read from MyGekko"""
-        result: list[DoorInterCom] = []
-        for key, data in self._data.items():
-            result.append(DoorInterCom(key, data["name"], self))
-
-        return result
+        return self._get_entities(DoorInterCom)
 
     def get_features(self, door_inter_com: DoorInterCom) -> list[DoorInterComFeature]:
         """Returns the supported features"""
@@ -183,5 +180,9 @@ class DoorInterComValueAccessor(EntityValueAccessor):
         """Sends the command"""
         if door_inter_com and door_inter_com.entity_id:
             await self._data_provider.write_data(
-                door_inter_com.resource_path, str(state)
+                door_inter_com.resource_path, str(state), idempotent=False
             )
+
+
+def _parse_date(value: str) -> datetime:
+    return datetime.strptime(value, "%d.%m.%Y %H:%M:%S")
@@ -3,10 +3,14 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Callable
+from functools import lru_cache
+from typing import NamedTuple
 
 from PyMyGekko.data_provider import DataProviderBase
 from PyMyGekko.data_provider import EntityValueAccessor
 from PyMyGekko.resources import Entity
+from PyMyGekko.sumstate import get_schema
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -26,95 +30,68 @@ class EnergyCost(Entity):
         return self._value_accessor.get_data(self)
 
 
-class EnergyCostValueAccessor(EntityValueAccessor):
-    """EnergyCost value accessor"""
+class EnergyCostValue(NamedTuple):
+    """Value of an energy meter, the fields can also be read like a dict"""
 
-    def __init__(self, data_provider: DataProviderBase):
-        super().__init__()
-        self._data_provider = data_provider
-        self._data_provider.subscribe(self)
+    name: str
+    unit: str | None
+    value: float | str
 
-    def _transform_value(self, description: str, value: str) -> any:
-        m = re.match(r"([^\[]*)\[([^\]]*)\]", description)
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
+@lru_cache(maxsize=None)
+def _parse_value_descriptions(
+    value_descriptions: tuple[str, ...],
+) -> tuple[tuple[str | None, str | None, Callable[[str], float | str] | None], ...]:
+    """Parses descriptions like "actPower[kW]" once into (name, unit, converter).
 
+    Descriptions without unit are not decoded, their converter is None.
+    """
+    result = []
+    for description in value_descriptions:
+        m = re.match(r"([^\[]*)\[([^\]]*)\]", description)
         if m is None:
-            return None
+            result.append((None, None, None))
+        elif m.group(2) != "Unit" and m.group(2) != "DateTime":
+            result.append((m.group(1), m.group(2), float))
+        else:
+            result.append((m.group(1), m.group(2), str))
+    return tuple(result)
 
-        typed_value = None
 
-        unit = None if len(m.groups()) == 1 else m.group(2)
+class EnergyCostValueAccessor(EntityValueAccessor):
+    """EnergyCost value accessor"""
 
-        if unit is not None and unit != "Unit" and unit != "DateTime":
-            typed_value = float(value)
-        else:
-            typed_value = value
-
-        return {"name": m.group(1), "unit": unit, "value": typed_value}
-
-    def _decode_values(self, value: str, hardware: str) -> any:
-        value_descriptions = []
-
-        if hardware == "legacy":
-            value_descriptions = [
-                "actPower[kW]",
-                "energyToday[kWh]",
-                "energyMonth[kWh]",
-                "energySum[kWh]",
-                "powerMax[kW]",
-                "unitEnergy[Unit]",
-                "unitPower[Unit]",
-                "energyToday6[kWh]",
-                "energyToday12[kWh]",
-                "energyToday18[kWh]",
-                "energyToday24[kWh]",
-                "energyYesterd6[kWh]",
-                "energyYesterd12[kWh]",
-                "energyYesterd18[kWh]",
-                "energyYesterd24[kWh]",
-                "elementInfo",
-                "other",
-            ]
-        else:
-            value_descriptions = [
-                "actPower[kW]",
-                "energyToday[kWh]",
-                "energyMonth[kWh]",
-                "energySum[kWh]",
-                "powerMax[kW]",
-                "unitEnergy[Unit]",
-                "unitPower[Unit]",
-                "energyToday6[kWh]",
-                "energyToday12[kWh]",
-                "energyToday18[kWh]",
-                "energyToday24[kWh]",
-                "energyYesterd6[kWh]",
-                "energyYesterd12[kWh]",
-                "energyYesterd18[kWh]",
-                "energyYesterd24[kWh]",
-                "elementInfo",
-                "energyYear[kWh]",
-                "energyPeriod[kWh]",
-                "energyPeriodFrom[DateTime]",
-                "counterDirection",
-                "other",
-            ]
-        values = []
-        for index, value_parts in enumerate(value.split(";")):
-            if index < len(value_descriptions):
-                values.append(
-                    self._transform_value(value_descriptions[index], value_parts)
-                )
-            else:
-                _LOGGER.info(
-                    "OutOfBounds access for value %s. Not all energy_costs value are read currently.",
-                    value,
-                )
-
-        return values
+    def __init__(self, data_provider: DataProviderBase):
+        super().__init__()
+        self._data_provider = data_provider
+        self._data_provider.subscribe(self, "energycosts")
+
+    def _decode_values(
+        self, value: str, value_descriptions: tuple[tuple, ...]
+    ) -> list[EnergyCostValue | None]:
+        value_parts = value.split(";")
+        if len(value_parts) > len(value_descriptions):
+            _LOGGER.info(
+                "OutOfBounds access for value %s. Not all energy_costs value are read currently.",
+                value,
+            )
+
+        return [
+            EnergyCostValue(name, unit, converter(part)) if converter else None
+            for (name, unit, converter), part in zip(value_descriptions, value_parts)
+        ]
 
     def update_status(self, status, hardware):
         if status is not None and "energycosts" in status:
             energy_costs = status["energycosts"]
+            value_descriptions = _parse_value_descriptions(
+                get_schema("energycosts", hardware)
+            )
 
             _LOGGER.debug("EnergyCosts update_status %s", energy_costs)
 
@@ -126,13 +103,17 @@ class EnergyCostValueAccessor(EntityValueAccessor):
                     if (
                         "sumstate" in energy_costs[key]
                         and "value" in energy_costs[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, energy_costs[key]["sumstate"]["value"], hardware
+                        )
                     ):
                         self._data[key]["values"] = self._decode_values(
-                            energy_costs[key]["sumstate"]["value"], hardware
+                            energy_costs[key]["sumstate"]["value"], value_descriptions
                         )
 
     def update_resources(self, resources):
         if resources is not None and "energycosts" in resources:
+            self._invalidate_entities()
             energy_costs = resources["energycosts"]
 
             _LOGGER.debug("EnergyCosts update_resources %s", energy_costs)
@@ -142,15 +123,12 @@ class EnergyCostValueAccessor(EntityValueAccessor):
                     if key not in self._data:
                         self._data[key] = {}
                     self._data[key]["name"] = energy_costs[key]["name"]
+            self._evict_missing(energy_costs)
 
     @property
     def energy_costs(self):
         """Returns the energyCosts read from MyGekko"""
-        result: list[EnergyCost] = []
-        for key, data in self._data.items():
-            result.append(EnergyCost(key, data["name"], self))
-
-        return result
+        return self._get_entities(EnergyCost)
 
     def get_data(self, energy_meter: EnergyCost) -> dict[str, any] | None:
         """Returns the data of the given energy meter"""
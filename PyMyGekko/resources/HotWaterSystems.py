@@ -16,18 +16,16 @@ class HotWaterSystem(Entity):
     ) -> None:
         super().__init__(entity_id, name, "/hotwater_systems/")
         self._value_accessor = value_accessor
-        self._supported_features = self._value_accessor.get_features(self)
 
     @property
     def supported_features(self) -> list[HotWaterSystemFeature]:
         """Returns the supported features"""
-        return self._supported_features
+        return self._value_accessor.get_supported_features(self)
 
     @property
     def state(self) -> HotWaterSystemState | None:
         """Return the current state"""
-        value = self._value_accessor.get_value(self, "state")
-        return HotWaterSystemState(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "state", HotWaterSystemState)
 
     async def set_state(self, state: HotWaterSystemState):
         """Sets the state"""
@@ -36,8 +34,7 @@ class HotWaterSystem(Entity):
     @property
     def target_temperature(self) -> float | None:
         """Return the current target temperature"""
-        value = self._value_accessor.get_value(self, "setpointTemp")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "setpointTemp", float)
 
     async def set_target_temperature(self, target_temperature: float):
         """Sets the target temperature"""
@@ -46,14 +43,12 @@ class HotWaterSystem(Entity):
     @property
     def current_temperature_top(self) -> float | None:
         """Return the current top temperature"""
-        value = self._value_accessor.get_value(self, "topTemp")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "topTemp", float)
 
     @property
     def current_temperature_bottom(self) -> float | None:
         """Return the current bottom temperature"""
-        value = self._value_accessor.get_value(self, "bottomTemp")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "bottomTemp", float)
 
 
 class HotWaterSystemState(IntEnum):
@@ -78,11 +73,14 @@ class HotWaterSystemValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        data_provider.subscribe(self)
+        data_provider.subscribe(self, "hotwater_systems")
 
     def update_status(self, status, hardware):
         if status is not None and "hotwater_systems" in status:
             hotwater_systems = status["hotwater_systems"]
+            decode = self._data_provider.get_sumstate_decoder(
+                "hotwater_systems", hardware
+            )
             for key in hotwater_systems:
                 if key.startswith("item"):
                     if key not in self._data:
@@ -91,36 +89,29 @@ class HotWaterSystemValueAccessor(EntityValueAccessor):
                     if (
                         "sumstate" in hotwater_systems[key]
                         and "value" in hotwater_systems[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, hotwater_systems[key]["sumstate"]["value"], hardware
+                        )
                     ):
-                        (
-                            self._data[key]["type"],
-                            self._data[key]["cooling"],
-                            self._data[key]["setpointTemp"],
-                            self._data[key]["topTemp"],
-                            self._data[key]["bottomTemp"],
-                            self._data[key]["collectorTemp"],
-                            self._data[key]["state"],
-                            self._data[key]["sum"],
-                            *_other,
-                        ) = hotwater_systems[key]["sumstate"]["value"].split(";")
+                        self._data[key].update(
+                            decode(hotwater_systems[key]["sumstate"]["value"])
+                        )
 
     def update_resources(self, resources):
         if resources is not None and "hotwater_systems" in resources:
+            self._invalidate_entities()
             hotwater_systems = resources["hotwater_systems"]
             for key in hotwater_systems:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
                     self._data[key]["name"] = hotwater_systems[key]["name"]
+            self._evict_missing(hotwater_systems)
 
     @property
     def hotwater_systems(self):
         """Returns the hotwater_systems read from MyGekko"""
-        result: list[HotWaterSystem] = []
-        for key, data in self._data.items():
-            result.append(HotWaterSystem(key, data["name"], self))
-
-        return result
+        return self._get_entities(HotWaterSystem)
 
     def get_features(
         self, hotwater_system: HotWaterSystem
@@ -147,15 +138,15 @@ class HotWaterSystemValueAccessor(EntityValueAccessor):
     ) -> None:
         """Sets the state"""
         if hotwater_system and hotwater_system.entity_id:
-            await self._data_provider.write_data(
-                hotwater_system.resource_path, str(state)
-            )
+            await self._write_data(hotwater_system, str(state), {"state": str(state)})
 
     async def set_target_temperature(
         self, hotwater_system: HotWaterSystem, target_temperature: float
     ) -> None:
         """Sets the target temperature"""
         if hotwater_system and hotwater_system.entity_id:
-            await self._data_provider.write_data(
-                hotwater_system.resource_path, "T" + str(target_temperature)
+            await self._write_data(
+                hotwater_system,
+                "T" + str(target_temperature),
+                {"setpointTemp": str(target_temperature)},
             )
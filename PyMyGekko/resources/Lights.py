@@ -17,18 +17,16 @@ class Light(Entity):
     ) -> None:
         super().__init__(entity_id, name, "/lights/")
         self._value_accessor = value_accessor
-        self._supported_features = self._value_accessor.get_features(self)
 
     @property
     def supported_features(self) -> list[LightFeature]:
         """Returns the supported features"""
-        return self._supported_features
+        return self._value_accessor.get_supported_features(self)
 
     @property
     def state(self) -> LightState | None:
         """Returns the current state"""
-        value = self._value_accessor.get_value(self, "currentState")
-        return LightState(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "currentState", LightState)
 
     async def set_state(self, state: LightState):
         """Sets the state"""
@@ -37,8 +35,7 @@ class Light(Entity):
     @property
     def brightness(self) -> int | None:
         """Returns the current brightness"""
-        value = self._value_accessor.get_value(self, "dimLevel")
-        return ceil(float(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "dimLevel", _to_brightness)
 
     async def set_brightness(self, brightness: int):
         """Sets the brightness"""
@@ -47,8 +44,7 @@ class Light(Entity):
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Returns the current rgb color"""
-        value = self._value_accessor.get_value(self, "rgbColor")
-        return ColorUtilities.decimal_to_rgb(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "rgbColor", _to_rgb_color)
 
     async def set_rgb_color(self, rgb_color: tuple[int, int, int]):
         """Sets the rgb value"""
@@ -76,42 +72,47 @@ class LightValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        data_provider.subscribe(self)
+        data_provider.subscribe(self, "lights")
 
     def update_status(self, status, hardware):
         if status is not None and "lights" in status:
             lights = status["lights"]
+            decode = self._data_provider.get_sumstate_decoder("lights", hardware)
+            decode_group = self._data_provider.get_sumstate_decoder(
+                "lights", hardware, "group"
+            )
             for key in lights:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
 
-                    if "sumstate" in lights[key] and "value" in lights[key]["sumstate"]:
-                        (
-                            self._data[key]["currentState"],
-                            self._data[key]["dimLevel"],
-                            self._data[key]["rgbColor"],
-                            self._data[key]["tunableWhiteLevel"],
-                            self._data[key]["elementInfo"],
-                            *_other,
-                        ) = lights[key]["sumstate"]["value"].split(";")
+                    if (
+                        "sumstate" in lights[key]
+                        and "value" in lights[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, lights[key]["sumstate"]["value"], hardware
+                        )
+                    ):
+                        self._data[key].update(decode(lights[key]["sumstate"]["value"]))
 
                 if key.startswith("group"):
                     if key not in self._data:
                         self._data[key] = {}
 
-                    if "sumstate" in lights[key] and "value" in lights[key]["sumstate"]:
-                        (
-                            self._data[key]["currentState"],
-                            *_other,
-                        ) = lights[key][
-                            "sumstate"
-                        ]["value"].split(
-                            ";",
+                    if (
+                        "sumstate" in lights[key]
+                        and "value" in lights[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, lights[key]["sumstate"]["value"], hardware
+                        )
+                    ):
+                        self._data[key].update(
+                            decode_group(lights[key]["sumstate"]["value"])
                         )
 
     def update_resources(self, resources):
         if resources is not None and "lights" in resources:
+            self._invalidate_entities()
             lights = resources["lights"]
             for key in lights:
                 if key.startswith("item"):
@@ -123,15 +124,12 @@ class LightValueAccessor(EntityValueAccessor):
                     if key not in self._data:
                         self._data[key] = {}
                     self._data[key]["name"] = lights[key]["name"]
+            self._evict_missing(lights)
 
     @property
     def lights(self):
         """Returns the lights read from MyGekko"""
-        result: list[Light] = []
-        for key, data in self._data.items():
-            result.append(Light(key, data["name"], self))
-
-        return result
+        return self._get_entities(Light)
 
     def get_features(self, light: Light) -> list[LightFeature]:
         """Returns the supported features"""
@@ -160,13 +158,13 @@ class LightValueAccessor(EntityValueAccessor):
     async def set_state(self, light: Light, state: LightState) -> None:
         """Sets the state"""
         if light and light.entity_id:
-            await self._data_provider.write_data(light.resource_path, str(state))
+            await self._write_data(light, str(state), {"currentState": str(state)})
 
     async def set_brightness(self, light: Light, brightness: int) -> None:
         """Sets the brightness"""
         if light and light.entity_id and brightness >= 0 and brightness <= 100:
-            await self._data_provider.write_data(
-                light.resource_path, "D" + str(brightness)
+            await self._write_data(
+                light, "D" + str(brightness), {"dimLevel": str(brightness)}
             )
 
     async def set_rgb_color(
@@ -186,11 +184,21 @@ class LightValueAccessor(EntityValueAccessor):
             decimal_rbg_color = (
                 (rgb_color[0] << 16) + (rgb_color[1] << 8) + rgb_color[2]
             )
-            await self._data_provider.write_data(
-                light.resource_path, "C" + str(decimal_rbg_color)
+            await self._write_data(
+                light,
+                "C" + str(decimal_rbg_color),
+                {"rgbColor": str(decimal_rbg_color)},
             )
 
 
+def _to_brightness(value: str) -> int:
+    return ceil(float(value))
+
+
+def _to_rgb_color(value: str) -> tuple[int, int, int]:
+    return ColorUtilities.decimal_to_rgb(int(value))
+
+
 class ColorUtilities:
     """Color Utility class"""
 
@@ -16,18 +16,16 @@ class Load(Entity):
     ) -> None:
         super().__init__(entity_id, name, "/loads/")
         self._value_accessor = value_accessor
-        self._supported_features = self._value_accessor.get_features(self)
 
     @property
     def supported_features(self) -> list[LoadFeature]:
         """Returns the supported features"""
-        return self._supported_features
+        return self._value_accessor.get_supported_features(self)
 
     @property
     def state(self) -> LoadState | None:
         """Returns the current state"""
-        value = self._value_accessor.get_value(self, "currentState")
-        return LoadState(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "currentState", LoadState)
 
     async def set_state(self, state: LoadState):
         """Sets the state"""
@@ -54,40 +52,41 @@ class LoadValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        data_provider.subscribe(self)
+        data_provider.subscribe(self, "loads")
 
     def update_status(self, status, hardware):
         if status is not None and "loads" in status:
             loads = status["loads"]
+            decode = self._data_provider.get_sumstate_decoder("loads", hardware)
             for key in loads:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
 
-                    if "sumstate" in loads[key] and "value" in loads[key]["sumstate"]:
-                        (
-                            self._data[key]["currentState"],
-                            self._data[key]["elementInfo"],
-                            *_other,
-                        ) = loads[key]["sumstate"]["value"].split(";")
+                    if (
+                        "sumstate" in loads[key]
+                        and "value" in loads[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, loads[key]["sumstate"]["value"], hardware
+                        )
+                    ):
+                        self._data[key].update(decode(loads[key]["sumstate"]["value"]))
 
     def update_resources(self, resources):
         if resources is not None and "loads" in resources:
+            self._invalidate_entities()
             loads = resources["loads"]
             for key in loads:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
                     self._data[key]["name"] = loads[key]["name"]
+            self._evict_missing(loads)
 
     @property
     def loads(self):
         """Returns the loads read from MyGekko"""
-        result: list[Load] = []
-        for key, data in self._data.items():
-            result.append(Load(key, data["name"], self))
-
-        return result
+        return self._get_entities(Load)
 
     def get_features(self, load: Load) -> list[LoadFeature]:
         """Returns the supported features"""
@@ -103,4 +102,4 @@ class LoadValueAccessor(EntityValueAccessor):
     async def set_state(self, load: Load, state: LoadState) -> None:
         """Sets the state"""
         if load and load.entity_id:
-            await self._data_provider.write_data(load.resource_path, str(state))
+            await self._write_data(load, str(state), {"currentState": str(state)})
@@ -32,23 +32,40 @@ class MeteoValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        self._data_provider.subscribe(self)
+        self._data_provider.subscribe(self, "globals")
 
     def update_status(self, status, hardware):
         meteo = status.get("globals", {}).get("meteo", {})
+        # the meteo data is a single entity, so its sensors are compared directly
+        self._previous_values.setdefault("meteo", dict(self._data))
         for key, value in meteo.items():
             if "value" in value:
                 self._data[key] = value["value"]
             else:
                 self._data.setdefault(key, {})
 
+    def pop_changes(self) -> dict[str, dict[str, tuple]]:
+        changes = {}
+        if "meteo" in self._previous_values:
+            previous_values = self._previous_values.pop("meteo")
+            changed_values = {
+                key: (previous_values.get(key), value)
+                for key, value in self._data.items()
+                if previous_values.get(key) != value
+            }
+            if changed_values:
+                changes["meteo"] = changed_values
+        return changes
+
     def update_resources(self, resources):
         """Nothing to do here since Meteo data is in status and no additional resources are available"""
 
     @property
     def meteo(self):
         """Returns the meteo read from MyGekko"""
-        return Meteo("meteo", "Weather", self)
+        if "meteo" not in self._entities:
+            self._entities["meteo"] = Meteo("meteo", "Weather", self)
+        return self._entities["meteo"]
 
     def get_data(self, meteo: Meteo) -> dict[str, Any]:
         """Returns the data of the given meteo"""
@@ -16,18 +16,16 @@ class RoomTemp(Entity):
     ) -> None:
         super().__init__(entity_id, name, "/roomtemps/")
         self._value_accessor = value_accessor
-        self._supported_features = self._value_accessor.get_features(self)
 
     @property
     def supported_features(self) -> list[RoomTempsFeature]:
         """Returns the supported features"""
-        return self._supported_features
+        return self._value_accessor.get_supported_features(self)
 
     @property
     def working_mode(self) -> RoomTempsMode | None:
         """ "Returns the current working mode"""
-        value = self._value_accessor.get_value(self, "workingMode")
-        return RoomTempsMode(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "workingMode", RoomTempsMode)
 
     async def set_working_mode(self, working_mode: RoomTempsMode):
         """Sets the working mode"""
@@ -36,14 +34,14 @@ class RoomTemp(Entity):
     @property
     def current_temperature(self) -> float | None:
         """Returns the current  temperature"""
-        value = self._value_accessor.get_value(self, "temperatureValue")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "temperatureValue", float)
 
     @property
     def target_temperature(self) -> float | None:
         """Returns the current target temperature"""
-        value = self._value_accessor.get_value(self, "temperatureSetPointValue")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "temperatureSetPointValue", float
+        )
 
     async def set_target_temperature(self, target_temperature: float):
         """Sets the target temperature"""
@@ -52,14 +50,14 @@ class RoomTemp(Entity):
     @property
     def humidity(self) -> float | None:
         """Returns the current humidity"""
-        value = self._value_accessor.get_value(self, "relativeHumidityLevel")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "relativeHumidityLevel", float
+        )
 
     @property
     def air_quality(self) -> float | None:
         """Returns the current air quality"""
-        value = self._value_accessor.get_value(self, "airQualityLevel")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "airQualityLevel", float)
 
 
 class RoomTempsMode(IntEnum):
@@ -86,11 +84,12 @@ class RoomTempsValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        self._data_provider.subscribe(self)
+        self._data_provider.subscribe(self, "roomtemps")
 
     def update_status(self, status, hardware):
         if status is not None and "roomtemps" in status:
             room_temps = status["roomtemps"]
+            decode = self._data_provider.get_sumstate_decoder("roomtemps", hardware)
             for key in room_temps:
                 if key.startswith("item"):
                     if key not in self._data:
@@ -99,58 +98,29 @@ class RoomTempsValueAccessor(EntityValueAccessor):
                     if (
                         "sumstate" in room_temps[key]
                         and "value" in room_temps[key]["sumstate"]
-                    ):
-                        self.read_value(
+                        and self._sumstate_changed(
                             key, room_temps[key]["sumstate"]["value"], hardware
                         )
-
-    def read_value(self, key, value, hardware):
-        """Reads a value based on the given hardware."""
-        if hardware == "legacy":
-            (
-                self._data[key]["temperatureValue"],
-                self._data[key]["temperatureSetPointValue"],
-                self._data[key]["valveOpeningLevel"],
-                self._data[key]["workingMode"],
-                self._data[key]["Reserved"],
-                self._data[key]["temperatureAdjustmentValue"],
-                self._data[key]["coolingModeState"],
-                self._data[key]["elementInfo"],
-                *_other,
-            ) = value.split(";")
-        else:
-            (
-                self._data[key]["temperatureValue"],
-                self._data[key]["temperatureSetPointValue"],
-                self._data[key]["valveOpeningLevel"],
-                self._data[key]["workingMode"],
-                self._data[key]["Reserved"],
-                self._data[key]["temperatureAdjustmentValue"],
-                self._data[key]["coolingModeState"],
-                self._data[key]["elementInfo"],
-                self._data[key]["relativeHumidityLevel"],
-                self._data[key]["airQualityLevel"],
-                self._data[key]["floorTemperatureValue"],
-                *_other,
-            ) = value.split(";")
+                    ):
+                        self._data[key].update(
+                            decode(room_temps[key]["sumstate"]["value"])
+                        )
 
     def update_resources(self, resources):
         if resources is not None and "roomtemps" in resources:
+            self._invalidate_entities()
             room_temps = resources["roomtemps"]
             for key in room_temps:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
                     self._data[key]["name"] = room_temps[key]["name"]
+            self._evict_missing(room_temps)
 
     @property
     def room_temps(self):
         """Returns the loads read from MyGekko"""
-        result: list[RoomTemp] = []
-        for key, data in self._data.items():
-            result.append(RoomTemp(key, data["name"], self))
-
-        return result
+        return self._get_entities(RoomTemp)
 
     def get_features(self, room_temp: RoomTemp) -> list[RoomTempsFeature]:
         """Returns the supported features"""
@@ -178,8 +148,10 @@ class RoomTempsValueAccessor(EntityValueAccessor):
     ) -> None:
         """Sets the target temperature"""
         if room_temp and room_temp.entity_id:
-            await self._data_provider.write_data(
-                room_temp.resource_path, "S" + str(target_temperature)
+            await self._write_data(
+                room_temp,
+                "S" + str(target_temperature),
+                {"temperatureSetPointValue": str(target_temperature)},
             )
 
     async def set_working_mode(
@@ -187,6 +159,6 @@ class RoomTempsValueAccessor(EntityValueAccessor):
     ) -> None:
         """Sets the working mode"""
         if room_temp and room_temp.entity_id:
-            await self._data_provider.write_data(
-                room_temp.resource_path, "M" + str(working_mode)
+            await self._write_data(
+                room_temp, "M" + str(working_mode), {"workingMode": str(working_mode)}
             )
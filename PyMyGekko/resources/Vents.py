@@ -16,30 +16,32 @@ class Vent(Entity):
     ) -> None:
         super().__init__(entity_id, name, "/vents/")
         self._value_accessor = value_accessor
-        self._supported_features = self._value_accessor.get_features(self)
 
     @property
     def supported_features(self) -> list[VentFeature]:
         """Returns the supported features"""
-        return self._supported_features
+        return self._value_accessor.get_supported_features(self)
 
     @property
     def element_info(self) -> VentElementInfo | None:
         """Returns the element info"""
-        value = self._value_accessor.get_value(self, "elementInfo")
-        return VentElementInfo(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "elementInfo", VentElementInfo
+        )
 
     @property
     def working_level(self) -> VentWorkingLevel | None:
         """Returns the current working level"""
-        value = self._value_accessor.get_value(self, "workingLevel")
-        return VentWorkingLevel(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "workingLevel", VentWorkingLevel
+        )
 
     @property
     def maximum_working_level(self) -> VentWorkingLevel | None:
         """Returns the maximum working level"""
-        value = self._value_accessor.get_value(self, "maximumWorkingLevel")
-        return VentWorkingLevel(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "maximumWorkingLevel", VentWorkingLevel
+        )
 
     async def set_working_level(self, working_level: VentWorkingLevel):
         """Sets the working level"""
@@ -48,68 +50,75 @@ class Vent(Entity):
     @property
     def device_model(self) -> VentDeviceModel | None:
         """Returns the device_model"""
-        value = self._value_accessor.get_value(self, "deviceModel")
-        return VentDeviceModel(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "deviceModel", VentDeviceModel
+        )
 
     @property
     def relative_humidity(self) -> float | None:
         """Returns the relative humidity"""
-        value = self._value_accessor.get_value(self, "relativeHumidityLevel")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "relativeHumidityLevel", float
+        )
 
     @property
     def air_quality(self) -> float | None:
         """Returns the air quality"""
-        value = self._value_accessor.get_value(self, "airQualityLevel")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "airQualityLevel", float)
 
     @property
     def co2(self) -> float | None:
         """Returns the co2 level"""
-        value = self._value_accessor.get_value(self, "co2Value")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "co2Value", float)
 
     @property
     def supply_air_temperature(self) -> float | None:
         """Returns the supply air temperature"""
-        value = self._value_accessor.get_value(self, "supplyAirTemperatureValue")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "supplyAirTemperatureValue", float
+        )
 
     @property
     def exhaust_air_temperature(self) -> float | None:
         """Returns the exhaust air temperature"""
-        value = self._value_accessor.get_value(self, "exhaustAirTemperatureValue")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "exhaustAirTemperatureValue", float
+        )
 
     @property
     def outside_air_temperature(self) -> float | None:
         """Returns the outside air temperature"""
-        value = self._value_accessor.get_value(self, "outsideAirTemperatureValue")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "outsideAirTemperatureValue", float
+        )
 
     @property
     def outgoing_air_temperature(self) -> float | None:
         """Returns the outgoing air temperature"""
-        value = self._value_accessor.get_value(self, "outgoingAirTemperatureValue")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "outgoingAirTemperatureValue", float
+        )
 
     @property
     def supply_air_working_level(self) -> float | None:
         """Returns the supply air working level"""
-        value = self._value_accessor.get_value(self, "supplyAirWorkingLevel")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "supplyAirWorkingLevel", float
+        )
 
     @property
     def exhaust_air_working_level(self) -> float | None:
         """Returns the exhaust air working level"""
-        value = self._value_accessor.get_value(self, "exhaustAirWorkingLevel")
-        return float(value) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "exhaustAirWorkingLevel", float
+        )
 
     @property
     def cooling_mode(self) -> VentCoolingMode | None:
         """Returns the cooling mode"""
-        value = self._value_accessor.get_value(self, "coolingModeState")
-        return VentCoolingMode(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "coolingModeState", VentCoolingMode
+        )
 
     async def set_cooling_mode(self, cooling_mode: VentCoolingMode):
         """Sets the cooling mode"""
@@ -118,8 +127,9 @@ class Vent(Entity):
     @property
     def dehumid_mode(self) -> VentDehumidMode | None:
         """Returns the dehumid mode"""
-        value = self._value_accessor.get_value(self, "dehumidModeState")
-        return VentDehumidMode(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "dehumidModeState", VentDehumidMode
+        )
 
     async def set_dehumid_mode(self, dehumid_mode: VentDehumidMode):
         """Sets the dehumid mode"""
@@ -128,14 +138,14 @@ class Vent(Entity):
     @property
     def bypass_mode(self) -> VentBypassMode | None:
         """Returns the bypass mode"""
-        value = self._value_accessor.get_value(self, "bypassMode")
-        return VentBypassMode(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(self, "bypassMode", VentBypassMode)
 
     @property
     def bypass_state(self) -> VentBypassState | None:
         """Returns the bypass state"""
-        value = self._value_accessor.get_value(self, "bypassState")
-        return VentBypassState(int(value)) if value is not None else None
+        return self._value_accessor.get_typed_value(
+            self, "bypassState", VentBypassState
+        )
 
     async def set_bypass_state(self, bypass_state: VentBypassState):
         """Sets the bypass state"""
@@ -144,14 +154,14 @@ class Vent(Entity):
     @property
     def working_mode(self) -> VentWorkingMode | VentWorkingModeZimmermann | None:
         """Returns the working mode"""
-        value = self._value_accessor.get_value(self, "workingMode")
         if self.device_model in [
             VentDeviceModel.ZIMMERMANN_V1,
             VentDeviceModel.ZIMMERMANN_V2,
         ]:
-            return VentWorkingModeZimmermann(int(value)) if value is not None else None
+            working_mode = VentWorkingModeZimmermann
         else:
-            return VentWorkingMode(int(value)) if value is not None else None
+            working_mode = VentWorkingMode
+        return self._value_accessor.get_typed_value(self, "workingMode", working_mode)
 
     async def set_working_mode(
         self, working_mode: VentWorkingMode | VentWorkingModeZimmermann
@@ -164,16 +174,16 @@ class Vent(Entity):
         self,
     ) -> VentSubWorkingMode | VentSubWorkingModeZimmermann | None:
         """Returns the mode"""
-        value = self._value_accessor.get_value(self, "subWorkingMode")
         if self.device_model in [
             VentDeviceModel.ZIMMERMANN_V1,
             VentDeviceModel.ZIMMERMANN_V2,
         ]:
-            return (
-                VentSubWorkingModeZimmermann(int(value)) if value is not None else None
-            )
+            sub_working_mode = VentSubWorkingModeZimmermann
         else:
-            return VentSubWorkingMode(int(value)) if value is not None else None
+            sub_working_mode = VentSubWorkingMode
+        return self._value_accessor.get_typed_value(
+            self, "subWorkingMode", sub_working_mode
+        )
 
 
 class VentWorkingMode(IntEnum):
@@ -286,85 +296,41 @@ class VentValueAccessor(EntityValueAccessor):
     def __init__(self, data_provider: DataProviderBase):
         super().__init__()
         self._data_provider = data_provider
-        self._data_provider.subscribe(self)
+        self._data_provider.subscribe(self, "vents")
 
     def update_status(self, status, hardware):
         if status is not None and "vents" in status:
             vents = status["vents"]
+            decode = self._data_provider.get_sumstate_decoder("vents", hardware)
             for key in vents:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
 
-                    if "sumstate" in vents[key] and "value" in vents[key]["sumstate"]:
-                        self.read_value(key, vents[key]["sumstate"]["value"], hardware)
-
-    def read_value(self, key, value, hardware):
-        """Reads a value based on the given hardware."""
-        if hardware == "legacy":
-            (
-                self._data[key]["workingLevel"],
-                self._data[key]["deviceModel"],
-                self._data[key]["workingMode"],
-                self._data[key]["bypassState"],
-                self._data[key]["maximumWorkingLevel"],
-                self._data[key]["relativeHumidityLevel"],
-                self._data[key]["co2Value"],
-                self._data[key]["airQualityLevel"],
-                self._data[key]["supplyAirTemperatureValue"],
-                self._data[key]["exhaustAirTemperatureValue"],
-                self._data[key]["outsideAirTemperatureValue"],
-                self._data[key]["outgoingAirTemperatureValue"],
-                self._data[key]["supplyAirWorkingLevel"],
-                self._data[key]["exhaustAirWorkingLevel"],
-                self._data[key]["elementInfo"],
-                *_other,
-            ) = value.split(
-                ";",
-            )
-        else:
-            (
-                self._data[key]["workingLevel"],
-                self._data[key]["deviceModel"],
-                self._data[key]["workingMode"],
-                self._data[key]["bypassState"],
-                self._data[key]["maximumWorkingLevel"],
-                self._data[key]["relativeHumidityLevel"],
-                self._data[key]["airQualityLevel"],
-                self._data[key]["co2Value"],
-                self._data[key]["supplyAirTemperatureValue"],
-                self._data[key]["exhaustAirTemperatureValue"],
-                self._data[key]["outsideAirTemperatureValue"],
-                self._data[key]["outgoingAirTemperatureValue"],
-                self._data[key]["supplyAirWorkingLevel"],
-                self._data[key]["exhaustAirWorkingLevel"],
-                self._data[key]["elementInfo"],
-                self._data[key]["subWorkingMode"],
-                self._data[key]["coolingModeState"],
-                self._data[key]["dehumidModeState"],
-                self._data[key]["bypassMode"],
-                *_other,
-            ) = value.split(
-                ";",
-            )
+                    if (
+                        "sumstate" in vents[key]
+                        and "value" in vents[key]["sumstate"]
+                        and self._sumstate_changed(
+                            key, vents[key]["sumstate"]["value"], hardware
+                        )
+                    ):
+                        self._data[key].update(decode(vents[key]["sumstate"]["value"]))
 
     def update_resources(self, resources):
         if resources is not None and "vents" in resources:
+            self._invalidate_entities()
             vents = resources["vents"]
             for key in vents:
                 if key.startswith("item"):
                     if key not in self._data:
                         self._data[key] = {}
                     self._data[key]["name"] = vents[key]["name"]
+            self._evict_missing(vents)
 
     @property
     def vents(self):
         """Returns the vents read from MyGekko"""
-        result: list[Vent] = []
-        for key, data in self._data.items():
-            result.append(Vent(key, data["name"], self))
-
-        return result
+        return self._get_entities(Vent)
 
     def get_features(self, vent: Vent) -> list[VentFeature]:
         """Returns the supported features of the given vent"""
@@ -388,30 +354,31 @@ class VentValueAccessor(EntityValueAccessor):
         self, vent: Vent, working_level: VentWorkingLevel
     ) -> None:
         """Sets the working level, OFF is sent as -1"""
-        await self._data_provider.write_data(
-            vent.resource_path,
+        await self._write_data(
+            vent,
             str(working_level if working_level is not VentWorkingLevel.OFF else -1),
+            {"workingLevel": str(working_level)},
         )
 
     async def set_bypass_state(self, vent: Vent, bypass_state: VentBypassState) -> None:
         """Sets the bypass state"""
         if vent and vent.entity_id:
-            await self._data_provider.write_data(
-                vent.resource_path, "BY" + str(bypass_state)
+            await self._write_data(
+                vent, "BY" + str(bypass_state), {"bypassState": str(bypass_state)}
             )
 
     async def set_cooling_mode(self, vent: Vent, cooling_mode: VentCoolingMode) -> None:
         """Sets the cooling mode"""
         if vent and vent.entity_id:
-            await self._data_provider.write_data(
-                vent.resource_path, "C" + str(cooling_mode)
+            await self._write_data(
+                vent, "C" + str(cooling_mode), {"coolingModeState": str(cooling_mode)}
             )
 
     async def set_dehumid_mode(self, vent: Vent, dehumid_mode: VentDehumidMode) -> None:
         """Sets the dehumid mode"""
         if vent and vent.entity_id:
-            await self._data_provider.write_data(
-                vent.resource_path, "D" + str(dehumid_mode)
+            await self._write_data(
+                vent, "D" + str(dehumid_mode), {"dehumidModeState": str(dehumid_mode)}
             )
 
     async def set_working_mode(
@@ -421,6 +388,6 @@ class VentValueAccessor(EntityValueAccessor):
     ) -> None:
         """Sets the working mode"""
         if vent and vent.entity_id:
-            await self._data_provider.write_data(
-                vent.resource_path, "M" + str(working_mode)
+            await self._write_data(
+                vent, "M" + str(working_mode), {"workingMode": str(working_mode)}
             )
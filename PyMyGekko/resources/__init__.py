@@ -1,6 +1,24 @@
 # SPDX-FileCopyrightText: 2023-present Stephan Uhle <stephanu@gmx.net>
 #
 # SPDX-License-Identifier: MIT
+from collections.abc import Callable
+from typing import Any
+from typing import NamedTuple
+
+
+class EntityChange(NamedTuple):
+    """Changed values of an entity, mapping each value name to its old and new value.
+
+    The entity of a change with removed set is gone, its new values are None.
+    """
+
+    category: str
+    entity_id: str
+    changes: dict[str, tuple[Any, Any]]
+    removed: bool = False
+
+
+ChangeListener = Callable[[EntityChange], None]
 
 
 class ReadOnlyEntity:
@@ -10,6 +28,13 @@ class ReadOnlyEntity:
         self.entity_id = entity_id
         self.name = name
 
+    def add_listener(self, callback: ChangeListener) -> Callable[[], None]:
+        """Adds a listener called when values of this entity change.
+
+        Returns a function removing the listener again.
+        """
+        return self._value_accessor.add_listener(self, callback)
+
 
 class Entity(ReadOnlyEntity):
     """Base class for MyGekko entities"""
@@ -22,3 +47,7 @@ class Entity(ReadOnlyEntity):
     def resource_path(self) -> str:
         """Returns the resource path of this entity"""
         return self._resource_path
+
+    async def refresh(self) -> None:
+        """Reads the current status of this entity from MyGekko"""
+        await self._value_accessor.refresh(self)
@@ -0,0 +1,74 @@
+"""Retry policy for failed MyGekko API requests"""
+from __future__ import annotations
+
+import random
+import time
+from datetime import datetime
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """Retry policy with exponential backoff and full jitter.
+
+    Requests answered with 429 (too many requests), 444 (no response) or a 5xx status
+    are retried up to max_attempts in total. The delay before a retry is drawn from
+    [0, min(max_delay, base_delay * 2 ** retry)], unless the response has a
+    Retry-After header, which is honored. No retry is started which would end after
+    the deadline, counted from the first attempt.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        deadline: float | None = 30.0,
+        retry_writes: bool = True,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts has to be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_writes = retry_writes
+
+    def should_retry(self, response_status: int) -> bool:
+        """Returns whether a request answered with the given status may be retried"""
+        return response_status in (429, 444) or 500 <= response_status < 600
+
+    def get_delay(self, retry: int, retry_after: str | None = None) -> float:
+        """Returns the delay in seconds before the given retry (starting with 0)"""
+        retry_after_delay = self._parse_retry_after(retry_after)
+        if retry_after_delay is not None:
+            return retry_after_delay
+
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+    def get_deadline(self) -> float | None:
+        """Returns the monotonic time until which retries may be done"""
+        if self.deadline is None:
+            return None
+        return time.monotonic() + self.deadline
+
+    @staticmethod
+    def _parse_retry_after(retry_after: str | None) -> float | None:
+        """Parses the Retry-After header, given as seconds or as http date"""
+        if not retry_after:
+            return None
+
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
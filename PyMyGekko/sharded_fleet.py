@@ -0,0 +1,322 @@
+"""Fleet of MyGekko api clients sharded across processes"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import traceback
+from collections.abc import Callable
+from collections.abc import Mapping
+from queue import Empty
+from typing import Any
+
+from . import CATEGORIES
+from . import MyGekkoApiClientBase
+from .fleet import GekkoStats
+from .fleet import MyGekkoFleet
+from .resources import EntityChange
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# kinds of the messages sent from the shard processes to the coordinator
+_CHANGES = "changes"
+_NAMES = "names"
+_STATS = "stats"
+_ERROR = "error"
+
+ShardChangeListener = Callable[[str, EntityChange], None]
+
+
+class ShardedFleet:
+    """Clients of many gekkos polled by a pool of processes, used with async with.
+
+    The gekkos, given as (gekko_id, username, api_key), are distributed round robin
+    across the processes. Each process polls its gekkos with a MyGekkoFleet on its own
+    event loop, limit and limit_per_host apply per process. Every flush_interval
+    seconds the processes send the changed values and the polling statistics to the
+    coordinator, which keeps the values of all gekkos. The entities themselves stay
+    in the processes. A process failing or being killed is logged and its gekkos are
+    listed by get_errors, they are not polled anymore.
+    """
+
+    def __init__(
+        self,
+        gekkos: list[tuple[str, str, str]],
+        processes: int | None = None,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        flush_interval: float = 0.5,
+        client_kwargs: dict[str, Any] | None = None,
+        polling_kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        processes = processes or os.cpu_count() or 1
+        self._shards = [
+            gekkos[index::processes]
+            for index in range(processes)
+            if gekkos[index::processes]
+        ]
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._flush_interval = flush_interval
+        self._client_kwargs = client_kwargs or {}
+        self._polling_kwargs = polling_kwargs or {}
+        self._values: dict[str, dict[str, dict[str, dict[str, Any]]]] = {
+            gekko_id: {} for gekko_id, _, _ in gekkos
+        }
+        self._stats: dict[str, GekkoStats] = {}
+        self._errors: dict[str, str] = {}
+        self._listeners: list[ShardChangeListener] = []
+        self._received_changes = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+        self._queue = None
+        self._stop = None
+        self._reader: threading.Thread | None = None
+
+    async def __aenter__(self) -> ShardedFleet:
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    @property
+    def processes(self) -> int:
+        """Returns the number of shard processes"""
+        return len(self._shards)
+
+    def start(self) -> None:
+        """Starts the shard processes, which start polling right away"""
+        if self._processes:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._queue = self._context.Queue()
+        self._stop = self._context.Event()
+        for index, shard in enumerate(self._shards):
+            process = self._context.Process(
+                target=_run_shard,
+                args=(
+                    index,
+                    shard,
+                    self._limit,
+                    self._limit_per_host,
+                    self._flush_interval,
+                    self._client_kwargs,
+                    self._polling_kwargs,
+                    self._queue,
+                    self._stop,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+        # the queue is read in a thread, so the event loop never blocks on it
+        self._reader = threading.Thread(
+            target=self._read_messages, args=(loop,), daemon=True
+        )
+        self._reader.start()
+
+    async def close(self) -> None:
+        """Stops the shard processes once they sent their last changes"""
+        if not self._processes:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._stop.set()
+        for process in self._processes:
+            await loop.run_in_executor(None, process.join)
+        self._queue.put(None)
+        await loop.run_in_executor(None, self._reader.join)
+        self._processes = []
+        # lets the messages scheduled by the reader be applied
+        await asyncio.sleep(0)
+
+    def _read_messages(self, loop: asyncio.AbstractEventLoop) -> None:
+        exited = set()
+        while True:
+            try:
+                message = self._queue.get(timeout=self._flush_interval)
+            except Empty:
+                # a killed process sends no error, it is noticed once the queue is
+                # drained, so the error sent by a failing process is applied first
+                for index, process in enumerate(self._processes):
+                    if index not in exited and _has_failed(process, self._stop):
+                        exited.add(index)
+                        error = f"exited with code {process.exitcode}"
+                        loop.call_soon_threadsafe(self._apply, _ERROR, (index, error))
+                continue
+            if message is None:
+                return
+            if message[0] == _ERROR:
+                exited.add(message[1][0])
+            loop.call_soon_threadsafe(self._apply, *message)
+
+    def _apply(self, kind: str, payload) -> None:
+        """Applies a message of a shard process to the values of the gekkos"""
+        if kind == _CHANGES:
+            for gekko_id, change in payload:
+                items = self._values.setdefault(gekko_id, {}).setdefault(
+                    change.category, {}
+                )
+                if change.removed:
+                    items.pop(change.entity_id, None)
+                else:
+                    values = items.setdefault(change.entity_id, {})
+                    for value_name, (_, new_value) in change.changes.items():
+                        values[value_name] = new_value
+
+                for listener in list(self._listeners):
+                    try:
+                        listener(gekko_id, change)
+                    except Exception:
+                        _LOGGER.exception("Error in change listener %s", listener)
+            self._received_changes += len(payload)
+        elif kind == _NAMES:
+            gekko_id, names = payload
+            values = self._values.setdefault(gekko_id, {})
+            for category, items in names.items():
+                category_values = values.setdefault(category, {})
+                for entity_id, name in items.items():
+                    category_values.setdefault(entity_id, {})["name"] = name
+        elif kind == _STATS:
+            self._stats.update(payload)
+        elif kind == _ERROR:
+            index, error = payload
+            _LOGGER.error("Shard process %s failed: %s", index, error)
+            for gekko_id, _, _ in self._shards[index]:
+                self._errors[gekko_id] = error
+
+    def on_change(self, callback: ShardChangeListener) -> Callable[[], None]:
+        """Adds a listener called with the gekko id and the changes of an entity.
+
+        Returns a function removing the listener again.
+        """
+        self._listeners.append(callback)
+        return lambda: self._listeners.remove(callback)
+
+    def get_values(self) -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
+        """Returns the raw values by gekko id, category and entity id"""
+        return dict(self._values)
+
+    def get_stats(self) -> dict[str, GekkoStats]:
+        """Returns the polling statistics by gekko id, as of the last flush"""
+        return dict(self._stats)
+
+    def get_errors(self) -> dict[str, str]:
+        """Returns the error by gekko id of the gekkos whose shard process failed"""
+        return dict(self._errors)
+
+    def get_received_changes(self) -> int:
+        """Returns the number of entity changes received from the shard processes"""
+        return self._received_changes
+
+
+def _has_failed(process: multiprocessing.process.BaseProcess, stop) -> bool:
+    """Returns whether the process exited with an error or before it was stopped"""
+    return process.exitcode is not None and (process.exitcode != 0 or not stop.is_set())
+
+
+def _run_shard(
+    index: int,
+    gekkos: list[tuple[str, str, str]],
+    limit: int,
+    limit_per_host: int,
+    flush_interval: float,
+    client_kwargs: dict[str, Any],
+    polling_kwargs: dict[str, Any],
+    queue,
+    stop,
+) -> None:
+    """Polls the gekkos of a shard until stop is set, runs in a shard process"""
+    try:
+        asyncio.run(
+            _poll_shard(
+                gekkos,
+                limit,
+                limit_per_host,
+                flush_interval,
+                client_kwargs,
+                polling_kwargs,
+                queue,
+                stop,
+            )
+        )
+    except BaseException:
+        # the exception itself may not be picklable, so its traceback is sent
+        queue.put((_ERROR, (index, traceback.format_exc().strip())))
+        raise
+
+
+async def _poll_shard(
+    gekkos: list[tuple[str, str, str]],
+    limit: int,
+    limit_per_host: int,
+    flush_interval: float,
+    client_kwargs: dict[str, Any],
+    polling_kwargs: dict[str, Any],
+    queue,
+    stop,
+) -> None:
+    pending_changes: list[tuple[str, EntityChange]] = []
+    sent_resources = {}
+
+    async with MyGekkoFleet(limit, limit_per_host) as fleet:
+        for gekko_id, username, api_key in gekkos:
+            client = fleet.add_client(
+                gekko_id,
+                # the same authentication as MyGekkoQueryApiClient, but the url
+                # can be set, e.g. to a local server
+                lambda session: MyGekkoApiClientBase(
+                    {"username": username, "key": api_key, "gekkoid": gekko_id},
+                    session,
+                    **client_kwargs,
+                ),
+            )
+            for category in CATEGORIES:
+                client.on_change(
+                    category,
+                    lambda change, gekko_id=gekko_id: pending_changes.append(
+                        (gekko_id, change)
+                    ),
+                )
+        fleet.start_polling(**polling_kwargs)
+
+        while True:
+            stopped = stop.is_set()
+
+            # the names are only sent when the resources changed, they are not part
+            # of the value changes
+            for gekko_id, client in fleet.clients.items():
+                resources = client.get_snapshot().resources
+                if resources is not None and resources is not sent_resources.get(
+                    gekko_id
+                ):
+                    sent_resources[gekko_id] = resources
+                    queue.put((_NAMES, (gekko_id, _get_names(resources))))
+
+            if pending_changes:
+                # the queue pickles the changes later on, so they are not cleared
+                queue.put((_CHANGES, pending_changes.copy()))
+                pending_changes.clear()
+            queue.put((_STATS, fleet.get_stats()))
+
+            if stopped:
+                break
+            await asyncio.sleep(flush_interval)
+
+
+def _get_names(resources) -> dict[str, dict[str, str]]:
+    """Returns the names of the items by category"""
+    return {
+        category: {
+            entity_id: item["name"]
+            for entity_id, item in items.items()
+            if isinstance(item, Mapping) and "name" in item
+        }
+        for category, items in resources.items()
+        if isinstance(items, Mapping)
+    }
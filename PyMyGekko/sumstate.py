@@ -0,0 +1,287 @@
+"""Field layouts of the sumstate values of the MyGekko API.
+
+The sumstate of an item is a semicolon separated list of values, whose layout
+depends on the category and on the hardware. The layouts are registered here and
+compiled into decoders returning a dict of the raw field values.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import lru_cache
+
+SumstateDecoder = Callable[[str], dict[str, str]]
+
+# hardware key of the older hardware (Slide), which does not report its hardware
+LEGACY = "legacy"
+
+# (category, hardware, kind) -> field names, hardware None is the default layout
+# for all hardware not registered explicitly, kind is "item" or "group"
+SUMSTATE_SCHEMAS: dict[tuple[str, str | None, str], tuple[str, ...]] = {}
+
+
+def register_schema(
+    category: str,
+    fields: tuple[str, ...],
+    hardware: str | None = None,
+    kind: str = "item",
+) -> None:
+    """Registers the field layout of a category for the given hardware"""
+    SUMSTATE_SCHEMAS[(category, hardware, kind)] = tuple(fields)
+    get_decoder.cache_clear()
+
+
+def get_schema(category: str, hardware: str, kind: str = "item") -> tuple[str, ...]:
+    """Returns the field names of the sumstate of a category for the given hardware"""
+    fields = SUMSTATE_SCHEMAS.get((category, hardware, kind))
+    if fields is None:
+        fields = SUMSTATE_SCHEMAS[(category, None, kind)]
+    return fields
+
+
+@lru_cache(maxsize=None)
+def get_decoder(category: str, hardware: str, kind: str = "item") -> SumstateDecoder:
+    """Returns the compiled decoder of the sumstate of a category.
+
+    The decoder maps the fields to the values, values beyond the known fields are
+    ignored.
+    """
+    fields = get_schema(category, hardware, kind)
+
+    def decode(value: str) -> dict[str, str]:
+        return dict(zip(fields, value.split(";")))
+
+    return decode
+
+
+def get_hardware(status: dict) -> str:
+    """Returns the hardware reported in the globals of the status.
+
+    The older hardware (Slide) does not report its hardware, only the newer hardware
+    (Slide 2, Nova) does.
+    """
+    network_data = status.get("globals", {}).get("network", {})
+    if (
+        "hardware" in network_data
+        and network_data["hardware"]
+        and "value" in network_data["hardware"]
+    ):
+        return network_data["hardware"]["value"]
+    return LEGACY
+
+
+def _has_schema(category: str, hardware: str, kind: str) -> bool:
+    """Returns whether a layout is registered for the category and hardware"""
+    schemas = SUMSTATE_SCHEMAS
+    return (category, hardware, kind) in schemas or (category, None, kind) in schemas
+
+
+def decode_sumstates(
+    status: dict, hardware: str
+) -> dict[tuple[str, str, str], dict[str, dict[str, str]]]:
+    """Decodes the sumstates of the items and groups of the status in advance.
+
+    Returns the decoded fields by (category, hardware, kind) and raw value, items
+    with the same value share the decoded fields. Categories without a registered
+    layout are left out. This is a pure function, so it can be run in an executor.
+    """
+    decoded = {}
+    for category, items in status.items():
+        if not isinstance(items, dict):
+            continue
+        for kind in ("item", "group"):
+            if not _has_schema(category, hardware, kind):
+                continue
+            decode = get_decoder(category, hardware, kind)
+            records = {}
+            for key, item in items.items():
+                if not key.startswith(kind) or not isinstance(item, dict):
+                    continue
+                sumstate = item.get("sumstate")
+                if isinstance(sumstate, dict):
+                    value = sumstate.get("value")
+                    if isinstance(value, str) and value not in records:
+                        records[value] = decode(value)
+            if records:
+                decoded[(category, hardware, kind)] = records
+    return decoded
+
+
+register_schema(
+    "accessdoors",
+    (
+        "accessControllerActionState",
+        "elementInfo",
+        "accessState",
+        "gateRuntimeLevel",
+        "accessType",
+    ),
+)
+register_schema("actions", ("currentState", "elementInfo"), LEGACY)
+register_schema("actions", ("currentState", "startConditionState", "elementInfo"))
+register_schema("alarms_logics", ("currentValue",))
+register_schema(
+    "blinds",
+    (
+        "currentState",
+        "positionLevel",
+        "rotationLevel",
+        "elementInfo",
+        "rotationRange",
+    ),
+)
+register_schema("blinds", ("currentState",), kind="group")
+register_schema("cams", ("newRecordsAvailableState",))
+register_schema(
+    "door_intercom",
+    (
+        "soundMode",
+        "actionOnRingState",
+        "connectionState",
+        "missedCallsValue",
+        "lastMissedCallDate",
+    ),
+)
+register_schema(
+    "energycosts",
+    (
+        "actPower[kW]",
+        "energyToday[kWh]",
+        "energyMonth[kWh]",
+        "energySum[kWh]",
+        "powerMax[kW]",
+        "unitEnergy[Unit]",
+        "unitPower[Unit]",
+        "energyToday6[kWh]",
+        "energyToday12[kWh]",
+        "energyToday18[kWh]",
+        "energyToday24[kWh]",
+        "energyYesterd6[kWh]",
+        "energyYesterd12[kWh]",
+        "energyYesterd18[kWh]",
+        "energyYesterd24[kWh]",
+        "elementInfo",
+        "other",
+    ),
+    LEGACY,
+)
+register_schema(
+    "energycosts",
+    (
+        "actPower[kW]",
+        "energyToday[kWh]",
+        "energyMonth[kWh]",
+        "energySum[kWh]",
+        "powerMax[kW]",
+        "unitEnergy[Unit]",
+        "unitPower[Unit]",
+        "energyToday6[kWh]",
+        "energyToday12[kWh]",
+        "energyToday18[kWh]",
+        "energyToday24[kWh]",
+        "energyYesterd6[kWh]",
+        "energyYesterd12[kWh]",
+        "energyYesterd18[kWh]",
+        "energyYesterd24[kWh]",
+        "elementInfo",
+        "energyYear[kWh]",
+        "energyPeriod[kWh]",
+        "energyPeriodFrom[DateTime]",
+        "counterDirection",
+        "other",
+    ),
+)
+register_schema(
+    "hotwater_systems",
+    (
+        "type",
+        "cooling",
+        "setpointTemp",
+        "topTemp",
+        "bottomTemp",
+        "collectorTemp",
+        "state",
+        "sum",
+    ),
+)
+register_schema(
+    "lights",
+    ("currentState", "dimLevel", "rgbColor", "tunableWhiteLevel", "elementInfo"),
+)
+register_schema("lights", ("currentState",), kind="group")
+register_schema("loads", ("currentState", "elementInfo"))
+register_schema(
+    "roomtemps",
+    (
+        "temperatureValue",
+        "temperatureSetPointValue",
+        "valveOpeningLevel",
+        "workingMode",
+        "Reserved",
+        "temperatureAdjustmentValue",
+        "coolingModeState",
+        "elementInfo",
+    ),
+    LEGACY,
+)
+register_schema(
+    "roomtemps",
+    (
+        "temperatureValue",
+        "temperatureSetPointValue",
+        "valveOpeningLevel",
+        "workingMode",
+        "Reserved",
+        "temperatureAdjustmentValue",
+        "coolingModeState",
+        "elementInfo",
+        "relativeHumidityLevel",
+        "airQualityLevel",
+        "floorTemperatureValue",
+    ),
+)
+register_schema(
+    "vents",
+    (
+        "workingLevel",
+        "deviceModel",
+        "workingMode",
+        "bypassState",
+        "maximumWorkingLevel",
+        "relativeHumidityLevel",
+        "co2Value",
+        "airQualityLevel",
+        "supplyAirTemperatureValue",
+        "exhaustAirTemperatureValue",
+        "outsideAirTemperatureValue",
+        "outgoingAirTemperatureValue",
+        "supplyAirWorkingLevel",
+        "exhaustAirWorkingLevel",
+        "elementInfo",
+    ),
+    LEGACY,
+)
+register_schema(
+    "vents",
+    (
+        "workingLevel",
+        "deviceModel",
+        "workingMode",
+        "bypassState",
+        "maximumWorkingLevel",
+        "relativeHumidityLevel",
+        "airQualityLevel",
+        "co2Value",
+        "supplyAirTemperatureValue",
+        "exhaustAirTemperatureValue",
+        "outsideAirTemperatureValue",
+        "outgoingAirTemperatureValue",
+        "supplyAirWorkingLevel",
+        "exhaustAirWorkingLevel",
+        "elementInfo",
+        "subWorkingMode",
+        "coolingModeState",
+        "dehumidModeState",
+        "bypassMode",
+    ),
+)
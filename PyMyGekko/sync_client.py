@@ -0,0 +1,179 @@
+"""Synchronous client running the MyGekko api client on a background event loop"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientSession
+
+from .data_provider import StateSnapshot
+
+if TYPE_CHECKING:
+    from . import MyGekkoApiClientBase
+    from .resources import Entity
+    from .resources import ReadOnlyEntity
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class MyGekkoSyncClient:
+    """Thread-safe synchronous client, used with with.
+
+    The client owns an event loop running in a background thread and a single
+    session, so any number of threads share one connection pool and one poll. The
+    snapshot of the read data can be read from any thread without blocking, all other
+    calls are run on the event loop and block until they are done, e.g.
+    client.set_value(light, "state", LightState.ON).
+
+    The entities read and cache their values while the loop applies a read, so their
+    properties must only be read on the loop as well, with get_value or run.
+    """
+
+    def __init__(
+        self,
+        create_client: Callable[[ClientSession], MyGekkoApiClientBase],
+        timeout: float | None = 60.0,
+    ) -> None:
+        self._timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="PyMyGekko", daemon=True
+        )
+        self._thread.start()
+        self._session: ClientSession | None = None
+        self._poller = None
+        try:
+            self._client = self._run_coroutine(
+                self._create_client(create_client), timeout
+            )
+        except BaseException:
+            self._stop_loop()
+            raise
+
+    async def _create_client(
+        self, create_client: Callable[[ClientSession], MyGekkoApiClientBase]
+    ) -> MyGekkoApiClientBase:
+        # the session has to be created on the loop it is used on
+        self._session = ClientSession()
+        return create_client(self._session)
+
+    @property
+    def client(self) -> MyGekkoApiClientBase:
+        """Returns the wrapped api client, which must only be used on its loop"""
+        return self._client
+
+    @property
+    def snapshot(self) -> StateSnapshot:
+        """Returns the snapshot of the last read, can be called from any thread"""
+        return self._client.get_snapshot()
+
+    @property
+    def version(self) -> int:
+        """Returns the version of the last read, can be called from any thread"""
+        return self._client.get_version()
+
+    def run(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Calls the function on the event loop and returns its result.
+
+        A returned awaitable is awaited on the loop, so the methods of the client and
+        its entities can be passed, e.g. run(client.get_lights) or
+        run(light.set_brightness, 50).
+        """
+
+        async def call():
+            result = function(*args)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        return self._run_coroutine(call(), self._timeout)
+
+    def get_value(self, entity: ReadOnlyEntity, name: str) -> Any:
+        """Returns the value of the property of the entity, read on the event loop"""
+        return self.run(getattr, entity, name)
+
+    def set_value(self, entity: Entity, name: str, value: Any) -> None:
+        """Sets the value with the set_ method of the entity on the event loop.
+
+        E.g. set_value(light, "brightness", 50) awaits light.set_brightness(50).
+        """
+        self.run(getattr(entity, f"set_{name}"), value)
+
+    def read_data(self) -> None:
+        """Reads the status and resources data"""
+        self.run(self._client.read_data)
+
+    def read_status(self) -> None:
+        """Reads only the status data, the resources are read if outdated"""
+        self.run(self._client.read_status)
+
+    def wait_for_version(
+        self, version: int, timeout: float | None = None
+    ) -> StateSnapshot:
+        """Blocks until the data with at least the given version is read.
+
+        Raises TimeoutError if no such data is read within the timeout.
+        """
+        snapshot = self.snapshot
+        if snapshot.version >= version:
+            return snapshot
+        return self._run_coroutine(
+            asyncio.wait_for(self._client.wait_for_version(version), timeout), None
+        )
+
+    def start_polling(self, **kwargs) -> None:
+        """Starts polling the status in the background, see start_polling of the client"""
+
+        def start():
+            if self._poller is None or not self._poller.running:
+                self._poller = self._client.start_polling(**kwargs)
+                self._poller.start()
+
+        self.run(start)
+
+    def stop_polling(self) -> None:
+        """Stops polling the status in the background"""
+        if self._poller is not None:
+            self.run(self._poller.stop)
+            self._poller = None
+
+    def close(self) -> None:
+        """Stops polling, closes the session and stops the event loop"""
+        if not self._loop.is_running():
+            return
+        try:
+            self.stop_polling()
+            if self._session is not None:
+                self.run(self._session.close)
+        finally:
+            self._stop_loop()
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> MyGekkoSyncClient:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _run_coroutine(self, coroutine, timeout: float | None) -> Any:
+        """Runs the coroutine on the event loop and waits for its result"""
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("Blocking calls must not be made on the event loop")
+
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            _LOGGER.debug("Call on the event loop timed out after %ss", timeout)
+            raise
@@ -0,0 +1,61 @@
+"""Benchmark of the per poll json decode cost of the available json backends.
+
+Usage: python -m benchmarks.json_decode [items per category]
+"""
+import json
+import pkgutil
+import sys
+import timeit
+
+from PyMyGekko.json_backend import JSON_BACKENDS
+
+
+def build_status(items_per_category: int) -> bytes:
+    """Builds a status payload of a large installation based on the demo data"""
+    demo_status = json.loads(
+        pkgutil.get_data("PyMyGekko", "api_var_status_demo_data.json")
+    )
+
+    status = {"globals": demo_status["globals"]}
+    for category, items in demo_status.items():
+        if category == "globals" or not items:
+            continue
+        templates = [item for key, item in items.items() if key.startswith("item")]
+        status[category] = {
+            f"item{index}": templates[index % len(templates)]
+            for index in range(items_per_category)
+        }
+
+    return json.dumps(status).encode()
+
+
+def build_resources(status: bytes) -> bytes:
+    """Builds the resources naming the items of the given status"""
+    resources = {
+        category: {key: {"name": f"{category} {key}"} for key in items}
+        for category, items in json.loads(status).items()
+        if category != "globals"
+    }
+    return json.dumps(resources).encode()
+
+
+def main() -> None:
+    items_per_category = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    payload = build_status(items_per_category)
+    print(f"status payload: {len(payload) / 1024:.1f} KiB")
+
+    loaders = {"json (str)": lambda data: json.loads(data.decode())}
+    for name, loader in JSON_BACKENDS.items():
+        try:
+            loaders[name] = loader()
+        except ImportError:
+            print(f"{name}: not installed")
+
+    for name, loads in loaders.items():
+        number = 200
+        seconds = min(timeit.repeat(lambda: loads(payload), number=number, repeat=5))
+        print(f"{name}: {seconds / number * 1000:.3f} ms per poll")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark of the event loop blocking time per poll with and without an executor.
+
+Usage: python -m benchmarks.loop_blocking [items per category]
+"""
+import asyncio
+import itertools
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+
+from .json_decode import build_resources
+from .json_decode import build_status
+
+POLLS = 20
+
+
+async def probe_loop_lag(lags: list[float]) -> None:
+    """Measures how late a 1ms sleep wakes up, i.e. how long the loop was blocked"""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def poll(port: int, executor) -> None:
+    lags = []
+    loop_blocking = []
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {}, session, scheme="http", host="127.0.0.1", port=port, executor=executor
+        )
+        probe = asyncio.create_task(probe_loop_lag(lags))
+        for index in range(POLLS):
+            await api.read_status()
+            loop_blocking.append(api.get_read_timings()["loop_blocking"])
+        probe.cancel()
+        changed_items = api.get_changed_items()
+
+    name = type(executor).__name__ if executor else "no executor"
+    print(
+        f"{name}: loop blocking {sum(loop_blocking) / POLLS * 1000:.2f} ms per poll, "
+        f"max loop lag {max(lags) * 1000:.2f} ms, "
+        f"{changed_items} changed items per poll"
+    )
+
+
+async def main() -> None:
+    items_per_category = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    status = build_status(items_per_category)
+    statuses = [status, status.replace(b'"value": "', b'"value": "9')]
+    resources = build_resources(status)
+    print(f"status payload: {len(status) / 1024:.1f} KiB")
+    counter = itertools.count()
+
+    async def var_response(request):
+        return web.Response(body=resources)
+
+    async def var_status_response(request):
+        # two status bodies alternate, so the items really change with every poll
+        return web.Response(body=statuses[next(counter) % len(statuses)])
+
+    app = web.Application()
+    app.router.add_get("/api/v1/var", var_response)
+    app.router.add_get("/api/v1/var/status", var_status_response)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        await poll(port, None)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await poll(port, executor)
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            await poll(port, executor)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+"""Benchmark of the entity property access throughput.
+
+Compares the first access after a poll, which converts the values, with the
+following accesses served from the typed value cache.
+
+Usage: python -m benchmarks.property_access
+"""
+import asyncio
+import timeit
+
+from PyMyGekko import MyGekkoDemoModeClient
+
+
+def read_properties(entities) -> None:
+    """Reads all public properties of the given entities"""
+    for entity, names in entities:
+        for name in names:
+            getattr(entity, name)
+
+
+async def main() -> None:
+    api = MyGekkoDemoModeClient()
+    await api.read_data()
+
+    entities = []
+    for entity in (
+        api.get_blinds()
+        + api.get_lights()
+        + api.get_room_temps()
+        + api.get_vents()
+        + api.get_hot_water_systems()
+        + api.get_loads()
+    ):
+        names = [
+            name
+            for name, value in vars(type(entity)).items()
+            if isinstance(value, property)
+        ]
+        entities.append((entity, names))
+    accesses = sum(len(names) for _, names in entities)
+    accessors = {entity._value_accessor for entity, _ in entities}
+
+    def uncached() -> None:
+        for accessor in accessors:
+            accessor._typed_values = {}
+        read_properties(entities)
+
+    def cached() -> None:
+        read_properties(entities)
+
+    print(f"{len(entities)} entities, {accesses} property accesses per round")
+    for name, function in (("uncached", uncached), ("cached", cached)):
+        number = 200
+        seconds = min(timeit.repeat(function, number=number, repeat=5))
+        print(f"{name}: {accesses * number / seconds / 1e6:.2f} M accesses/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
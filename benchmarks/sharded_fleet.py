@@ -0,0 +1,136 @@
+"""Benchmark of the polls per second of a sharded fleet by number of processes.
+
+Usage: python -m benchmarks.sharded_fleet [gekkos] [items per category]
+
+The mock server runs in as many processes as there are cores sharing one port, so
+it does not limit the throughput of the fleet.
+"""
+import asyncio
+import collections
+import itertools
+import multiprocessing
+import os
+import socket
+import sys
+import time
+
+from aiohttp import web
+from PyMyGekko.sharded_fleet import ShardedFleet
+
+from .json_decode import build_resources
+from .json_decode import build_status
+
+DURATION = 5.0
+
+
+def serve(port: int, resources: bytes, statuses: list[bytes], ready) -> None:
+    """Runs the mock server in a server process"""
+
+    async def main():
+        counters = collections.defaultdict(itertools.count)
+
+        async def var_response(request):
+            return web.Response(body=resources)
+
+        async def var_status_response(request):
+            # the status alternates per gekko, so its polls are decoded and yield
+            # changes, unless two polls of a gekko hit different server processes
+            counter = counters[request.query["gekkoid"]]
+            return web.Response(body=statuses[next(counter) % len(statuses)])
+
+        app = web.Application()
+        app.router.add_get("/api/v1/var", var_response)
+        app.router.add_get("/api/v1/var/status", var_status_response)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port, reuse_port=True).start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+async def measure(processes: int, gekkos: int, port: int) -> None:
+    interval = 0.01
+    fleet = ShardedFleet(
+        [(f"gekko{index}", "user", "key") for index in range(gekkos)],
+        processes=processes,
+        flush_interval=0.2,
+        client_kwargs={"scheme": "http", "host": "127.0.0.1", "port": port},
+        polling_kwargs={
+            "interval": interval,
+            "fast_interval": interval,
+            "idle_interval": interval,
+            "jitter": interval,
+        },
+    )
+    async with fleet:
+        # the processes are started and all gekkos are read once before measuring
+        while len(fleet.get_stats()) < gekkos or not all(
+            stats.polls for stats in fleet.get_stats().values()
+        ):
+            await asyncio.sleep(0.1)
+
+        polls, skipped = count_polls(fleet)
+        changes = fleet.get_received_changes()
+        start = time.perf_counter()
+        await asyncio.sleep(DURATION)
+        end_polls, end_skipped = count_polls(fleet)
+        polls, skipped = end_polls - polls, end_skipped - skipped
+        changes = fleet.get_received_changes() - changes
+        seconds = time.perf_counter() - start
+
+    print(
+        f"{processes} processes: {polls / seconds:.0f} polls/s, "
+        f"{(polls - skipped) / seconds:.0f} decoded/s, "
+        f"{skipped / seconds:.0f} skipped/s, "
+        f"{changes / seconds:.0f} changes/s"
+    )
+
+
+def count_polls(fleet: ShardedFleet) -> tuple[int, int]:
+    """Returns the polls and the skipped unchanged updates of all gekkos"""
+    stats = fleet.get_stats().values()
+    return sum(gekko.polls for gekko in stats), sum(
+        gekko.skipped_updates for gekko in stats
+    )
+
+
+async def main() -> None:
+    gekkos = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    items_per_category = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    status = build_status(items_per_category)
+    statuses = [status, status.replace(b'"value": "1;', b'"value": "0;')]
+    resources = build_resources(status)
+    cores = os.cpu_count() or 1
+    print(f"{gekkos} gekkos, status payload: {len(status) / 1024:.1f} KiB")
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    context = multiprocessing.get_context("spawn")
+    servers = []
+    for _ in range(cores):
+        ready = context.Event()
+        server = context.Process(
+            target=serve, args=(port, resources, statuses, ready), daemon=True
+        )
+        server.start()
+        ready.wait()
+        servers.append(server)
+
+    try:
+        # 1, 2, 4, ... processes up to the number of cores
+        process_counts = sorted(
+            {2**exponent for exponent in range(cores.bit_length())} | {cores}
+        )
+        for processes in process_counts:
+            await measure(processes, gekkos, port)
+    finally:
+        for server in servers:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientSession
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.change_stream import ChangeEvent
+from PyMyGekko.change_stream import ChangeStream
+from PyMyGekko.change_stream import OverflowPolicy
+from PyMyGekko.resources import EntityChange
+
+
+@pytest.mark.asyncio
+async def test_change_stream(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+        await api.read_data()
+
+        async with api.changes(["lights"]) as changes:
+            status_server.status = status_server.status.replace("1;50.00", "0;60.00")
+            await api.read_status()
+
+            events = [await anext(changes), await anext(changes)]
+            assert [event[:5] for event in events] == [
+                ("lights", "item1", "currentState", "1", "0"),
+                ("lights", "item1", "dimLevel", "50.00", "60.00"),
+            ]
+            assert events[0].timestamp > 0
+            assert len(changes) == 0
+
+        assert [event async for event in changes] == []
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    stream = ChangeStream(max_size=2)
+    stream.put_change(EntityChange("lights", "item0", {"a": ("1", "2")}))
+    stream.put_change(EntityChange("lights", "item1", {"b": ("1", "2")}))
+    stream.put_change(EntityChange("lights", "item2", {"c": ("1", "2")}))
+
+    assert stream.dropped == 1
+    stream.close()
+    assert [event.entity_id async for event in stream] == ["item1", "item2"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce():
+    stream = ChangeStream(max_size=2, overflow=OverflowPolicy.COALESCE)
+    stream.put_change(EntityChange("lights", "item0", {"a": ("1", "2")}))
+    stream.put_change(EntityChange("lights", "item1", {"a": ("1", "2")}))
+    stream.put_change(EntityChange("lights", "item0", {"a": ("2", "3")}))
+
+    assert stream.dropped == 0
+    stream.close()
+    assert [event[:5] async for event in stream] == [
+        ("lights", "item1", "a", "1", "2"),
+        ("lights", "item0", "a", "1", "3"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_block():
+    stream = ChangeStream(max_size=1, overflow=OverflowPolicy.BLOCK)
+    stream.put_change(
+        EntityChange("lights", "item0", {"a": ("1", "2"), "b": ("1", "2")})
+    )
+
+    assert stream.dropped == 0
+    waiter = asyncio.create_task(stream.wait_for_space())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    assert isinstance(await anext(stream), ChangeEvent)
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await anext(stream)
+    await asyncio.wait_for(waiter, 1)
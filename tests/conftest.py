@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+
+class StatusServer:
+    """Serves the resources and status of gekko 596610, which the tests modify.
+
+    The status and resources are served as is if they are strings, dicts are served
+    as json.
+    """
+
+    def __init__(self):
+        statusResponseFile = open(
+            "tests/lights/data/api_var_status_response_596610.json"
+        )
+        self.status = statusResponseFile.read()
+        varResponseFile = open("tests/lights/data/api_var_response_596610.json")
+        self.resources = varResponseFile.read()
+        self.entity_status = {}
+        self.status_status = 200
+        self.delay = 0.0
+        self.requests = 0
+        self.running = 0
+        self.max_running = 0
+        self.status_requested = asyncio.Event()
+        self.release_status = asyncio.Event()
+        self.release_status.set()
+
+    async def var_response(self, request):
+        return _response(self.resources)
+
+    async def var_status_response(self, request):
+        self.requests += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.status_requested.set()
+        await self.release_status.wait()
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return _response(self.status, self.status_status)
+
+    async def entity_status_response(self, request):
+        path = f"{request.match_info['category']}/{request.match_info['item']}"
+        if path not in self.entity_status:
+            return web.Response(status=404)
+        return _response(self.entity_status[path])
+
+    async def set_response(self, request):
+        return web.Response(status=200)
+
+
+def _response(data, status=200):
+    if isinstance(data, str):
+        return web.Response(status=status, body=data)
+    return web.json_response(data, status=status)
+
+
+@pytest.fixture
+def status_server():
+    return StatusServer()
+
+
+@pytest.fixture
+def mock_server(aiohttp_server, status_server):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", status_server.var_response)
+    app.router.add_get("/api/v1/var/status", status_server.var_status_response)
+    app.router.add_get(
+        "/api/v1/var/{category}/{item}/status", status_server.entity_status_response
+    )
+    app.router.add_get("/api/v1/var/lights/{item}/scmd/set", status_server.set_response)
+    return aiohttp_server(app)
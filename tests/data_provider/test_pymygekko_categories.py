@@ -0,0 +1,202 @@
+import json
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.data_provider import MyGekkoError
+from PyMyGekko.resources.Lights import LightState
+
+
+def load_json(path):
+    with open(path) as json_file:
+        return json.load(json_file)
+
+
+class CategoryServer:
+    def __init__(self):
+        self.requested_paths = []
+        resources = load_json("tests/lights/data/api_var_response_596610.json")
+        resources |= load_json("tests/energy_costs/data/api_var_response_643612.json")
+        status = load_json("tests/lights/data/api_var_status_response_596610.json")
+        status |= load_json(
+            "tests/energy_costs/data/api_var_status_response_643612.json"
+        )
+        self.resources = resources
+        self.status = status
+        self.failing_categories = set()
+        self.malformed_categories = set()
+
+    async def var_response(self, request):
+        self.requested_paths.append(request.path)
+        return web.json_response(self.resources)
+
+    async def var_status_response(self, request):
+        self.requested_paths.append(request.path)
+        return web.json_response(self.status)
+
+    async def category_response(self, request):
+        self.requested_paths.append(request.path)
+        if request.match_info["category"] in self.malformed_categories:
+            return web.Response(body="{")
+        return web.json_response(self.resources[request.match_info["category"]])
+
+    async def category_status_response(self, request):
+        self.requested_paths.append(request.path)
+        if request.match_info["category"] in self.failing_categories:
+            return web.Response(status=503)
+        if request.match_info["category"] in self.malformed_categories:
+            return web.Response(body="{")
+        return web.json_response(self.status[request.match_info["category"]])
+
+
+@pytest.fixture
+def category_server():
+    return CategoryServer()
+
+
+@pytest.fixture
+def mock_server(aiohttp_server, category_server):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", category_server.var_response)
+    app.router.add_get("/api/v1/var/status", category_server.var_status_response)
+    app.router.add_get("/api/v1/var/{category}", category_server.category_response)
+    app.router.add_get(
+        "/api/v1/var/{category}/status", category_server.category_status_response
+    )
+    return aiohttp_server(app)
+
+
+@pytest.mark.asyncio
+async def test_categories(mock_server, category_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            categories={"lights"},
+        )
+
+        await api.read_data()
+
+        assert sorted(category_server.requested_paths) == [
+            "/api/v1/var/globals/status",
+            "/api/v1/var/lights",
+            "/api/v1/var/lights/status",
+        ]
+
+        lights = api.get_lights()
+        assert len(lights) == 4
+        assert lights[0].name == "Aussen"
+        assert lights[0].state == LightState.ON
+        assert lights[1].brightness == 50
+
+        assert api.get_energy_costs() == []
+        assert api.get_blinds() == []
+        assert api.get_meteo() is None
+        assert api.get_globals_network()["version"] == "680016"
+
+        category_server.requested_paths.clear()
+        await api.read_status()
+
+        assert sorted(category_server.requested_paths) == [
+            "/api/v1/var/globals/status",
+            "/api/v1/var/lights/status",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_multiple_categories(mock_server, category_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            categories={"lights", "energycosts"},
+        )
+
+        await api.read_data()
+
+        assert len(api.get_lights()) == 4
+
+        energy_costs = api.get_energy_costs()
+        assert len(energy_costs) == 4
+        assert energy_costs[0].name == "Meter 1"
+        # hardware is read from the globals, so the Slide 2 layout is used
+        assert len(energy_costs[0].sensor_data["values"]) == 20
+
+
+@pytest.mark.asyncio
+async def test_failed_read_is_applied_later(mock_server, category_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            categories={"lights"},
+        )
+        await api.read_data()
+        assert api.get_lights()[0].state == LightState.ON
+
+        category_server.status["lights"]["item0"]["sumstate"]["value"] = "0;;;;0"
+        category_server.failing_categories.add("globals")
+        with pytest.raises(MyGekkoError):
+            await api.read_status()
+        assert api.get_lights()[0].state == LightState.ON
+
+        # the lights status was read, but not applied, so it is not skipped
+        category_server.failing_categories.clear()
+        await api.read_status()
+        assert api.get_lights()[0].state == LightState.OFF
+
+
+@pytest.mark.asyncio
+async def test_malformed_category_is_not_evicted(mock_server, category_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            categories={"lights", "energycosts"},
+        )
+        await api.read_data()
+        light = api.get_lights()[0]
+        light_changes = []
+        light.add_listener(light_changes.append)
+
+        # the other categories changed, but the lights can not be parsed
+        category_server.malformed_categories.add("lights")
+        category_server.resources["energycosts"]["item0"]["name"] = "Meter 0"
+        await api.read_data()
+        assert api.get_energy_costs()[0].name == "Meter 1"
+        assert api.get_lights()[0] is light
+        assert light_changes == []
+
+        # a malformed status is not applied either
+        category_server.status["lights"]["item0"]["sumstate"]["value"] = "0;;;;0"
+        await api.read_status()
+        assert light.state == LightState.ON
+
+        category_server.malformed_categories.clear()
+        await api.read_data()
+        assert api.get_lights()[0] is light
+        assert light.state == LightState.OFF
+        assert api.get_energy_costs()[0].name == "Meter 0"
+        assert [change.removed for change in light_changes] == [False]
+
+
+def test_unknown_category():
+    with pytest.raises(ValueError):
+        MyGekkoApiClientBase(categories={"lights", "unknown"})
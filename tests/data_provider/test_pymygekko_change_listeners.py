@@ -0,0 +1,106 @@
+import pytest
+from aiohttp import ClientSession
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.resources import EntityChange
+from PyMyGekko.resources.Lights import LightState
+
+
+@pytest.mark.asyncio
+async def test_change_listeners(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+        category_changes = []
+        api.on_change("lights", category_changes.append)
+
+        await api.read_data()
+        assert len(category_changes) == 4
+        assert category_changes[1] == EntityChange(
+            "lights",
+            "item1",
+            {
+                "currentState": (None, "1"),
+                "dimLevel": (None, "50.00"),
+                "rgbColor": (None, ""),
+                "tunableWhiteLevel": (None, ""),
+                "elementInfo": (None, "0"),
+            },
+        )
+
+        light_changes = []
+        remove_listener = api.get_lights()[1].add_listener(light_changes.append)
+        status_server.status = status_server.status.replace("1;50.00", "0;60.00")
+        await api.read_status()
+
+        assert light_changes == [
+            EntityChange(
+                "lights",
+                "item1",
+                {"currentState": ("1", "0"), "dimLevel": ("50.00", "60.00")},
+            )
+        ]
+        assert category_changes[4:] == light_changes
+
+        remove_listener()
+        status_server.status = status_server.status.replace("0;60.00", "1;60.00")
+        await api.read_status()
+
+        assert len(light_changes) == 1
+        assert len(category_changes) == 6
+
+
+@pytest.mark.asyncio
+async def test_change_listeners_with_optimistic_updates(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            optimistic_updates=True,
+        )
+        status_server.status = status_server.status.replace("1;50.00", "0;50.00")
+        await api.read_data()
+
+        light = api.get_lights()[1]
+        light_changes = []
+        light.add_listener(light_changes.append)
+        category_changes = []
+        api.on_change("lights", category_changes.append)
+
+        await light.set_state(LightState.ON)
+        assert light.state == LightState.ON
+
+        # the gekko applied the write, the change is reported against the confirmed
+        # state, not against the optimistic one
+        status_server.status = status_server.status.replace("0;50.00", "1;50.00")
+        await api.read_status()
+
+        assert light_changes == [
+            EntityChange("lights", "item1", {"currentState": ("0", "1")})
+        ]
+        assert category_changes == light_changes
+        assert api.get_changed_items() == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_category_listener(mock_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+        with pytest.raises(ValueError):
+            api.on_change("unknown", print)
@@ -0,0 +1,37 @@
+import pytest
+from aiohttp import ClientSession
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.resources.Lights import LightState
+
+
+@pytest.mark.asyncio
+async def test_only_changed_items_are_decoded(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            optimistic_updates=True,
+        )
+
+        await api.read_data()
+        assert api.get_changed_items() == 4
+
+        status_server.status = status_server.status.replace("1;50.00", "0;50.00")
+        await api.read_status()
+        assert api.get_changed_items() == 1
+        assert api.get_lights()[1].state == LightState.OFF
+
+        await api.read_status()
+        assert api.get_changed_items() == 0
+
+        # the optimistic value is reconciled although the sumstate did not change,
+        # which is no change of the confirmed state
+        await api.get_lights()[1].set_state(LightState.ON)
+        assert api.get_lights()[1].state == LightState.ON
+        await api.read_status()
+        assert api.get_changed_items() == 0
+        assert api.get_lights()[1].state == LightState.OFF
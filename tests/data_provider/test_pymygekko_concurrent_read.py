@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.data_provider import DataSubscriberInterface
+from PyMyGekko.data_provider import MyGekkoTooManyRequests
+
+
+async def var_response(request):
+    # the resources are answered later than the status to verify the apply order
+    await asyncio.sleep(0.2)
+    varResponseFile = open("tests/lights/data/api_var_response_596610.json")
+    return web.Response(status=200, body=varResponseFile.read())
+
+
+async def var_status_response(request):
+    await asyncio.sleep(0.1)
+    statusResponseFile = open("tests/lights/data/api_var_status_response_596610.json")
+    return web.Response(status=200, body=statusResponseFile.read())
+
+
+async def too_many_requests_response(request):
+    return web.Response(status=429, body="Too many requests")
+
+
+@pytest.fixture
+def mock_server(aiohttp_server):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", var_response)
+    app.router.add_get("/api/v1/var/status", var_status_response)
+    return aiohttp_server(app)
+
+
+@pytest.fixture
+def mock_server_error(aiohttp_server):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", var_response)
+    app.router.add_get("/api/v1/var/status", too_many_requests_response)
+    return aiohttp_server(app)
+
+
+class OrderRecorder(DataSubscriberInterface):
+    def __init__(self):
+        self.calls = []
+
+    def update_status(self, status, hardware):
+        self.calls.append("status")
+
+    def update_resources(self, resources):
+        self.calls.append("resources")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_read(mock_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            concurrent_read=True,
+        )
+        recorder = OrderRecorder()
+        api._data_provider.subscribe(recorder)
+
+        await api.read_data()
+
+        assert recorder.calls == ["resources", "status"]
+
+        read_timings = api.get_read_timings()
+        assert read_timings["/api/v1/var"] >= 0.2
+        assert read_timings["/api/v1/var/status"] >= 0.1
+        assert read_timings["total"] < 0.3
+
+        lights = api.get_lights()
+        assert len(lights) == 4
+        assert lights[0].name == "Aussen"
+        assert lights[1].brightness == 50
+
+
+@pytest.mark.asyncio
+async def test_sequential_read(mock_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+        await api.read_data()
+
+        read_timings = api.get_read_timings()
+        assert read_timings["total"] >= 0.3
+        assert len(api.get_lights()) == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_read_error(mock_server_error):
+    server = await mock_server_error
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            concurrent_read=True,
+        )
+
+        with pytest.raises(MyGekkoTooManyRequests):
+            await api.read_data()
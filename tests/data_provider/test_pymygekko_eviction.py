@@ -0,0 +1,100 @@
+import json
+
+import pytest
+from aiohttp import ClientSession
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.resources import EntityChange
+
+
+@pytest.fixture
+def status_server(status_server):
+    # the tests modify the decoded status and resources
+    status_server.status = json.loads(status_server.status)
+    status_server.resources = json.loads(status_server.resources)
+    return status_server
+
+
+@pytest.mark.asyncio
+async def test_missing_items_are_evicted(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+        await api.read_data()
+
+        lights = api.get_lights()
+        assert len(lights) == 4
+        light_changes = []
+        lights[1].add_listener(light_changes.append)
+        category_changes = []
+        api.on_change("lights", category_changes.append)
+
+        del status_server.resources["lights"]["item1"]
+        del status_server.status["lights"]["item1"]
+        await api.read_data()
+
+        assert [light.entity_id for light in api.get_lights()] == [
+            "item0",
+            "item2",
+            "group0",
+        ]
+        assert api.get_lights()[0] is lights[0]
+        assert lights[1].state is None
+        assert light_changes == [
+            EntityChange(
+                "lights",
+                "item1",
+                {
+                    "name": ("Aussen2", None),
+                    "currentState": ("1", None),
+                    "dimLevel": ("50.00", None),
+                    "rgbColor": ("", None),
+                    "tunableWhiteLevel": ("", None),
+                    "elementInfo": ("0", None),
+                },
+                removed=True,
+            )
+        ]
+        assert category_changes == light_changes
+
+        accessor = lights[1]._value_accessor
+        assert "item1" not in accessor._raw_values
+        assert "item1" not in accessor._listeners
+
+        # the item is added again with its status
+        status_server.resources["lights"]["item1"] = {"name": "Aussen2"}
+        status_server.status["lights"]["item1"] = {"sumstate": {"value": "1;50.00;;;0"}}
+        await api.read_data()
+        assert len(api.get_lights()) == 4
+        assert api.get_lights()[3].entity_id == "item1"
+        assert api.get_lights()[3].brightness == 50
+
+
+@pytest.mark.asyncio
+async def test_removed_category_is_evicted(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+        await api.read_data()
+        assert len(api.get_lights()) == 4
+
+        category_changes = []
+        api.on_change("lights", category_changes.append)
+        status_server.resources = {}
+        status_server.status = {}
+        await api.read_data()
+
+        assert api.get_lights() == []
+        assert len(category_changes) == 4
+        assert all(change.removed for change in category_changes)
@@ -0,0 +1,85 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.json_backend import get_json_loads
+from PyMyGekko.resources.Lights import LightState
+
+
+async def var_response(request):
+    varResponseFile = open("tests/lights/data/api_var_response_596610.json")
+    return web.Response(status=200, body=varResponseFile.read())
+
+
+async def var_status_response(request):
+    statusResponseFile = open("tests/lights/data/api_var_status_response_596610.json")
+    return web.Response(status=200, body=statusResponseFile.read())
+
+
+@pytest.fixture
+def mock_server(aiohttp_server):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", var_response)
+    app.router.add_get("/api/v1/var/status", var_status_response)
+    return aiohttp_server(app)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+async def test_decode_in_executor(mock_server, executor_class):
+    server = await mock_server
+    with executor_class(max_workers=1) as executor:
+        async with ClientSession() as session:
+            api = MyGekkoApiClientBase(
+                {},
+                session,
+                scheme=server.scheme,
+                host=server.host,
+                port=server.port,
+                json_loads=get_json_loads("json"),
+                executor=executor,
+            )
+
+            await api.read_data()
+
+            lights = api.get_lights()
+            assert len(lights) == 4
+            assert lights[0].state == LightState.ON
+            assert api.get_read_timings()["loop_blocking"] > 0
+
+            await api.read_data()
+            assert api.get_skipped_updates() == 1
+            # the sumstates decoded by the executor are released once applied
+            assert api._data_provider._decoded_sumstates == {}
+
+
+def test_sumstates_decoded_in_advance():
+    api = MyGekkoApiClientBase({})
+    provider = api._data_provider
+    provider._decoded_sumstates = {
+        ("lights", "legacy", "item"): {"1;50.00;;;0": {"currentState": "decoded"}}
+    }
+    decode = provider.get_sumstate_decoder("lights", "legacy")
+    assert decode("1;50.00;;;0") == {"currentState": "decoded"}
+    assert decode("0;50.00;;;0")["currentState"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_loop_blocking_time(mock_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+
+        await api.read_data()
+
+        read_timings = api.get_read_timings()
+        assert 0 < read_timings["loop_blocking"] < read_timings["total"]
@@ -0,0 +1,37 @@
+import pytest
+from aiohttp import ClientSession
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.resources.Lights import LightFeature
+
+
+@pytest.mark.asyncio
+async def test_entities_are_reused(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+        await api.read_data()
+
+        lights = api.get_lights()
+        assert len(lights) == 4
+        assert all(a is b for a, b in zip(lights, api.get_lights()))
+        assert lights[0].supported_features == [LightFeature.ON_OFF]
+
+        # a value appearing changes the features
+        status_server.status = status_server.status.replace("1;;;;0", "1;30.00;;;0")
+        await api.read_status()
+        assert lights[0].supported_features == [
+            LightFeature.ON_OFF,
+            LightFeature.DIMMABLE,
+        ]
+
+        name = lights[0].name
+        status_server.resources = status_server.resources.replace(name, "Renamed")
+        await api.read_data()
+        assert api.get_lights()[0] is lights[0]
+        assert lights[0].name == "Renamed"
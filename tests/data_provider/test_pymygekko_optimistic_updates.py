@@ -0,0 +1,90 @@
+import pytest
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.data_provider import MyGekkoTooManyRequests
+from PyMyGekko.resources.Blinds import BlindState
+
+
+async def var_response(request):
+    varResponseFile = open("tests/blinds/data/api_var_response_596610.json")
+    return web.Response(status=200, body=varResponseFile.read())
+
+
+async def var_status_response(request):
+    statusResponseFile = open("tests/blinds/data/api_var_status_response_596610.json")
+    return web.Response(status=200, body=statusResponseFile.read())
+
+
+async def set_response(request):
+    if request.match_info["item"] == "item1":
+        return web.Response(status=429, body="Too many requests")
+    return web.Response(status=200)
+
+
+@pytest.fixture
+def mock_server(aiohttp_server):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", var_response)
+    app.router.add_get("/api/v1/var/status", var_status_response)
+    app.router.add_get("/api/v1/var/blinds/{item}/scmd/set", set_response)
+    return aiohttp_server(app)
+
+
+async def create_api(server, session, optimistic_updates):
+    api = MyGekkoApiClientBase(
+        {},
+        session,
+        scheme=server.scheme,
+        host=server.host,
+        port=server.port,
+        optimistic_updates=optimistic_updates,
+    )
+    await api.read_data()
+    return api
+
+
+@pytest.mark.asyncio
+async def test_optimistic_update(mock_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = await create_api(server, session, True)
+        blinds = api.get_blinds()
+        assert blinds[0].position == 100.0
+        assert blinds[0].state == BlindState.STOP
+
+        await blinds[0].set_position(40.0)
+        await blinds[0].set_state(BlindState.DOWN)
+
+        assert blinds[0].position == 40.0
+        assert blinds[0].state == BlindState.DOWN
+
+        # the next poll reconciles the values
+        await api.read_data()
+        assert blinds[0].position == 100.0
+        assert blinds[0].state == BlindState.STOP
+
+
+@pytest.mark.asyncio
+async def test_optimistic_update_rollback(mock_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = await create_api(server, session, True)
+        blinds = api.get_blinds()
+
+        with pytest.raises(MyGekkoTooManyRequests):
+            await blinds[1].set_position(40.0)
+
+        assert blinds[1].position == 100.0
+
+
+@pytest.mark.asyncio
+async def test_no_optimistic_update(mock_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = await create_api(server, session, False)
+        blinds = api.get_blinds()
+
+        await blinds[0].set_position(40.0)
+
+        assert blinds[0].position == 100.0
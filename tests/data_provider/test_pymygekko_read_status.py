@@ -0,0 +1,146 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko import MyGekkoDemoModeClient
+from PyMyGekko.resources.Lights import LightState
+
+
+class RequestCounter:
+    def __init__(self):
+        self.var = 0
+        self.status = 0
+        varResponseFile = open("tests/lights/data/api_var_response_596610.json")
+        self.resources_data = json.load(varResponseFile)
+        statusResponseFile = open(
+            "tests/lights/data/api_var_status_response_596610.json"
+        )
+        self.status_data = json.load(statusResponseFile)
+
+    async def var_response(self, request):
+        self.var += 1
+        return web.json_response(self.resources_data)
+
+    async def var_status_response(self, request):
+        self.status += 1
+        return web.json_response(self.status_data)
+
+
+@pytest.fixture
+def request_counter():
+    return RequestCounter()
+
+
+@pytest.fixture
+def mock_server(aiohttp_server, request_counter):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", request_counter.var_response)
+    app.router.add_get("/api/v1/var/status", request_counter.var_status_response)
+    return aiohttp_server(app)
+
+
+@pytest.mark.asyncio
+async def test_read_status(mock_server, request_counter):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+
+        # the resources are read on the first status read
+        await api.read_status()
+        assert request_counter.var == 1
+        assert request_counter.status == 1
+
+        await api.refresh(resources=False)
+        await api.read_status()
+        assert request_counter.var == 1
+        assert request_counter.status == 3
+
+        await api.refresh()
+        assert request_counter.var == 2
+        assert request_counter.status == 4
+
+        lights = api.get_lights()
+        assert len(lights) == 4
+        assert lights[0].name == "Aussen"
+        assert lights[0].state == LightState.ON
+
+
+@pytest.mark.asyncio
+async def test_read_status_resources_refresh_interval(mock_server, request_counter):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            resources_refresh_interval=0.1,
+        )
+
+        await api.read_status()
+        await api.read_status()
+        assert request_counter.var == 1
+        assert request_counter.status == 2
+
+        await asyncio.sleep(0.1)
+        await api.read_status()
+        assert request_counter.var == 2
+        assert request_counter.status == 3
+
+        # unchanged resources are not read again right away
+        await api.read_status()
+        assert request_counter.var == 2
+        assert request_counter.status == 4
+
+
+@pytest.mark.asyncio
+async def test_read_status_unknown_item(mock_server, request_counter):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            resources_refresh_interval=3600,
+        )
+        await api.read_status()
+        assert len(api.get_lights()) == 4
+
+        # an item added on the gekko shows up in the status first
+        request_counter.status_data["lights"]["item9"] = {
+            "sumstate": {"value": "1;;;;0"}
+        }
+        await api.read_status()
+        assert len(api.get_lights()) == 4
+        assert request_counter.var == 1
+
+        # the resources are read with the next status
+        request_counter.resources_data["lights"]["item9"] = {"name": "Garden"}
+        await api.read_status()
+        assert request_counter.var == 2
+        lights = api.get_lights()
+        assert len(lights) == 5
+        assert lights[4].name == "Garden"
+        assert lights[4].state == LightState.ON
+
+
+@pytest.mark.asyncio
+async def test_read_status_demo_mode():
+    api = MyGekkoDemoModeClient()
+
+    await api.read_status()
+    await api.read_status()
+
+    assert len(api.get_lights()) > 0
@@ -0,0 +1,88 @@
+import pytest
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko import MyGekkoDemoModeClient
+from PyMyGekko.resources.Lights import LightState
+
+
+class RequestRecorder:
+    def __init__(self):
+        self.requested_paths = []
+
+    async def var_response(self, request):
+        self.requested_paths.append(request.path)
+        varResponseFile = open("tests/lights/data/api_var_response_596610.json")
+        return web.Response(status=200, body=varResponseFile.read())
+
+    async def var_status_response(self, request):
+        self.requested_paths.append(request.path)
+        statusResponseFile = open(
+            "tests/lights/data/api_var_status_response_596610.json"
+        )
+        return web.Response(status=200, body=statusResponseFile.read())
+
+    async def light_status_response(self, request):
+        self.requested_paths.append(request.path)
+        return web.json_response({"sumstate": {"value": "0;75.00;;;0"}})
+
+
+@pytest.fixture
+def request_recorder():
+    return RequestRecorder()
+
+
+@pytest.fixture
+def mock_server(aiohttp_server, request_recorder):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", request_recorder.var_response)
+    app.router.add_get("/api/v1/var/status", request_recorder.var_status_response)
+    app.router.add_get(
+        "/api/v1/var/lights/item1/status", request_recorder.light_status_response
+    )
+    return aiohttp_server(app)
+
+
+@pytest.mark.asyncio
+async def test_refresh_entity(mock_server, request_recorder):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+
+        await api.read_data()
+        lights = api.get_lights()
+        assert lights[1].state == LightState.ON
+        assert lights[1].brightness == 50
+
+        request_recorder.requested_paths.clear()
+        await lights[1].refresh()
+
+        assert request_recorder.requested_paths == ["/api/v1/var/lights/item1/status"]
+        assert lights[1].state == LightState.OFF
+        assert lights[1].brightness == 75
+        # the other lights are untouched
+        assert lights[0].state == LightState.ON
+
+        request_recorder.requested_paths.clear()
+        await api.refresh_entity(lights[1])
+
+        assert request_recorder.requested_paths == ["/api/v1/var/lights/item1/status"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_entity_demo_mode():
+    api = MyGekkoDemoModeClient()
+    await api.read_data()
+
+    blinds = api.get_blinds()
+    position = blinds[0].position
+
+    await api.refresh_entity(blinds[0])
+
+    assert blinds[0].position == position
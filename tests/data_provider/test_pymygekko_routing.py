@@ -0,0 +1,60 @@
+import pytest
+from aiohttp import ClientSession
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.data_provider import DataSubscriberInterface
+from PyMyGekko.resources.Lights import LightState
+
+
+class UpdateRecorder(DataSubscriberInterface):
+    def __init__(self):
+        self.status_updates = []
+        self.resources_updates = []
+
+    def update_status(self, status, hardware):
+        self.status_updates.append(status)
+
+    def update_resources(self, resources):
+        self.resources_updates.append(resources)
+
+
+@pytest.mark.asyncio
+async def test_subscribers_get_their_changed_categories(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+        lights = UpdateRecorder()
+        api._data_provider.subscribe(lights, "lights")
+        globals_ = UpdateRecorder()
+        api._data_provider.subscribe(globals_, "globals")
+        blinds = UpdateRecorder()
+        api._data_provider.subscribe(blinds, "blinds")
+
+        await api.read_data()
+
+        assert len(lights.status_updates) == 1
+        assert list(lights.status_updates[0]) == ["lights"]
+        assert list(lights.resources_updates[0]) == ["lights"]
+        assert len(globals_.status_updates) == 1
+        assert list(globals_.status_updates[0]) == ["globals"]
+        assert blinds.status_updates == []
+        assert blinds.resources_updates == []
+
+        status_server.status = status_server.status.replace("1;50.00", "0;50.00")
+        await api.read_status()
+
+        assert len(lights.status_updates) == 2
+        assert len(globals_.status_updates) == 1
+        assert api.get_lights()[1].state == LightState.OFF
+
+        # a write makes sure the next status is routed again
+        await api.get_lights()[1].set_state(LightState.ON)
+        await api.read_status()
+
+        assert len(lights.status_updates) == 3
+        assert len(globals_.status_updates) == 2
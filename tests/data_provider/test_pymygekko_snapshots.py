@@ -0,0 +1,111 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import ClientSession
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko import MyGekkoDemoModeClient
+
+
+@pytest.fixture
+def status_server(status_server):
+    # the tests modify the decoded status
+    status_server.status = json.loads(status_server.status)
+    status_server.entity_status["lights/item1"] = {"sumstate": {"value": "0;75.00;;;0"}}
+    return status_server
+
+
+@pytest.mark.asyncio
+async def test_snapshots(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        )
+        assert api.get_version() == 0
+        assert api.get_snapshot().status is None
+
+        await api.read_data()
+        snapshot = api.get_snapshot()
+        assert snapshot.version == 1
+        assert snapshot.resources["lights"]["item1"]["name"] == "Aussen2"
+        assert snapshot.status["lights"]["item1"]["sumstate"]["value"] == "1;50.00;;;0"
+        with pytest.raises(TypeError):
+            snapshot.status["lights"] = {}
+        with pytest.raises(TypeError):
+            snapshot.status["lights"]["item1"]["sumstate"]["value"] = "0;;;;0"
+
+        # unchanged data publishes no new snapshot
+        await api.read_status()
+        assert api.get_version() == 1
+
+        waiter = asyncio.create_task(api.wait_for_version(2))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        status_server.status["lights"]["item1"]["sumstate"]["value"] = "0;60.00;;;0"
+        await api.read_status()
+        assert (await waiter).version == 2
+
+        # a refreshed entity publishes a copy, the previous snapshot stays as is
+        previous = api.get_snapshot()
+        await api.refresh_entity(api.get_lights()[1])
+        assert api.get_version() == 3
+        assert (
+            api.get_snapshot().status["lights"]["item1"]["sumstate"]["value"]
+            == "0;75.00;;;0"
+        )
+        assert previous.status["lights"]["item1"]["sumstate"]["value"] == "0;60.00;;;0"
+        assert api.get_snapshot().status["lights"]["item0"] == (
+            previous.status["lights"]["item0"]
+        )
+        # the view of the unchanged resources is shared with the previous snapshot
+        assert api.get_snapshot().resources is previous.resources
+
+        # the nested data is only wrapped when it is read
+        snapshot = api.get_snapshot()
+        assert list(snapshot.status._frozen) == ["lights"]
+        api.get_globals_network()
+        assert list(snapshot.status._frozen) == ["lights", "globals"]
+        assert list(snapshot.status["globals"]._frozen) == ["network"]
+
+
+@pytest.mark.asyncio
+async def test_resources_are_published_with_the_status(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            concurrent_read=False,
+        )
+        status_server.release_status.clear()
+        read = asyncio.create_task(api.read_data())
+        await status_server.status_requested.wait()
+
+        # the resources are read, but not visible before the status is read as well
+        assert api.get_snapshot().resources is None
+        assert api.get_lights() == []
+
+        status_server.release_status.set()
+        await read
+        assert api.get_version() == 1
+        assert len(api.get_lights()) == 4
+        assert api.get_lights()[1].brightness == 50
+
+
+@pytest.mark.asyncio
+async def test_demo_mode_snapshots():
+    api = MyGekkoDemoModeClient()
+    await api.read_data()
+    assert api.get_version() == 1
+    assert api.get_snapshot().resources is not None
+    await api.read_status()
+    assert api.get_version() == 2
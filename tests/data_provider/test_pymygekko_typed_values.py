@@ -0,0 +1,32 @@
+import pytest
+from aiohttp import ClientSession
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.resources.Lights import LightState
+
+
+@pytest.mark.asyncio
+async def test_typed_values_follow_changes(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            optimistic_updates=True,
+        )
+        await api.read_data()
+
+        light = api.get_lights()[1]
+        assert light.state == LightState.ON
+        assert light.brightness == 50
+        assert light.state is light.state
+
+        status_server.status = status_server.status.replace("1;50.00", "0;60.00")
+        await api.read_status()
+        assert light.state == LightState.OFF
+        assert light.brightness == 60
+
+        await light.set_brightness(70)
+        assert light.brightness == 70
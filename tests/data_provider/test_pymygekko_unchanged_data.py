@@ -0,0 +1,57 @@
+import pytest
+from aiohttp import ClientSession
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.data_provider import DataSubscriberInterface
+from PyMyGekko.resources.Lights import LightState
+
+
+class UpdateCounter(DataSubscriberInterface):
+    def __init__(self):
+        self.status_updates = 0
+        self.resources_updates = 0
+
+    def update_status(self, status, hardware):
+        self.status_updates += 1
+
+    def update_resources(self, resources):
+        self.resources_updates += 1
+
+
+@pytest.mark.asyncio
+async def test_unchanged_data_is_skipped(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            optimistic_updates=True,
+        )
+        counter = UpdateCounter()
+        api._data_provider.subscribe(counter)
+
+        await api.read_data()
+        await api.read_data()
+        await api.read_status()
+
+        assert counter.resources_updates == 1
+        assert counter.status_updates == 1
+        assert api.get_skipped_updates() == 2
+
+        # a read applying the status is not skipped, even if the resources are
+        status_server.status = status_server.status.replace("1;50.00", "0;50.00")
+        await api.read_data()
+
+        assert counter.status_updates == 2
+        assert api.get_skipped_updates() == 2
+        assert api.get_lights()[1].state == LightState.OFF
+
+        # a write makes sure the optimistic update is reconciled by the next poll
+        await api.get_lights()[1].set_state(LightState.ON)
+        assert api.get_lights()[1].state == LightState.ON
+        await api.read_status()
+
+        assert counter.status_updates == 3
+        assert api.get_lights()[1].state == LightState.OFF
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.data_provider import MyGekkoTooManyRequests
+
+
+class WriteRecorder:
+    def __init__(self):
+        self.writes = []
+
+    async def var_response(self, request):
+        varResponseFile = open("tests/lights/data/api_var_response_596610.json")
+        return web.Response(status=200, body=varResponseFile.read())
+
+    async def var_status_response(self, request):
+        statusResponseFile = open(
+            "tests/lights/data/api_var_status_response_596610.json"
+        )
+        return web.Response(status=200, body=statusResponseFile.read())
+
+    async def set_response(self, request):
+        item = request.match_info["item"]
+        self.writes.append((item, request.query["value"]))
+        if item == "item2":
+            return web.Response(status=429, body="Too many requests")
+        return web.Response(status=200)
+
+
+@pytest.fixture
+def write_recorder():
+    return WriteRecorder()
+
+
+@pytest.fixture
+def mock_server(aiohttp_server, write_recorder):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", write_recorder.var_response)
+    app.router.add_get("/api/v1/var/status", write_recorder.var_status_response)
+    app.router.add_get(
+        "/api/v1/var/lights/{item}/scmd/set", write_recorder.set_response
+    )
+    return aiohttp_server(app)
+
+
+async def create_api(server, session, write_debounce):
+    api = MyGekkoApiClientBase(
+        {},
+        session,
+        scheme=server.scheme,
+        host=server.host,
+        port=server.port,
+        write_debounce=write_debounce,
+    )
+    await api.read_data()
+    return api
+
+
+@pytest.mark.asyncio
+async def test_write_debounce(mock_server, write_recorder):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = await create_api(server, session, 0.05)
+        lights = api.get_lights()
+
+        await asyncio.gather(
+            *[lights[1].set_brightness(brightness) for brightness in range(10, 60)],
+            lights[1].set_state(0),
+            lights[0].set_state(1),
+        )
+
+        assert sorted(write_recorder.writes) == [
+            ("item0", "1"),
+            ("item1", "0"),
+            ("item1", "D59"),
+        ]
+
+        write_recorder.writes.clear()
+        await lights[1].set_brightness(20)
+        assert write_recorder.writes == [("item1", "D20")]
+
+
+@pytest.mark.asyncio
+async def test_write_debounce_error(mock_server, write_recorder):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = await create_api(server, session, 0.05)
+        lights = api.get_lights()
+
+        results = await asyncio.gather(
+            lights[2].set_brightness(10),
+            lights[2].set_brightness(20),
+            return_exceptions=True,
+        )
+
+        assert write_recorder.writes == [("item2", "D20")]
+        assert all(isinstance(result, MyGekkoTooManyRequests) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_no_write_debounce(mock_server, write_recorder):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = await create_api(server, session, None)
+        lights = api.get_lights()
+
+        await lights[1].set_brightness(10)
+        await lights[1].set_brightness(20)
+
+        assert write_recorder.writes == [("item1", "D10"), ("item1", "D20")]
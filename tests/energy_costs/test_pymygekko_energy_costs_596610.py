@@ -2,6 +2,7 @@ import pytest
 from aiohttp import ClientSession
 from aiohttp import web
 from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.resources.EnergyCosts import EnergyCostValue
 
 
 async def var_response(request):
@@ -51,6 +52,10 @@ async def test_get_energy_costs(mock_server):
         assert energy_costs[0].sensor_data["values"][0]["name"] == "actPower"
         assert energy_costs[0].sensor_data["values"][0]["unit"] == "kW"
         assert energy_costs[0].sensor_data["values"][0]["value"] == 0.11
+        assert energy_costs[0].sensor_data["values"][0] == EnergyCostValue(
+            "actPower", "kW", 0.11
+        )
+        assert energy_costs[0].sensor_data["values"][15] is None
 
         assert energy_costs[0].sensor_data["values"][1]["name"] == "energyToday"
         assert energy_costs[0].sensor_data["values"][1]["unit"] == "kWh"
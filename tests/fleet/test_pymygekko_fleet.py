@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.fleet import MyGekkoFleet
+
+
+async def var_response(request):
+    if request.query.get("gekkoid") == "broken":
+        return web.Response(status=500)
+    varResponseFile = open("tests/lights/data/api_var_response_596610.json")
+    return web.Response(status=200, body=varResponseFile.read())
+
+
+async def var_status_response(request):
+    if request.query.get("gekkoid") == "broken":
+        return web.Response(status=500)
+    statusResponseFile = open("tests/lights/data/api_var_status_response_596610.json")
+    return web.Response(status=200, body=statusResponseFile.read())
+
+
+@pytest.fixture
+def mock_server(aiohttp_server):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", var_response)
+    app.router.add_get("/api/v1/var/status", var_status_response)
+    return aiohttp_server(app)
+
+
+def add_gekko(fleet, server, gekko_id):
+    return fleet.add_client(
+        gekko_id,
+        lambda session: MyGekkoApiClientBase(
+            {"gekkoid": gekko_id},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_fleet(mock_server):
+    server = await mock_server
+    fleet = MyGekkoFleet(limit=10, limit_per_host=5)
+    with pytest.raises(RuntimeError):
+        add_gekko(fleet, server, "gekko0")
+
+    async with fleet:
+        assert fleet.session.connector.limit == 10
+        assert fleet.session.connector.limit_per_host == 5
+
+        for gekko_id in ["gekko0", "gekko1", "broken"]:
+            add_gekko(fleet, server, gekko_id)
+        with pytest.raises(ValueError):
+            add_gekko(fleet, server, "gekko0")
+
+        errors = await fleet.read_data()
+        assert list(errors) == ["broken"]
+        # the reads of the fleet count as polls as well
+        stats = fleet.get_stats()
+        assert stats["gekko0"].polls == 1
+        assert stats["gekko0"].last_duration > 0
+        assert stats["broken"].error_rate == 1.0
+
+        lights = fleet.get_lights()
+        assert [len(gekko_lights) for gekko_lights in lights.values()] == [4, 4, 0]
+        assert lights["gekko0"][0] is fleet.clients["gekko0"].get_lights()[0]
+
+        fleet.start_polling(interval=0.01, fast_interval=0.01, jitter=0.05)
+        await asyncio.sleep(0.2)
+        stats = fleet.get_stats()
+        assert stats["gekko0"].polls > 0
+        assert stats["gekko0"].error_rate == 0.0
+        assert stats["gekko0"].mean_duration > 0
+        # the status served never changes, so the polls are not decoded again
+        assert stats["gekko0"].skipped_updates > 0
+        assert stats["broken"].error_rate == 1.0
+
+        await fleet.remove("broken")
+        assert list(fleet.get_stats()) == ["gekko0", "gekko1"]
+        session = fleet.session
+
+    assert session.closed
+    assert fleet.get_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_fleet_with_session(mock_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        with pytest.raises(ValueError):
+            MyGekkoFleet(limit=10, session=session)
+
+        async with MyGekkoFleet(session=session) as fleet:
+            add_gekko(fleet, server, "gekko0")
+            assert await fleet.read_status() == {}
+            assert fleet.get_stats()["gekko0"].polls == 1
+        assert not session.closed
@@ -0,0 +1,78 @@
+import pytest
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.json_backend import get_json_loads
+from PyMyGekko.json_backend import JSON_BACKENDS
+
+
+async def var_response(request):
+    varResponseFile = open("tests/lights/data/api_var_response_596610.json")
+    return web.Response(status=200, body=varResponseFile.read())
+
+
+async def var_status_response(request):
+    statusResponseFile = open("tests/lights/data/api_var_status_response_596610.json")
+    return web.Response(status=200, body=statusResponseFile.read())
+
+
+@pytest.fixture
+def mock_server(aiohttp_server):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", var_response)
+    app.router.add_get("/api/v1/var/status", var_status_response)
+    return aiohttp_server(app)
+
+
+def installed_backends():
+    backends = []
+    for name in JSON_BACKENDS:
+        try:
+            get_json_loads(name)
+        except ImportError:
+            continue
+        backends.append(name)
+    return backends
+
+
+@pytest.mark.parametrize("backend", installed_backends())
+def test_json_backend(backend):
+    loads = get_json_loads(backend)
+
+    assert loads(b'{"lights": {"item0": {"sumstate": {"value": "1;;"}}}}') == {
+        "lights": {"item0": {"sumstate": {"value": "1;;"}}}
+    }
+
+    with pytest.raises(ValueError):
+        loads(b'{"lights": ')
+
+
+def test_unknown_json_backend():
+    with pytest.raises(ValueError):
+        get_json_loads("unknown")
+
+
+@pytest.mark.asyncio
+async def test_custom_json_loads(mock_server):
+    server = await mock_server
+    decoded = []
+    json_loads = get_json_loads("json")
+
+    def loads(data):
+        decoded.append(data)
+        return json_loads(data)
+
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            json_loads=loads,
+        )
+        await api.read_data()
+
+        assert len(decoded) == 2
+        assert isinstance(decoded[0], bytes)
+        assert len(api.get_lights()) == 4
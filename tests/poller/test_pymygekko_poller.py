@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientSession
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.resources.Lights import LightState
+from PyMyGekko.retry import RetryPolicy
+
+
+def create_api(server, session):
+    return MyGekkoApiClientBase(
+        {},
+        session,
+        scheme=server.scheme,
+        host=server.host,
+        port=server.port,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+
+
+@pytest.mark.asyncio
+async def test_polls_do_not_overlap(mock_server, status_server):
+    server = await mock_server
+    status_server.delay = 0.05
+    async with ClientSession() as session:
+        api = create_api(server, session)
+
+        async with api.start_polling(interval=0.01, fast_interval=0.01) as poller:
+            await asyncio.sleep(0.3)
+
+        assert not poller.running
+        assert status_server.max_running == 1
+        assert poller.polls >= 2
+        assert poller.overruns == poller.polls
+        assert poller.last_duration >= 0.05
+        assert poller.errors == 0
+
+
+@pytest.mark.asyncio
+async def test_write_switches_to_fast_interval(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = create_api(server, session)
+
+        async with api.start_polling(
+            interval=10, fast_interval=0.05, fast_window=10
+        ) as poller:
+            await asyncio.sleep(0.1)
+            assert poller.polls == 1
+            assert poller.interval == 10
+
+            await api.get_lights()[1].set_state(LightState.OFF)
+            assert poller.interval == 0.05
+            await asyncio.sleep(0.3)
+            assert poller.polls >= 3
+
+
+@pytest.mark.asyncio
+async def test_idle_interval(mock_server, status_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = create_api(server, session)
+
+        async with api.start_polling(
+            interval=0.05, idle_interval=10, idle_after=0.1
+        ) as poller:
+            await asyncio.sleep(0.3)
+            assert poller.interval == 10
+            polls = poller.polls
+            await asyncio.sleep(0.1)
+            assert poller.polls == polls
+
+
+@pytest.mark.asyncio
+async def test_backoff_on_too_many_requests(mock_server, status_server):
+    server = await mock_server
+    status_server.status_status = 429
+    async with ClientSession() as session:
+        api = create_api(server, session)
+
+        async with api.start_polling(interval=0.01, max_backoff=0.04) as poller:
+            await asyncio.sleep(0.2)
+            assert poller.errors >= 2
+            assert poller.interval == 0.04
+
+            status_server.status_status = 200
+            await asyncio.sleep(0.1)
+            assert poller.interval == 0.01
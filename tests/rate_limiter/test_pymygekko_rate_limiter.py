@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.rate_limiter import RequestPriority
+from PyMyGekko.rate_limiter import TokenBucketRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_burst_and_rate():
+    rate_limiter = TokenBucketRateLimiter(rate=20, burst=2)
+
+    start = time.monotonic()
+    await rate_limiter.acquire()
+    await rate_limiter.acquire()
+    assert time.monotonic() - start < 0.02
+
+    await rate_limiter.acquire()
+    await rate_limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_priority():
+    rate_limiter = TokenBucketRateLimiter(rate=50, burst=1)
+    order = []
+
+    async def request(name, priority):
+        await rate_limiter.acquire(priority)
+        order.append(name)
+
+    await rate_limiter.acquire()
+    tasks = [
+        asyncio.create_task(request("read1", RequestPriority.READ)),
+        asyncio.create_task(request("read2", RequestPriority.READ)),
+        asyncio.create_task(request("write", RequestPriority.WRITE)),
+    ]
+    await asyncio.sleep(0)
+    assert rate_limiter.queue_depth == 3
+
+    await asyncio.gather(*tasks)
+
+    assert order == ["write", "read1", "read2"]
+    assert rate_limiter.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_cancelled_request():
+    rate_limiter = TokenBucketRateLimiter(rate=50, burst=1)
+    await rate_limiter.acquire()
+
+    task = asyncio.create_task(rate_limiter.acquire())
+    await asyncio.sleep(0)
+    assert rate_limiter.queue_depth == 1
+
+    task.cancel()
+    await asyncio.sleep(0)
+    assert rate_limiter.queue_depth == 0
+
+    await rate_limiter.acquire()
+
+
+def test_rate_limiter_invalid_parameters():
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=1, burst=0)
+
+
+class RequestRecorder:
+    def __init__(self):
+        self.requests = []
+
+    async def var_response(self, request):
+        self.requests.append("var")
+        varResponseFile = open("tests/lights/data/api_var_response_596610.json")
+        return web.Response(status=200, body=varResponseFile.read())
+
+    async def var_status_response(self, request):
+        self.requests.append("status")
+        statusResponseFile = open(
+            "tests/lights/data/api_var_status_response_596610.json"
+        )
+        return web.Response(status=200, body=statusResponseFile.read())
+
+    async def set_response(self, request):
+        self.requests.append("set")
+        return web.Response(status=200)
+
+
+@pytest.fixture
+def request_recorder():
+    return RequestRecorder()
+
+
+@pytest.fixture
+def mock_server(aiohttp_server, request_recorder):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", request_recorder.var_response)
+    app.router.add_get("/api/v1/var/status", request_recorder.var_status_response)
+    app.router.add_get(
+        "/api/v1/var/lights/{item}/scmd/set", request_recorder.set_response
+    )
+    return aiohttp_server(app)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_client(mock_server, request_recorder):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = MyGekkoApiClientBase(
+            {},
+            session,
+            scheme=server.scheme,
+            host=server.host,
+            port=server.port,
+            rate_limiter=TokenBucketRateLimiter(rate=10, burst=1),
+        )
+
+        await api.read_data()
+        lights = api.get_lights()
+        request_recorder.requests.clear()
+        await asyncio.sleep(0.1)
+
+        # the write is queued after the status read of the poll but sent before it
+        poll = asyncio.create_task(api.read_data())
+        await asyncio.sleep(0.01)
+        write = asyncio.create_task(lights[0].set_state(0))
+        await asyncio.sleep(0.01)
+        assert api.get_request_queue_depth() == 2
+
+        await asyncio.gather(poll, write)
+
+        assert request_recorder.requests == ["var", "set", "status"]
+        assert api.get_request_queue_depth() == 0
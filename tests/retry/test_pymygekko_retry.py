@@ -0,0 +1,176 @@
+import time
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp import web
+from PyMyGekko import MyGekkoApiClientBase
+from PyMyGekko.data_provider import MyGekkoNoResponse
+from PyMyGekko.data_provider import MyGekkoTooManyRequests
+from PyMyGekko.resources.AccessDoors import AccessDoorCommand
+from PyMyGekko.retry import RetryPolicy
+
+
+class FlakyServer:
+    def __init__(self):
+        self.failures = []
+        self.retry_after = None
+        self.status_requests = 0
+        self.set_requests = 0
+
+    def failure(self):
+        if self.failures:
+            status = self.failures.pop(0)
+            headers = {"Retry-After": self.retry_after} if self.retry_after else {}
+            return web.Response(status=status, body="Error", headers=headers)
+        return None
+
+    async def var_response(self, request):
+        varResponseFile = open("tests/access_doors/data/api_var_response_879015.json")
+        return web.Response(status=200, body=varResponseFile.read())
+
+    async def var_status_response(self, request):
+        self.status_requests += 1
+        failure = self.failure()
+        if failure is not None:
+            return failure
+        statusResponseFile = open(
+            "tests/access_doors/data/api_var_status_response_879015.json"
+        )
+        return web.Response(status=200, body=statusResponseFile.read())
+
+    async def set_response(self, request):
+        self.set_requests += 1
+        failure = self.failure()
+        if failure is not None:
+            return failure
+        return web.Response(status=200)
+
+
+@pytest.fixture
+def flaky_server():
+    return FlakyServer()
+
+
+@pytest.fixture
+def mock_server(aiohttp_server, flaky_server):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", flaky_server.var_response)
+    app.router.add_get("/api/v1/var/status", flaky_server.var_status_response)
+    app.router.add_get(
+        "/api/v1/var/accessdoors/{item}/scmd/set", flaky_server.set_response
+    )
+    return aiohttp_server(app)
+
+
+def create_api(server, session, retry_policy):
+    return MyGekkoApiClientBase(
+        {},
+        session,
+        scheme=server.scheme,
+        host=server.host,
+        port=server.port,
+        retry_policy=retry_policy,
+    )
+
+
+@pytest.mark.asyncio
+async def test_retry_read(mock_server, flaky_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = create_api(server, session, RetryPolicy(base_delay=0.01))
+
+        flaky_server.failures = [429, 444]
+        await api.read_data()
+
+        assert flaky_server.status_requests == 3
+        assert len(api.get_access_doors()) > 0
+
+
+@pytest.mark.asyncio
+async def test_retry_read_exhausted(mock_server, flaky_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = create_api(server, session, RetryPolicy(base_delay=0.01))
+
+        flaky_server.failures = [503, 503, 444]
+        with pytest.raises(MyGekkoNoResponse):
+            await api.read_data()
+
+        assert flaky_server.status_requests == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_after(mock_server, flaky_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = create_api(server, session, RetryPolicy(base_delay=0.01))
+
+        flaky_server.failures = [429]
+        flaky_server.retry_after = "0.2"
+        start = time.monotonic()
+        await api.read_data()
+
+        assert time.monotonic() - start >= 0.2
+        assert flaky_server.status_requests == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_deadline(mock_server, flaky_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = create_api(server, session, RetryPolicy(deadline=0.1))
+
+        flaky_server.failures = [429]
+        flaky_server.retry_after = "1"
+        with pytest.raises(MyGekkoTooManyRequests):
+            await api.read_data()
+
+        assert flaky_server.status_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_no_retry_policy(mock_server, flaky_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = create_api(server, session, None)
+
+        flaky_server.failures = [429]
+        with pytest.raises(MyGekkoTooManyRequests):
+            await api.read_data()
+
+        assert flaky_server.status_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_write(mock_server, flaky_server):
+    server = await mock_server
+    async with ClientSession() as session:
+        api = create_api(server, session, RetryPolicy(base_delay=0.01))
+        await api.read_data()
+        door = api.get_access_doors()[0]
+
+        flaky_server.failures = [429]
+        await api._data_provider.write_data(door.resource_path, "1")
+        assert flaky_server.set_requests == 2
+
+        # opening a door is not idempotent and is never repeated
+        flaky_server.set_requests = 0
+        flaky_server.failures = [429]
+        with pytest.raises(MyGekkoTooManyRequests):
+            await door.set_state(AccessDoorCommand.OPEN)
+        assert flaky_server.set_requests == 1
+
+
+def test_retry_policy_delay():
+    retry_policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+    for retry in range(10):
+        assert 0 <= retry_policy.get_delay(retry) <= min(5.0, 2**retry)
+
+    assert retry_policy.get_delay(0, "3") == 3.0
+    assert retry_policy.get_delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    assert retry_policy.should_retry(429)
+    assert retry_policy.should_retry(444)
+    assert retry_policy.should_retry(503)
+    assert not retry_policy.should_retry(403)
@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from PyMyGekko.sharded_fleet import ShardedFleet
+
+
+async def var_response(request):
+    varResponseFile = open("tests/lights/data/api_var_response_596610.json")
+    return web.Response(status=200, body=varResponseFile.read())
+
+
+async def var_status_response(request):
+    if request.query.get("gekkoid") == "broken":
+        return web.Response(status=500)
+    statusResponseFile = open("tests/lights/data/api_var_status_response_596610.json")
+    return web.Response(status=200, body=statusResponseFile.read())
+
+
+@pytest.fixture
+def mock_server(aiohttp_server):
+    app = web.Application()
+    app.router.add_get("/api/v1/var", var_response)
+    app.router.add_get("/api/v1/var/status", var_status_response)
+    return aiohttp_server(app)
+
+
+@pytest.mark.asyncio
+async def test_sharded_fleet(mock_server):
+    server = await mock_server
+    gekkos = [
+        ("gekko0", "user", "key"),
+        ("gekko1", "user", "key"),
+        ("broken", "user", "key"),
+    ]
+    fleet = ShardedFleet(
+        gekkos,
+        processes=2,
+        flush_interval=0.05,
+        client_kwargs={
+            "scheme": server.scheme,
+            "host": server.host,
+            "port": server.port,
+        },
+        polling_kwargs={"interval": 0.05, "fast_interval": 0.05},
+    )
+    assert fleet.processes == 2
+
+    changes = []
+    fleet.on_change(lambda gekko_id, change: changes.append((gekko_id, change)))
+    async with fleet:
+        deadline = time.monotonic() + 30
+        while len(fleet.get_stats()) < 3 or not all(
+            stats.polls for stats in fleet.get_stats().values()
+        ):
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.05)
+
+    values = fleet.get_values()
+    assert values["gekko0"]["lights"]["item1"] == {
+        "name": "Aussen2",
+        "currentState": "1",
+        "dimLevel": "50.00",
+        "rgbColor": "",
+        "tunableWhiteLevel": "",
+        "elementInfo": "0",
+    }
+    assert values["gekko1"]["lights"] == values["gekko0"]["lights"]
+    # nothing of a read is applied if its status can not be read
+    assert values["broken"] == {}
+
+    stats = fleet.get_stats()
+    assert stats["gekko0"].error_rate == 0.0
+    assert stats["broken"].error_rate == 1.0
+    assert fleet.get_received_changes() == len(changes) == 8
+
+
+@pytest.mark.asyncio
+async def test_sharded_fleet_failures(mock_server):
+    server = await mock_server
+    fleet = ShardedFleet(
+        [("gekko0", "user", "key"), ("gekko1", "user", "key")],
+        processes=2,
+        flush_interval=0.05,
+        client_kwargs={
+            "scheme": server.scheme,
+            "host": server.host,
+            "port": server.port,
+        },
+        polling_kwargs={"interval": 0.05},
+    )
+    async with fleet:
+        deadline = time.monotonic() + 30
+        while len(fleet.get_stats()) < 2:
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.05)
+        assert fleet.get_errors() == {}
+
+        fleet._processes[1].kill()
+        while not fleet.get_errors():
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.05)
+        assert fleet.get_errors() == {"gekko1": "exited with code -9"}
+
+    # an exception in a shard process is sent to the coordinator
+    fleet = ShardedFleet(
+        [("gekko0", "user", "key")],
+        processes=1,
+        flush_interval=0.05,
+        client_kwargs={"unknown": True},
+    )
+    async with fleet:
+        deadline = time.monotonic() + 30
+        while not fleet.get_errors():
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.05)
+        assert "TypeError" in fleet.get_errors()["gekko0"]
+    assert fleet.get_errors() == {"gekko0": fleet.get_errors()["gekko0"]}
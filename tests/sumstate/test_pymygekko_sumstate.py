@@ -0,0 +1,56 @@
+from PyMyGekko.sumstate import decode_sumstates
+from PyMyGekko.sumstate import get_decoder
+from PyMyGekko.sumstate import get_hardware
+from PyMyGekko.sumstate import register_schema
+from PyMyGekko.sumstate import SUMSTATE_SCHEMAS
+
+
+def test_decoders_depend_on_hardware():
+    assert get_decoder("actions", "legacy")("1;0") == {
+        "currentState": "1",
+        "elementInfo": "0",
+    }
+    assert get_decoder("actions", "Slide 2 (AC0DFE300913)")("1;2;0;") == {
+        "currentState": "1",
+        "startConditionState": "2",
+        "elementInfo": "0",
+    }
+
+
+def test_group_decoder():
+    assert get_decoder("lights", "legacy", "group")("1;;;") == {"currentState": "1"}
+
+
+def test_register_schema():
+    try:
+        register_schema("loads", ("currentState",), "Nova")
+        assert get_decoder("loads", "Nova")("1;0") == {"currentState": "1"}
+        assert get_decoder("loads", "legacy")("1;0") == {
+            "currentState": "1",
+            "elementInfo": "0",
+        }
+    finally:
+        del SUMSTATE_SCHEMAS[("loads", "Nova", "item")]
+        get_decoder.cache_clear()
+
+
+def test_decode_sumstates():
+    status = {
+        "globals": {"network": {"hardware": {"value": "Nova"}}},
+        "lights": {
+            "item0": {"sumstate": {"value": "1;50.00;;;0"}},
+            "item1": {"sumstate": {"value": "1;50.00;;;0"}},
+            "group0": {"sumstate": {"value": "0;;;"}},
+        },
+        "meteo": {"twilight": {"value": "1.0"}},
+    }
+    assert get_hardware(status) == "Nova"
+    assert get_hardware({"lights": {}}) == "legacy"
+
+    # items with the same value share the decoded fields
+    assert decode_sumstates(status, "Nova") == {
+        ("lights", "Nova", "item"): {
+            "1;50.00;;;0": get_decoder("lights", "Nova")("1;50.00;;;0")
+        },
+        ("lights", "Nova", "group"): {"0;;;": {"currentState": "0"}},
+    }
@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+from PyMyGekko import MyGekkoDemoModeClient
+from PyMyGekko.resources.Lights import LightState
+from PyMyGekko.sync_client import MyGekkoSyncClient
+
+
+def create_demo_client(session):
+    return MyGekkoDemoModeClient(optimistic_updates=True)
+
+
+def test_sync_client():
+    with MyGekkoSyncClient(create_demo_client) as client:
+        assert client.version == 0
+        client.read_data()
+        assert client.version == 1
+        assert client.snapshot.resources is not None
+
+        lights = client.run(client.client.get_lights)
+        assert len(lights) > 0
+        client.set_value(lights[0], "state", LightState.OFF)
+        assert client.get_value(lights[0], "state") == LightState.OFF
+        client.run(lights[0].set_state, LightState.ON)
+        assert client.get_value(lights[0], "state") == LightState.ON
+        with pytest.raises(AttributeError):
+            client.set_value(lights[0], "unknown", 1)
+
+        with pytest.raises(ValueError):
+            client.run(client.client.on_change, "unknown", print)
+
+    assert not client._thread.is_alive()
+    assert client._session.closed
+
+
+def test_sync_client_readers():
+    with MyGekkoSyncClient(create_demo_client) as client:
+        snapshots = []
+
+        def reader():
+            snapshots.append(client.wait_for_version(3, timeout=10))
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+
+        client.read_data()
+        client.read_status()
+        client.read_status()
+        for thread in threads:
+            thread.join()
+
+        assert [snapshot.version for snapshot in snapshots] == [3, 3, 3, 3]
+        assert client.wait_for_version(1) is client.snapshot
+
+        with pytest.raises(TimeoutError):
+            client.wait_for_version(4, timeout=0.01)
+
+
+def test_sync_client_polling():
+    with MyGekkoSyncClient(create_demo_client) as client:
+        client.start_polling(interval=0.01, fast_interval=0.01)
+        assert client.wait_for_version(2, timeout=10).version >= 2
+        client.stop_polling()
+        assert client._poller is None